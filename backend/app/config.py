@@ -1,35 +1,71 @@
 """Application configuration."""
 
+import functools
+import ipaddress
 import os
 import logging
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables (check project root .env first, then backend/.env)
-load_dotenv(Path(__file__).resolve().parent.parent.parent / ".env")
-load_dotenv()
-
-# Base paths
-BASE_DIR = Path(__file__).resolve().parent.parent
+# Base paths (resolved once; every other path derives from these)
+_HERE = Path(__file__).resolve()
+BASE_DIR = _HERE.parent.parent
 FONTS_DIR = BASE_DIR / "fonts"
 OUTPUT_DIR = BASE_DIR / "output"
 
-# Ensure output directory exists
-try:
-    OUTPUT_DIR.mkdir(exist_ok=True)
-except PermissionError:
-    logger.warning(
-        f"Permission denied creating output directory {OUTPUT_DIR}. Falling back to /tmp/lucid_output"
-    )
-    # Fall back to temporary directory
-    OUTPUT_DIR = Path("/tmp/lucid_output")
+# Candidate .env files, highest precedence first (project root, then backend/)
+_ENV_FILES = (
+    BASE_DIR.parent / ".env",
+    BASE_DIR / ".env",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_files() -> dict[str, str]:
+    """Parse the candidate .env files once and merge them (root wins)."""
+    merged: dict[str, str] = {}
+    for path in reversed(_ENV_FILES):
+        if path.is_file():
+            merged.update(
+                {k: v for k, v in dotenv_values(path).items() if v is not None}
+            )
+    return merged
+
+
+# Load environment variables without overriding values already set
+for _key, _value in _load_env_files().items():
+    os.environ.setdefault(_key, _value)
+
+_FALLBACK_OUTPUT_DIR = Path("/tmp/lucid_output")
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create *path* unless it already exists (a stat is cheaper than mkdir)."""
+    if not os.path.isdir(path):
+        path.mkdir(exist_ok=True)
+
+
+def _resolve_output_dir(primary: Path, fallback: Path) -> Path:
+    """Return a usable output directory, falling back to *fallback* if needed."""
+    try:
+        _ensure_dir(primary)
+        return primary
+    except PermissionError:
+        logger.warning(
+            f"Permission denied creating output directory {primary}. Falling back to {fallback}"
+        )
     try:
-        OUTPUT_DIR.mkdir(exist_ok=True)
+        _ensure_dir(fallback)
     except Exception as e:
-        logger.error(f"Failed to create fallback output directory {OUTPUT_DIR}: {e}")
+        logger.error(f"Failed to create fallback output directory {fallback}: {e}")
         raise
+    return fallback
+
+
+# Ensure output directory exists
+OUTPUT_DIR = _resolve_output_dir(OUTPUT_DIR, _FALLBACK_OUTPUT_DIR)
 
 # API Keys
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
@@ -43,5 +79,31 @@ IMAGE_ASPECT_RATIO = "4:5"
 GEMINI_TEXT_MODEL = os.getenv("GEMINI_TEXT_MODEL", "gemini-2.5-flash")
 GEMINI_IMAGE_MODEL = os.getenv("GEMINI_IMAGE_MODEL", "gemini-2.5-flash-image")
 
+# Process-wide cap on in-flight Gemini requests (text and image). Per-request
+# ``concurrency_limit`` values still apply underneath it; this bound stops
+# several concurrent generations from stacking up into a 429 storm.
+GEMINI_MAX_CONCURRENCY = max(1, int(os.getenv("GEMINI_MAX_CONCURRENCY", "16")))
+
+# Optional requests-per-minute budget for Gemini (0 disables pacing). Set it
+# to the key's tier quota to pace large batches instead of hitting 429s.
+GEMINI_MAX_RPM = max(0, int(os.getenv("GEMINI_MAX_RPM", "0")))
+
+# Per-client cap on concurrently running batch generations (/generate,
+# /regenerate-all). Extra calls get an immediate 429 instead of queueing behind
+# the Gemini cap above. 0 disables the check.
+GENERATION_MAX_IN_FLIGHT_PER_IP = max(
+    0, int(os.getenv("GENERATION_MAX_IN_FLIGHT_PER_IP", "2"))
+)
+
+# Peers (IPs or CIDRs, comma-separated) allowed to report the client address
+# via X-Forwarded-For, e.g. the frontend's dev-server proxy. Empty trusts no
+# one, so per-IP limits key on the TCP peer; behind a proxy that makes every
+# client share the proxy's key.
+TRUSTED_PROXIES = tuple(
+    ipaddress.ip_network(entry.strip(), strict=False)
+    for entry in os.getenv("TRUSTED_PROXIES", "").split(",")
+    if entry.strip()
+)
+
 # Logging
 LOG_FILE = BASE_DIR / "lucid.log"
@@ -2,7 +2,9 @@
 
 import os
 from pathlib import Path
+from typing import AsyncIterator
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -10,12 +12,28 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 # Default DB path: /app/data/lucid.db (inside Docker named volume)
 # For tests, override with LUCID_DB_URL environment variable.
 _default_db_path = Path("/app/data/lucid.db")
 _db_url = os.getenv("LUCID_DB_URL", f"sqlite+aiosqlite:///{_default_db_path}")
 
+# Connection pool sizing — long-lived connections keep SQLite's page cache warm.
+POOL_SIZE = 5
+_MAX_OVERFLOW = 10
+_POOL_RECYCLE_SECONDS = 1800
+
+# Applied once to every new DBAPI connection as it enters the pool.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_SELECT_ONE = text("SELECT 1")
+
 
 class Base(DeclarativeBase):
     """Declarative base for all ORM models."""
@@ -23,13 +41,47 @@ class Base(DeclarativeBase):
     pass
 
 
+def _is_memory_db(db_url: str) -> bool:
+    """Return True if *db_url* points at an in-memory SQLite database."""
+    return db_url.rstrip("/").endswith(":memory:") or db_url.endswith("://")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure a freshly opened SQLite connection (WAL, cache sizing)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 def create_engine(db_url: str = _db_url) -> AsyncEngine:
-    """Create and return the async SQLAlchemy engine."""
-    return create_async_engine(
-        db_url,
-        connect_args={"check_same_thread": False},
-        echo=False,
-    )
+    """Create and return the async SQLAlchemy engine.
+
+    File-backed databases use a queue pool of long-lived connections so
+    repeated reads hit SQLite's in-memory page cache instead of reopening
+    the file. In-memory databases share a single static connection.
+    """
+    if _is_memory_db(db_url):
+        eng = create_async_engine(
+            db_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            echo=False,
+        )
+    else:
+        eng = create_async_engine(
+            db_url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=POOL_SIZE,
+            max_overflow=_MAX_OVERFLOW,
+            pool_recycle=_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=True,
+            echo=False,
+        )
+        event.listen(eng.sync_engine, "connect", _set_sqlite_pragmas)
+    return eng
 
 
 # Module-level engine and session factory (overridable in tests)
@@ -39,16 +91,59 @@ async_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
 )
 
 
-async def get_db() -> AsyncSession:
+# Read-only paths share the same pool but run in autocommit mode, so plain
+# SELECTs never emit BEGIN/COMMIT. WAL gives each statement a consistent
+# snapshot without blocking the writer.
+readonly_engine: AsyncEngine = engine.execution_options(isolation_level="AUTOCOMMIT")
+readonly_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    readonly_engine, expire_on_commit=False
+)
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
     """FastAPI dependency: yield an async DB session."""
     async with async_session_factory() as session:
         yield session
 
 
+async def get_db_readonly() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency: yield an autocommit session for SELECT-only work."""
+    async with readonly_session_factory() as session:
+        yield session
+
+
+async def warm_pool(eng: AsyncEngine | None = None, size: int = POOL_SIZE) -> None:
+    """Open *size* pooled connections up front so first requests skip connect."""
+    target = eng or engine
+    conns = []
+    try:
+        for _ in range(size):
+            conn = await target.connect()
+            conns.append(conn)
+            await conn.execute(_SELECT_ONE)
+    finally:
+        for conn in conns:
+            await conn.close()
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    """Create indexes added after a table was first created.
+
+    ``create_all`` only emits CREATE INDEX alongside CREATE TABLE, so tables
+    that already exist on disk would otherwise never receive new indexes.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def init_db(eng: AsyncEngine | None = None) -> None:
-    """Create all tables if they don't exist."""
-    from app.db import models as _  # noqa: F401 — ensure models are registered
+    """Create all tables and indexes if they don't exist."""
+    # Imported here because models.py needs ``Base`` from this module; the
+    # import registers every table on ``Base.metadata``.
+    from app.db import models  # noqa: F401
 
     target = eng or engine
     async with target.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
@@ -3,24 +3,58 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+import orjson
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.types import JSON
+from sqlalchemy.types import TypeDecorator
 
 from app.db.database import Base
 
 
+class JSONText(str):
+    """A value that is already serialised JSON; ``FastJSON`` stores it verbatim.
+
+    Lets callers hand over ``model_dump_json()`` output directly instead of
+    building a dict only for it to be re-encoded.
+    """
+
+
+class FastJSON(TypeDecorator):
+    """JSON column serialised with orjson, stored as TEXT.
+
+    On-disk format is identical to SQLAlchemy's ``JSON`` type on SQLite, so
+    existing rows load unchanged — only the (de)serialisation is faster.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> str | None:
+        if value is None:
+            return None
+        if isinstance(value, JSONText):
+            return value
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value: str | bytes | None, dialect: Any) -> Any:
+        if value is None:
+            return None
+        return orjson.loads(value)
+
+
 class ProjectDB(Base):
     """Persisted project row."""
 
     __tablename__ = "projects"
+    # list_projects orders by updated_at DESC
+    __table_args__ = (Index("ix_projects_updated_at", "updated_at"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     slide_count: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
     current_stage: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
-    project_config: Mapped[Any] = mapped_column(JSON, nullable=False)
-    state: Mapped[Any] = mapped_column(JSON, nullable=False)
+    project_config: Mapped[Any] = mapped_column(FastJSON, nullable=False)
+    state: Mapped[Any] = mapped_column(FastJSON, nullable=False)
     thumbnail_b64: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -30,13 +64,15 @@ class TemplateDB(Base):
     """Persisted template row."""
 
     __tablename__ = "templates"
+    # list_templates orders by name
+    __table_args__ = (Index("ix_templates_name", "name"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     default_slide_count: Mapped[int] = mapped_column(
         Integer, nullable=False, default=5
     )
-    config: Mapped[Any] = mapped_column(JSON, nullable=False)
+    config: Mapped[Any] = mapped_column(FastJSON, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
 
@@ -47,6 +83,7 @@ class MatrixProjectDB(Base):
     """One concept matrix project."""
 
     __tablename__ = "matrix_projects"
+    __table_args__ = (Index("ix_matrix_projects_updated_at", "updated_at"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -74,6 +111,8 @@ class MatrixCellDB(Base):
     """One cell (row, col) in a concept matrix."""
 
     __tablename__ = "matrix_cells"
+    # Cells are always fetched per project, ordered by (row, col)
+    __table_args__ = (Index("ix_matrix_cells_project_pos", "project_id", "row", "col"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     project_id: Mapped[str] = mapped_column(
@@ -1,5 +1,10 @@
 """Dependency injection container for Lucid services."""
 
+from functools import cached_property
+from typing import Annotated, Awaitable, Callable, TypeVar
+
+from fastapi import Depends
+
 from app.services.project_manager import (
     ProjectManager,
     project_manager as _project_manager,
@@ -28,36 +33,76 @@ from app.services.matrix_generator import MatrixGenerator
 from app.services.matrix_service import MatrixService
 from app.services.matrix_settings_manager import MatrixSettingsManager
 
+T = TypeVar("T")
+
 
 class ServiceContainer:
-    """Container for managing service instances."""
-
-    def __init__(self) -> None:
-        # Core services
-        self.project_manager = _project_manager
-        self.template_manager = _template_manager
-        self.config_manager = ConfigManager()
-        self.gemini_service = GeminiService()
-        self.image_service = ImageService()
-        self.storage_service = StorageService()
-        self.font_manager = FontManager()
-        self.prompt_validator = PromptValidator()
-        self.prompt_loader = PromptLoader()
-
-        # Stage services
-        self.stage_research = StageResearchService(
+    """Container for managing service instances.
+
+    Each service is built on first access and cached for the life of the
+    container, so importing the app (or serving ``/health``) does not pay
+    for Gemini client setup, font discovery, or prompt loading. Services
+    that depend on each other resolve through the same cached attributes,
+    keeping shared dependencies singletons.
+    """
+
+    # Core services
+    @cached_property
+    def project_manager(self) -> ProjectManager:
+        return _project_manager
+
+    @cached_property
+    def template_manager(self) -> TemplateManager:
+        return _template_manager
+
+    @cached_property
+    def config_manager(self) -> ConfigManager:
+        return ConfigManager()
+
+    @cached_property
+    def gemini_service(self) -> GeminiService:
+        return GeminiService()
+
+    @cached_property
+    def image_service(self) -> ImageService:
+        return ImageService()
+
+    @cached_property
+    def storage_service(self) -> StorageService:
+        return StorageService()
+
+    @cached_property
+    def font_manager(self) -> FontManager:
+        return FontManager()
+
+    @cached_property
+    def prompt_validator(self) -> PromptValidator:
+        return PromptValidator()
+
+    @cached_property
+    def prompt_loader(self) -> PromptLoader:
+        return PromptLoader()
+
+    # Stage services
+    @cached_property
+    def stage_research(self) -> StageResearchService:
+        return StageResearchService(
             project_manager=self.project_manager,
             gemini_service=self.gemini_service,
             prompt_loader=self.prompt_loader,
         )
 
-        self.stage_draft = StageDraftService(
+    @cached_property
+    def stage_draft(self) -> StageDraftService:
+        return StageDraftService(
             project_manager=self.project_manager,
             gemini_service=self.gemini_service,
             prompt_loader=self.prompt_loader,
         )
 
-        self.stage_style = StageStyleService(
+    @cached_property
+    def stage_style(self) -> StageStyleService:
+        return StageStyleService(
             project_manager=self.project_manager,
             gemini_service=self.gemini_service,
             image_service=self.image_service,
@@ -65,45 +110,66 @@ class ServiceContainer:
             prompt_loader=self.prompt_loader,
         )
 
-        self.stage_prompts = StagePromptsService(
+    @cached_property
+    def stage_prompts(self) -> StagePromptsService:
+        return StagePromptsService(
             project_manager=self.project_manager,
             gemini_service=self.gemini_service,
             prompt_loader=self.prompt_loader,
         )
 
-        self.stage_images = StageImagesService(
+    @cached_property
+    def stage_images(self) -> StageImagesService:
+        return StageImagesService(
             project_manager=self.project_manager,
             image_service=self.image_service,
             storage_service=self.storage_service,
         )
 
-        self.rendering_service = RenderingService(
+    @cached_property
+    def rendering_service(self) -> RenderingService:
+        return RenderingService(
             config_manager=self.config_manager,
             font_manager=self.font_manager,
             storage_service=self.storage_service,
         )
 
-        self.stage_typography = StageTypographyService(
+    @cached_property
+    def stage_typography(self) -> StageTypographyService:
+        return StageTypographyService(
             project_manager=self.project_manager,
             rendering_service=self.rendering_service,
             storage_service=self.storage_service,
         )
 
-        self.export_service = ExportService(
+    @cached_property
+    def export_service(self) -> ExportService:
+        return ExportService(
             project_manager=self.project_manager,
             storage_service=self.storage_service,
         )
 
-        # Matrix Generator services
-        self.matrix_settings_manager = MatrixSettingsManager()
-        self.matrix_db = MatrixDB()
-        self.matrix_generator = MatrixGenerator(
+    # Matrix Generator services
+    @cached_property
+    def matrix_settings_manager(self) -> MatrixSettingsManager:
+        return MatrixSettingsManager()
+
+    @cached_property
+    def matrix_db(self) -> MatrixDB:
+        return MatrixDB()
+
+    @cached_property
+    def matrix_generator(self) -> MatrixGenerator:
+        return MatrixGenerator(
             gemini_service=self.gemini_service,
             image_service=self.image_service,
             storage_service=self.storage_service,
             prompt_loader=self.prompt_loader,
         )
-        self.matrix_service = MatrixService(
+
+    @cached_property
+    def matrix_service(self) -> MatrixService:
+        return MatrixService(
             matrix_db=self.matrix_db,
             matrix_generator=self.matrix_generator,
             settings=self.matrix_settings_manager.get(),
@@ -115,101 +181,64 @@ container = ServiceContainer()
 
 
 # Dependency functions for FastAPI
-def get_project_manager() -> ProjectManager:
-    """Provider for ProjectManager singleton."""
-    return container.project_manager
-
-
-def get_template_manager() -> TemplateManager:
-    """Provider for TemplateManager singleton."""
-    return container.template_manager
-
-
-def get_gemini_service() -> GeminiService:
-    """Provider for GeminiService instance."""
-    return container.gemini_service
-
-
-def get_image_service() -> ImageService:
-    """Provider for ImageService instance."""
-    return container.image_service
-
-
-def get_storage_service() -> StorageService:
-    """Provider for StorageService instance."""
-    return container.storage_service
-
-
-def get_config_manager() -> ConfigManager:
-    """Provider for ConfigManager instance."""
-    return container.config_manager
-
-
-def get_prompt_validator() -> PromptValidator:
-    """Provider for PromptValidator instance."""
-    return container.prompt_validator
-
-
-def get_font_manager() -> FontManager:
-    """Provider for FontManager instance."""
-    return container.font_manager
-
-
-def get_prompt_loader() -> PromptLoader:
-    """Provider for PromptLoader instance."""
-    return container.prompt_loader
-
-
-def get_stage_research_service() -> StageResearchService:
-    """Provider for Stage Research (chat + draft extraction) service."""
-    return container.stage_research
-
-
-def get_stage_draft_service() -> StageDraftService:
-    """Provider for Stage Draft business logic service."""
-    return container.stage_draft
-
-
-def get_stage_style_service() -> StageStyleService:
-    """Provider for Visual Style selection service."""
-    return container.stage_style
-
-
-def get_stage_prompts_service() -> StagePromptsService:
-    """Provider for Stage Prompts (Image Prompts) service."""
-    return container.stage_prompts
-
-
-def get_stage_images_service() -> StageImagesService:
-    """Provider for Stage Images (Image Generation) service."""
-    return container.stage_images
-
-
-def get_rendering_service() -> RenderingService:
-    """Provider for Typography Rendering service."""
-    return container.rendering_service
-
-
-def get_stage_typography_service() -> StageTypographyService:
-    """Provider for Stage Typography (Design & Layout) service."""
-    return container.stage_typography
-
-
-def get_export_service() -> ExportService:
-    """Provider for Export/ZIP service."""
-    return container.export_service
-
-
-def get_matrix_db() -> MatrixDB:
-    """Provider for MatrixDB CRUD service."""
-    return container.matrix_db
-
-
-def get_matrix_service() -> MatrixService:
-    """Provider for MatrixService orchestrator."""
-    return container.matrix_service
 
 
-def get_matrix_settings_manager() -> MatrixSettingsManager:
-    """Provider for MatrixSettingsManager."""
-    return container.matrix_settings_manager
+def _provider(attr: str, service_type: type[T]) -> Callable[[], Awaitable[T]]:
+    """Build a zero-argument FastAPI provider returning ``container.<attr>``.
+
+    Providers are coroutines so FastAPI resolves them inline on the event
+    loop; a plain ``def`` dependency costs a threadpool round trip on every
+    request just to read a cached attribute.
+    """
+
+    async def provide() -> T:
+        return getattr(container, attr)
+
+    provide.__name__ = provide.__qualname__ = f"get_{attr}"
+    provide.__doc__ = f"Provider for the {service_type.__name__} singleton."
+    return provide
+
+
+get_project_manager = _provider("project_manager", ProjectManager)
+get_template_manager = _provider("template_manager", TemplateManager)
+get_gemini_service = _provider("gemini_service", GeminiService)
+get_image_service = _provider("image_service", ImageService)
+get_storage_service = _provider("storage_service", StorageService)
+get_config_manager = _provider("config_manager", ConfigManager)
+get_prompt_validator = _provider("prompt_validator", PromptValidator)
+get_font_manager = _provider("font_manager", FontManager)
+get_prompt_loader = _provider("prompt_loader", PromptLoader)
+get_stage_research_service = _provider("stage_research", StageResearchService)
+get_stage_draft_service = _provider("stage_draft", StageDraftService)
+get_stage_style_service = _provider("stage_style", StageStyleService)
+get_stage_prompts_service = _provider("stage_prompts", StagePromptsService)
+get_stage_images_service = _provider("stage_images", StageImagesService)
+get_rendering_service = _provider("rendering_service", RenderingService)
+get_stage_typography_service = _provider("stage_typography", StageTypographyService)
+get_export_service = _provider("export_service", ExportService)
+get_matrix_db = _provider("matrix_db", MatrixDB)
+get_matrix_service = _provider("matrix_service", MatrixService)
+get_matrix_settings_manager = _provider("matrix_settings_manager", MatrixSettingsManager)
+
+
+# Annotated aliases for route signatures, e.g. ``pm: ProjectManagerDep``.
+ProjectManagerDep = Annotated[ProjectManager, Depends(get_project_manager)]
+TemplateManagerDep = Annotated[TemplateManager, Depends(get_template_manager)]
+GeminiServiceDep = Annotated[GeminiService, Depends(get_gemini_service)]
+ImageServiceDep = Annotated[ImageService, Depends(get_image_service)]
+StorageServiceDep = Annotated[StorageService, Depends(get_storage_service)]
+ConfigManagerDep = Annotated[ConfigManager, Depends(get_config_manager)]
+PromptValidatorDep = Annotated[PromptValidator, Depends(get_prompt_validator)]
+FontManagerDep = Annotated[FontManager, Depends(get_font_manager)]
+PromptLoaderDep = Annotated[PromptLoader, Depends(get_prompt_loader)]
+StageResearchServiceDep = Annotated[StageResearchService, Depends(get_stage_research_service)]
+StageDraftServiceDep = Annotated[StageDraftService, Depends(get_stage_draft_service)]
+StageStyleServiceDep = Annotated[StageStyleService, Depends(get_stage_style_service)]
+StagePromptsServiceDep = Annotated[StagePromptsService, Depends(get_stage_prompts_service)]
+StageImagesServiceDep = Annotated[StageImagesService, Depends(get_stage_images_service)]
+RenderingServiceDep = Annotated[RenderingService, Depends(get_rendering_service)]
+StageTypographyServiceDep = Annotated[StageTypographyService, Depends(get_stage_typography_service)]
+ExportServiceDep = Annotated[ExportService, Depends(get_export_service)]
+MatrixDBDep = Annotated[MatrixDB, Depends(get_matrix_db)]
+MatrixServiceDep = Annotated[MatrixService, Depends(get_matrix_service)]
+MatrixSettingsManagerDep = Annotated[MatrixSettingsManager, Depends(get_matrix_settings_manager)]
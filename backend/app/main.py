@@ -1,5 +1,6 @@
 """Main FastAPI application for Lucid."""
 
+import asyncio
 import datetime
 import logging
 import os
@@ -8,9 +9,9 @@ import time
 from collections import defaultdict
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.routes import (
@@ -28,7 +29,8 @@ from app.routes import (
     prompts,
     matrix,
 )
-from app.services.gemini_service import GeminiError
+from app.routes.utils import ORJSONResponse, client_address
+from app.services.gemini_service import GeminiError, close_genai_client
 from app.services.storage_service import IMAGE_DIR
 from app.services.llm_logger import start_flow, _flow_name_from_path
 
@@ -65,21 +67,35 @@ _commit_info: dict[str, str | None] = {}
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialise the database and seed defaults on startup."""
-    from app.db.database import init_db
+    from app.db.database import init_db, warm_pool
     from app.dependencies import container
 
     try:
         await init_db()
-        await container.template_manager.seed_defaults()
-        # Run incremental schema migrations (idempotent)
+        # Tables exist now. Schema migrations (idempotent) must finish before
+        # seeding writes rows, so those two run in order; only the pool
+        # warm-up, which touches no tables, overlaps them.
         from app.services.matrix_db import MatrixDB
-        await MatrixDB.run_migrations()
+
+        async def _migrate_then_seed() -> None:
+            await MatrixDB.run_migrations()
+            await container.template_manager.seed_defaults()
+
+        await asyncio.gather(_migrate_then_seed(), warm_pool())
         # Ensure the image storage directory exists on disk
         IMAGE_DIR.mkdir(parents=True, exist_ok=True)
         logger.info("Database initialised successfully")
     except Exception as e:
         logger.error(f"Database initialisation failed: {e}", exc_info=True)
 
+    # Read every prompt file once so the first generation request and
+    # GET /api/prompts are served from memory (edits are still picked up
+    # through the mtime check).
+    try:
+        await asyncio.to_thread(container.prompt_loader.load_all)
+    except OSError as e:
+        logger.warning(f"Could not preload prompt files: {e}")
+
     # Prefer build-time env vars (set by CI) to avoid mounting .git at runtime.
     # Fall back to git subprocess for local dev where .git is mounted.
     commit_hash = os.getenv("COMMIT_HASH", "").strip()
@@ -114,6 +130,9 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    # Release pooled Gemini API connections on shutdown.
+    close_genai_client()
+
 
 app = FastAPI(
     title="Lucid API",
@@ -122,11 +141,20 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+
+def _parse_origins(raw: str) -> list[str]:
+    """Split a comma-separated origin list, trimming blanks and duplicates."""
+    stripped = (origin.strip() for origin in raw.split(","))
+    return list(dict.fromkeys(origin for origin in stripped if origin))
+
+
 # Configure CORS for frontend
-cors_origins = os.getenv(
-    "CORS_ALLOWED_ORIGINS",
-    "http://localhost:3000,http://localhost:5173",
-).split(",")
+cors_origins = _parse_origins(
+    os.getenv(
+        "CORS_ALLOWED_ORIGINS",
+        "http://localhost:3000,http://localhost:5173",
+    )
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -136,21 +164,46 @@ app.add_middleware(
     allow_headers=["Content-Type", "Authorization"],
 )
 
+# Compress JSON bodies (project state, config, font mappings). Starlette skips
+# ZIP, image and SSE responses by content type, so exports pass through as-is.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+
+async def llm_log_flow(request: Request) -> None:
+    """Assign a per-request log flow so all LLM calls land in one file.
+
+    Attached only to routers that call the LLM. Must stay ``async`` so the
+    context variable is set in the request's own context, not a threadpool copy.
+    """
+    start_flow(_flow_name_from_path(request.url.path))
+
+
+# (router, path under /api and OpenAPI tag, tags the request with an LLM log flow)
+_ROUTER_TABLE = (
+    (projects.router, "projects", True),
+    (templates.router, "templates", False),
+    (stage_research.router, "stage-research", True),
+    (stage_draft.router, "stage-draft", True),
+    (stage_style.router, "stage-style", True),
+    (stage_prompts.router, "stage-prompts", True),
+    (stage_images.router, "stage-images", True),
+    (stage_typography.router, "stage-typography", True),
+    (export.router, "export", False),
+    (fonts.router, "fonts", False),
+    (config.router, "config", False),
+    (prompts.router, "prompts", False),
+    (matrix.router, "matrix", True),
+    (matrix.settings_router, "matrix-settings", False),
+)
+
 # Include routers
-app.include_router(projects.router, prefix="/api/projects", tags=["projects"])
-app.include_router(templates.router, prefix="/api/templates", tags=["templates"])
-app.include_router(stage_research.router, prefix="/api/stage-research", tags=["stage-research"])
-app.include_router(stage_draft.router, prefix="/api/stage-draft", tags=["stage-draft"])
-app.include_router(stage_style.router, prefix="/api/stage-style", tags=["stage-style"])
-app.include_router(stage_prompts.router, prefix="/api/stage-prompts", tags=["stage-prompts"])
-app.include_router(stage_images.router, prefix="/api/stage-images", tags=["stage-images"])
-app.include_router(stage_typography.router, prefix="/api/stage-typography", tags=["stage-typography"])
-app.include_router(export.router, prefix="/api/export", tags=["export"])
-app.include_router(fonts.router, prefix="/api/fonts", tags=["fonts"])
-app.include_router(config.router, prefix="/api/config", tags=["config"])
-app.include_router(prompts.router, prefix="/api/prompts", tags=["prompts"])
-app.include_router(matrix.router, prefix="/api/matrix", tags=["matrix"])
-app.include_router(matrix.settings_router, prefix="/api/matrix-settings", tags=["matrix-settings"])
+for _router, _name, _uses_llm in _ROUTER_TABLE:
+    app.include_router(
+        _router,
+        prefix=f"/api/{_name}",
+        tags=[_name],
+        dependencies=[Depends(llm_log_flow)] if _uses_llm else None,
+    )
 
 # Ensure the image directory exists before mounting (StaticFiles requires it).
 IMAGE_DIR.mkdir(parents=True, exist_ok=True)
@@ -159,20 +212,13 @@ IMAGE_DIR.mkdir(parents=True, exist_ok=True)
 app.mount("/images", StaticFiles(directory=str(IMAGE_DIR)), name="images")
 
 
-@app.middleware("http")
-async def llm_log_flow(request: Request, call_next):
-    """Assign a per-request log flow so all LLM calls land in one file."""
-    start_flow(_flow_name_from_path(request.url.path))
-    return await call_next(request)
-
-
 @app.middleware("http")
 async def rate_limit_middleware(request: Request, call_next):
     """Reject /api requests that exceed 120 per minute per IP."""
     if request.url.path.startswith("/api/"):
-        client_ip = request.client.host if request.client else "unknown"
+        client_ip = client_address(request)
         if not _limiter.is_allowed(client_ip):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={"detail": "Too many requests. Please slow down."},
                 headers={"Retry-After": "60"},
@@ -183,25 +229,25 @@ async def rate_limit_middleware(request: Request, call_next):
 @app.exception_handler(GeminiError)
 async def gemini_error_handler(request: Request, exc: GeminiError):
     """Return a clear error when Gemini AI is unavailable or fails."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=503,
         content={"detail": str(exc)},
     )
 
 
-@app.get("/")
+@app.get("/", include_in_schema=False)
 async def root():
     """Health check endpoint."""
     return {"status": "ok", "message": "Lucid API is running"}
 
 
-@app.get("/health")
+@app.get("/health", include_in_schema=False)
 async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
 
 
-@app.get("/api/info")
+@app.get("/api/info", response_class=ORJSONResponse)
 async def info():
     """Returns application version and last git commit info."""
     return {
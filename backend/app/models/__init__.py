@@ -1,16 +1,42 @@
-"""Pydantic models for Lucid."""
-
-from app.models.slide import Slide, SlideText
-from app.models.style import TextStyle, BoxStyle, StrokeStyle, ShadowStyle
-from app.models.style_proposal import StyleProposal
-from app.models.config import (
-    AppConfig,
-    StageInstructionsConfig,
-    GlobalDefaultsConfig,
-    ImageConfig,
-    StyleConfig,
-)
+"""Pydantic models for Lucid.
 
+Re-exports are resolved lazily (PEP 562): importing one submodule, e.g.
+``app.models.matrix``, does not pull in every other model module.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.models.slide import Slide, SlideText
+    from app.models.style import TextStyle, BoxStyle, StrokeStyle, ShadowStyle
+    from app.models.style_proposal import StyleProposal
+    from app.models.config import (
+        AppConfig,
+        StageInstructionsConfig,
+        GlobalDefaultsConfig,
+        ImageConfig,
+        StyleConfig,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "Slide": "app.models.slide",
+    "SlideText": "app.models.slide",
+    "TextStyle": "app.models.style",
+    "BoxStyle": "app.models.style",
+    "StrokeStyle": "app.models.style",
+    "ShadowStyle": "app.models.style",
+    "StyleProposal": "app.models.style_proposal",
+    "AppConfig": "app.models.config",
+    "StageInstructionsConfig": "app.models.config",
+    "GlobalDefaultsConfig": "app.models.config",
+    "ImageConfig": "app.models.config",
+    "StyleConfig": "app.models.config",
+}
+
+# Spelled out (not derived from _LAZY_EXPORTS) so linters see the
+# TYPE_CHECKING imports above as re-exports.
 __all__ = [
     "Slide",
     "SlideText",
@@ -25,3 +51,16 @@ __all__ = [
     "ImageConfig",
     "StyleConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
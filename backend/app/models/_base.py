@@ -0,0 +1,36 @@
+"""Shared Pydantic base models for Lucid."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class LucidBaseModel(BaseModel):
+    """Base class for all Lucid models.
+
+    ``defer_build`` postpones building each model's validator and serializer
+    until the model is first used, so importing ``app.models`` stays cheap
+    for models a given process never touches.
+
+    The remaining options match Pydantic's defaults but are pinned here
+    because services rely on them: state blobs written by older versions
+    may carry fields that no longer exist (``extra="ignore"``), and the
+    stage services mutate ``ProjectState``/``Slide`` attributes in place
+    without paying for re-validation on each assignment.
+    """
+
+    model_config = ConfigDict(
+        defer_build=True,
+        extra="ignore",
+        validate_assignment=False,
+        revalidate_instances="never",
+    )
+
+
+class RequestBodyModel(LucidBaseModel):
+    """Base class for models FastAPI binds directly as request bodies.
+
+    Built eagerly: FastAPI compiles body models when the first request
+    arrives anyway, and a deferred model wrapped in its aliased body field
+    makes Pydantic emit ``UnsupportedFieldAttributeWarning``.
+    """
+
+    model_config = ConfigDict(defer_build=False)
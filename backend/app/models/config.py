@@ -1,16 +1,20 @@
 """Configuration models for Lucid application."""
 
 from typing import Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import ConfigDict, Field, field_validator
+
+from app.models._base import LucidBaseModel, RequestBodyModel
 
 WordsPerSlide = Literal["short", "medium", "long", "keep_as_is", "ai"]
 
 from app.config import IMAGE_WIDTH, IMAGE_HEIGHT, IMAGE_ASPECT_RATIO
 
 
-class StageInstructionsConfig(BaseModel):
+class StageInstructionsConfig(LucidBaseModel):
     """Per-stage additional instructions."""
 
+    model_config = ConfigDict(frozen=True)
+
     stage1: Optional[str] = Field(
         default=None, description="Default instructions for Stage 1 (Draft)"
     )
@@ -25,9 +29,11 @@ class StageInstructionsConfig(BaseModel):
     )
 
 
-class GlobalDefaultsConfig(BaseModel):
+class GlobalDefaultsConfig(LucidBaseModel):
     """Global default parameters."""
 
+    model_config = ConfigDict(frozen=True)
+
     num_slides: Optional[int] = Field(
         default=5, description="Default number of slides (None = let AI decide)"
     )
@@ -49,9 +55,11 @@ class GlobalDefaultsConfig(BaseModel):
         return v
 
 
-class ImageConfig(BaseModel):
+class ImageConfig(LucidBaseModel):
     """Image generation settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     width: int = Field(
         default=IMAGE_WIDTH, ge=256, le=4096, description="Image width in pixels"
     )
@@ -63,9 +71,11 @@ class ImageConfig(BaseModel):
     )
 
 
-class StyleConfig(BaseModel):
+class StyleConfig(LucidBaseModel):
     """Default style/typography settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     default_font_family: str = Field(default="Inter", description="Default font family")
     default_font_weight: int = Field(
         default=700, ge=100, le=900, description="Default font weight"
@@ -97,7 +107,7 @@ class StyleConfig(BaseModel):
     )
 
 
-class AppConfig(BaseModel):
+class AppConfig(RequestBodyModel):
     """Complete application configuration.
 
     Note: Prompts are NOT stored here - they live in .prompt files.
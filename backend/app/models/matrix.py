@@ -5,21 +5,23 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
+
+from app.models._base import LucidBaseModel, RequestBodyModel
 
 
 # ── Settings ──────────────────────────────────────────────────────────────
 
 
-class MatrixSettings(BaseModel):
+class MatrixSettings(LucidBaseModel):
     """Runtime-configurable settings, persisted to matrix_settings.json."""
 
-    text_model: str = Field(default="gemini-2.5-flash")
-    image_model: str = Field(default="gemini-2.5-flash-image")
-    diagonal_temperature: float = Field(default=0.9)
-    axes_temperature: float = Field(default=0.8)
-    cell_temperature: float = Field(default=0.7)
-    validation_temperature: float = Field(default=0.3)
+    text_model: str = "gemini-2.5-flash"
+    image_model: str = "gemini-2.5-flash-image"
+    diagonal_temperature: float = 0.9
+    axes_temperature: float = 0.8
+    cell_temperature: float = 0.7
+    validation_temperature: float = 0.3
     max_concurrency: int = Field(default=4, ge=1, le=20)
     max_retries: int = Field(default=3, ge=0, le=5)
 
@@ -27,7 +29,7 @@ class MatrixSettings(BaseModel):
 # ── Cell ──────────────────────────────────────────────────────────────────
 
 
-class MatrixCell(BaseModel):
+class MatrixCell(LucidBaseModel):
     """Single cell in an n×n matrix (row, col)."""
 
     id: str
@@ -53,7 +55,7 @@ class MatrixCell(BaseModel):
 # ── Project ───────────────────────────────────────────────────────────────
 
 
-class MatrixProject(BaseModel):
+class MatrixProject(LucidBaseModel):
     """Full matrix project state."""
 
     id: str
@@ -87,7 +89,7 @@ class MatrixProject(BaseModel):
         return self.n_cols if self.n_cols > 0 else self.n
 
 
-class MatrixProjectCard(BaseModel):
+class MatrixProjectCard(LucidBaseModel):
     """Lightweight card for project list."""
 
     id: str
@@ -105,8 +107,8 @@ class MatrixProjectCard(BaseModel):
 # ── Request / Response ────────────────────────────────────────────────────
 
 
-class CreateMatrixRequest(BaseModel):
-    input_mode: Literal["theme", "description"] = Field(default="theme")
+class CreateMatrixRequest(RequestBodyModel):
+    input_mode: Literal["theme", "description"] = "theme"
     theme: str = Field(default="", max_length=1000)
     description: Optional[str] = Field(default=None, max_length=2000)
     n: int = Field(default=4, ge=2, le=8)
@@ -115,7 +117,7 @@ class CreateMatrixRequest(BaseModel):
     n_cols: Optional[int] = Field(default=None, ge=2, le=8)
     language: str = Field(default="English", max_length=50)
     style_mode: str = Field(default="neutral", max_length=50)
-    include_images: bool = Field(default=False)
+    include_images: bool = False
     name: Optional[str] = Field(default=None, max_length=200)
 
     @model_validator(mode="after")
@@ -137,26 +139,26 @@ class CreateMatrixRequest(BaseModel):
         return self.n_cols if self.n_cols is not None else self.n
 
 
-class RegenerateCellRequest(BaseModel):
+class RegenerateCellRequest(RequestBodyModel):
     extra_instructions: Optional[str] = None
     image_only: bool = False
 
 
-class RevalidateRequest(BaseModel):
+class RevalidateRequest(RequestBodyModel):
     user_comment: str = ""
 
 
-class MatrixProjectResponse(BaseModel):
+class MatrixProjectResponse(LucidBaseModel):
     matrix: MatrixProject
 
 
-class MatrixListResponse(BaseModel):
+class MatrixListResponse(LucidBaseModel):
     matrices: List[MatrixProjectCard]
 
 
-class MatrixSettingsResponse(BaseModel):
+class MatrixSettingsResponse(LucidBaseModel):
     settings: MatrixSettings
 
 
-class UpdateMatrixSettingsRequest(BaseModel):
+class UpdateMatrixSettingsRequest(RequestBodyModel):
     settings: MatrixSettings
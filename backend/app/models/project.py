@@ -1,13 +1,19 @@
 """Project and Template Pydantic models."""
 
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from app.models._base import LucidBaseModel, RequestBodyModel
 
 # The total number of pipeline stages (including the Research stage).
 MAX_STAGES = 6
 
+# Timezone-aware "now", shared by every timestamp default.
+_utc_now = partial(datetime.now, timezone.utc)
+
 from app.models.slide import Slide
 from app.models.style_proposal import StyleProposal
 from app.models.config import (
@@ -24,7 +30,7 @@ from app.models.config import (
 # ---------------------------------------------------------------------------
 
 
-class ProjectConfig(BaseModel):
+class ProjectConfig(LucidBaseModel):
     """Configuration deep-copied from a Template at project creation time.
 
     Extends AppConfig with embedded prompt templates so each project is
@@ -46,12 +52,16 @@ class ProjectConfig(BaseModel):
     def from_app_config(
         cls, app_config: AppConfig, prompts: Dict[str, str]
     ) -> "ProjectConfig":
-        """Build a ProjectConfig from an AppConfig + prompt dict."""
+        """Build a ProjectConfig from an AppConfig + prompt dict.
+
+        The section configs are frozen, so they are shared with *app_config*
+        rather than copied.
+        """
         return cls(
-            stage_instructions=app_config.stage_instructions.model_copy(deep=True),
-            global_defaults=app_config.global_defaults.model_copy(deep=True),
-            image=app_config.image.model_copy(deep=True),
-            style=app_config.style.model_copy(deep=True),
+            stage_instructions=app_config.stage_instructions,
+            global_defaults=app_config.global_defaults,
+            image=app_config.image,
+            style=app_config.style,
             prompts=dict(prompts),
         )
 
@@ -65,14 +75,14 @@ class ProjectConfig(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class ProjectState(BaseModel):
+class ProjectState(LucidBaseModel):
     """Complete project state — stored in the ``state`` JSON column."""
 
     project_id: str = Field(description="Unique project identifier (UUID)")
-    name: str = Field(default="Untitled Project")
+    name: str = "Untitled Project"
     slide_count: int = Field(default=5, ge=1, le=20)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_utc_now)
 
     # Stage tracking
     current_stage: int = Field(default=1, ge=1, le=MAX_STAGES)
@@ -82,46 +92,54 @@ class ProjectState(BaseModel):
 
     # Stage Research data
     chat_history: List[Dict[str, Any]] = Field(default_factory=list)
-    research_instructions: Optional[str] = Field(default=None)
+    research_instructions: Optional[str] = None
 
     # Whether the project name was set manually by the user (suppresses auto-rename)
-    name_manually_set: bool = Field(default=False)
+    name_manually_set: bool = False
 
     # Stage Draft inputs
     draft_text: str = Field(default="", description="Original draft text")
     num_slides: Optional[int] = Field(default=None, ge=1, le=20)
-    include_titles: bool = Field(default=True)
-    additional_instructions: Optional[str] = Field(default=None)
-    language: str = Field(default="English")
+    include_titles: bool = True
+    additional_instructions: Optional[str] = None
+    language: str = "English"
 
     # Stage Style data
     style_proposals: List[StyleProposal] = Field(default_factory=list)
-    selected_style_proposal_index: Optional[int] = Field(default=None)
+    selected_style_proposal_index: Optional[int] = None
 
     # Stage Prompts inputs
-    image_style_instructions: Optional[str] = Field(default=None)
-    shared_prompt_prefix: Optional[str] = Field(default=None)
+    image_style_instructions: Optional[str] = None
+    shared_prompt_prefix: Optional[str] = None
 
     # Slides data (populated through stages)
     slides: List[Slide] = Field(default_factory=list)
 
     # Thumbnail (auto-set after Stage Style proposals are generated)
-    thumbnail_url: Optional[str] = Field(default=None)
+    thumbnail_url: Optional[str] = None
 
     def update_timestamp(self) -> None:
         """Refresh the updated_at timestamp."""
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utc_now()
 
     def get_slide(self, index: int) -> Optional[Slide]:
         """Return slide at *index*, or None if out of range."""
-        if 0 <= index < len(self.slides):
+        if index < 0:
+            return None
+        try:
             return self.slides[index]
-        return None
+        except IndexError:
+            return None
 
     def ensure_slides(self, count: int) -> None:
-        """Ensure at least *count* slides exist."""
-        while len(self.slides) < count:
-            self.slides.append(Slide(index=len(self.slides)))
+        """Ensure at least *count* slides exist.
+
+        New slides hold only defaults and a known-good index, so they are
+        built with ``model_construct`` and skip validation.
+        """
+        self.slides.extend(
+            Slide.model_construct(index=i) for i in range(len(self.slides), count)
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -129,7 +147,7 @@ class ProjectState(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class ProjectCard(BaseModel):
+class ProjectCard(LucidBaseModel):
     """Minimal project representation for the project-list endpoint."""
 
     project_id: str
@@ -146,25 +164,25 @@ class ProjectCard(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class CreateProjectRequest(BaseModel):
+class CreateProjectRequest(RequestBodyModel):
     """Request body for POST /api/projects."""
 
-    template_id: Optional[str] = Field(default=None)
+    template_id: Optional[str] = None
 
 
-class RenameProjectRequest(BaseModel):
+class RenameProjectRequest(RequestBodyModel):
     """Request body for PATCH /api/projects/{id}/name."""
 
     name: str = Field(min_length=1, max_length=200)
 
 
-class ProjectResponse(BaseModel):
+class ProjectResponse(LucidBaseModel):
     """Response wrapping a full ProjectState."""
 
     project: ProjectState
 
 
-class ProjectListResponse(BaseModel):
+class ProjectListResponse(LucidBaseModel):
     """Response wrapping a list of ProjectCards."""
 
     projects: List[ProjectCard]
@@ -175,7 +193,7 @@ class ProjectListResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class TemplateData(BaseModel):
+class TemplateData(LucidBaseModel):
     """Full template data (returned from API)."""
 
     id: str
@@ -185,7 +203,7 @@ class TemplateData(BaseModel):
     created_at: datetime
 
 
-class CreateTemplateRequest(BaseModel):
+class CreateTemplateRequest(RequestBodyModel):
     """Request body for POST /api/templates."""
 
     name: str = Field(min_length=1, max_length=200)
@@ -193,7 +211,7 @@ class CreateTemplateRequest(BaseModel):
     config: Optional[ProjectConfig] = None
 
 
-class UpdateTemplateRequest(BaseModel):
+class UpdateTemplateRequest(RequestBodyModel):
     """Request body for PATCH /api/templates/{id}."""
 
     name: Optional[str] = Field(default=None, min_length=1, max_length=200)
@@ -201,7 +219,7 @@ class UpdateTemplateRequest(BaseModel):
     config: Optional[ProjectConfig] = None
 
 
-class TemplateListResponse(BaseModel):
+class TemplateListResponse(LucidBaseModel):
     """Response wrapping a list of templates."""
 
     templates: List[TemplateData]
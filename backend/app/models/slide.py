@@ -1,12 +1,13 @@
 """Slide models."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import LucidBaseModel
 from app.models.style import TextStyle
 
 
-class SlideText(BaseModel):
+class SlideText(LucidBaseModel):
     """Text content for a slide."""
 
     title: Optional[str] = Field(default=None, description="Optional slide title")
@@ -19,7 +20,7 @@ class SlideText(BaseModel):
         return self.body
 
 
-class Slide(BaseModel):
+class Slide(LucidBaseModel):
     """Complete slide with all stage data."""
 
     index: int = Field(ge=0, description="Slide index (0-based)")
@@ -1,11 +1,21 @@
 """Style models for typography and layout."""
 
-from pydantic import BaseModel, Field
+from typing import Annotated
 
+from pydantic import ConfigDict, Field
 
-class BoxStyle(BaseModel):
+from app.models._base import LucidBaseModel
+
+# Shared colour types so every field reuses one compiled pattern validator.
+OpaqueHexColor = Annotated[str, Field(pattern=r"^#[0-9A-Fa-f]{6}$")]
+HexColor = Annotated[str, Field(pattern=r"^#[0-9A-Fa-f]{6,8}$")]
+
+
+class BoxStyle(LucidBaseModel):
     """Text box positioning and sizing."""
 
+    model_config = ConfigDict(frozen=True)
+
     x_pct: float = Field(
         default=0.05, ge=0, le=1, description="X position as percentage"
     )
@@ -19,41 +29,49 @@ class BoxStyle(BaseModel):
     )
 
 
-class StrokeStyle(BaseModel):
+class StrokeStyle(LucidBaseModel):
     """Configuration for text outlines/strokes."""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = False
     width_px: int = Field(default=2, ge=0, le=20)
-    color: str = Field(default="#000000", pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: OpaqueHexColor = "#000000"
 
 
-class ShadowStyle(BaseModel):
+class ShadowStyle(LucidBaseModel):
     """Configuration for text drop-shadow effects."""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = False
     dx: int = Field(default=2, ge=-20, le=20)
     dy: int = Field(default=2, ge=-20, le=20)
     blur: int = Field(default=4, ge=0, le=20)
-    color: str = Field(default="#00000080", pattern=r"^#[0-9A-Fa-f]{6,8}$")
+    color: HexColor = "#00000080"
+
+
+# Shared, immutable defaults — every TextStyle references the same instances
+# instead of building four sub-models per slide.
+_DEFAULT_TITLE_BOX = BoxStyle(x_pct=0.05, y_pct=0.1, w_pct=0.9, h_pct=0.2)
+_DEFAULT_BODY_BOX = BoxStyle(x_pct=0.05, y_pct=0.35, w_pct=0.9, h_pct=0.55)
+_DEFAULT_STROKE = StrokeStyle()
+_DEFAULT_SHADOW = ShadowStyle()
 
 
-class TextStyle(BaseModel):
+class TextStyle(LucidBaseModel):
     """Complete text styling configuration."""
 
     font_family: str = Field(default="Inter", description="Font family name")
     font_weight: int = Field(default=700, ge=100, le=900)
     font_size_px: int = Field(default=72, ge=12, le=200)
     body_font_size_px: int = Field(default=40, ge=12, le=200)
-    text_color: str = Field(default="#FFFFFF", pattern=r"^#[0-9A-Fa-f]{6,8}$")
+    text_color: HexColor = "#FFFFFF"
     alignment: str = Field(default="center", pattern=r"^(left|center|right)$")
-    title_box: BoxStyle = Field(
-        default_factory=lambda: BoxStyle(x_pct=0.05, y_pct=0.1, w_pct=0.9, h_pct=0.2)
-    )
-    body_box: BoxStyle = Field(
-        default_factory=lambda: BoxStyle(x_pct=0.05, y_pct=0.35, w_pct=0.9, h_pct=0.55)
-    )
+    title_box: BoxStyle = _DEFAULT_TITLE_BOX
+    body_box: BoxStyle = _DEFAULT_BODY_BOX
     line_spacing: float = Field(default=1.2, ge=0.5, le=3.0)
-    stroke: StrokeStyle = Field(default_factory=StrokeStyle)
-    shadow: ShadowStyle = Field(default_factory=ShadowStyle)
+    stroke: StrokeStyle = _DEFAULT_STROKE
+    shadow: ShadowStyle = _DEFAULT_SHADOW
     max_lines: int = Field(default=12, ge=1, le=20)
     text_enabled: bool = Field(default=True, description="Whether text is rendered on this slide")
@@ -1,10 +1,12 @@
 """Style proposal model for Stage 2 (Style selection)."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import LucidBaseModel
 
-class StyleProposal(BaseModel):
+
+class StyleProposal(LucidBaseModel):
     """A style proposal with common visual style prompt and preview image."""
 
     index: int = Field(description="Proposal index")
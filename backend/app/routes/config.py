@@ -1,19 +1,19 @@
 """Configuration API routes."""
 
-from typing import Optional, Dict
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
 
+from app.models._base import RequestBodyModel
 from app.models.config import AppConfig
-from app.dependencies import get_config_manager
-from app.services.config_manager import ConfigManager
-from app.routes.utils import execute_config_action
+from app.dependencies import ConfigManagerDep
+from app.routes.utils import EncodedBodyCache, execute_config_action
 
 router = APIRouter()
 
 
 # Request models
-class UpdateStageInstructionsRequest(BaseModel):
+class UpdateStageInstructionsRequest(RequestBodyModel):
     """Request to update stage instructions."""
 
     stage: str = Field(
@@ -24,7 +24,7 @@ class UpdateStageInstructionsRequest(BaseModel):
     )
 
 
-class UpdateGlobalDefaultsRequest(BaseModel):
+class UpdateGlobalDefaultsRequest(RequestBodyModel):
     """Request to update global defaults."""
 
     num_slides: Optional[int] = Field(None, ge=1, le=10)
@@ -32,7 +32,7 @@ class UpdateGlobalDefaultsRequest(BaseModel):
     include_titles: Optional[bool] = None
 
 
-class UpdateImageConfigRequest(BaseModel):
+class UpdateImageConfigRequest(RequestBodyModel):
     """Request to update image config."""
 
     width: Optional[int] = Field(None, ge=256, le=4096)
@@ -40,7 +40,7 @@ class UpdateImageConfigRequest(BaseModel):
     aspect_ratio: Optional[str] = None
 
 
-class UpdateStyleConfigRequest(BaseModel):
+class UpdateStyleConfigRequest(RequestBodyModel):
     """Request to update style config."""
 
     default_font_family: Optional[str] = None
@@ -52,41 +52,45 @@ class UpdateStyleConfigRequest(BaseModel):
 
 # Response models
 class ConfigResponse(BaseModel):
-    """Standard config response."""
+    """Standard config response.
 
-    config: AppConfig
-
-
-class ValidatePromptsRequest(BaseModel):
-    """Request to validate prompts."""
-
-    prompts: Dict[str, str]
+    Routes build it with ``model_construct``: the wrapped ``AppConfig`` comes
+    from ``ConfigManager`` and has already been validated.
+    """
 
+    config: AppConfig
 
-class ValidatePromptsResponse(BaseModel):
-    """Response from prompt validation."""
 
-    valid: bool
-    errors: Dict[str, str]  # Maps prompt name to error message
-    warnings: Dict[str, str]  # Maps prompt name to warning message
+# ConfigManager swaps in a new AppConfig on every change, so the encoded body
+# is rebuilt only after an update.
+_config_body = EncodedBodyCache()
 
 
+# Reads are served from memory and stay on the event loop; the write routes
+# below are plain ``def`` so their config.json writes run in the threadpool.
 @router.get("", response_model=ConfigResponse)
-def get_config(config_manager: ConfigManager = Depends(get_config_manager)):
+async def get_config(request: Request, config_manager: ConfigManagerDep):
     """Get complete configuration."""
-    return ConfigResponse(config=config_manager.get_config())
+    config = config_manager.get_config()
+    return _config_body.response(
+        config,
+        lambda: ConfigResponse.model_construct(config=config)
+        .model_dump_json()
+        .encode(),
+        request.headers.get("if-none-match"),
+    )
 
 
 @router.put("", response_model=ConfigResponse)
-def update_config(
-    config: AppConfig, config_manager: ConfigManager = Depends(get_config_manager)
-):
+def update_config(config: AppConfig, config_manager: ConfigManagerDep):
     """Replace entire configuration.
 
     Note: This does NOT include prompts. Use /api/prompts to edit prompt files.
     """
     return execute_config_action(
-        lambda: ConfigResponse(config=config_manager.update_config(config)),
+        lambda: ConfigResponse.model_construct(
+            config=config_manager.update_config(config)
+        ),
         "Failed to update config",
     )
 
@@ -97,11 +101,11 @@ def update_config(
 @router.patch("/stage-instructions", response_model=ConfigResponse)
 def update_stage_instructions(
     request: UpdateStageInstructionsRequest,
-    config_manager: ConfigManager = Depends(get_config_manager),
+    config_manager: ConfigManagerDep,
 ):
     """Update instructions for a specific stage."""
     return execute_config_action(
-        lambda: ConfigResponse(
+        lambda: ConfigResponse.model_construct(
             config=config_manager.update_stage_instructions(
                 request.stage, request.instructions
             )
@@ -113,12 +117,14 @@ def update_stage_instructions(
 @router.patch("/global-defaults", response_model=ConfigResponse)
 def update_global_defaults(
     request: UpdateGlobalDefaultsRequest,
-    config_manager: ConfigManager = Depends(get_config_manager),
+    config_manager: ConfigManagerDep,
 ):
     """Update global default parameters."""
-    updates = {k: v for k, v in request.model_dump().items() if v is not None}
+    updates = request.model_dump(exclude_unset=True, exclude_none=True)
     return execute_config_action(
-        lambda: ConfigResponse(config=config_manager.update_global_defaults(**updates)),
+        lambda: ConfigResponse.model_construct(
+            config=config_manager.update_global_defaults(**updates)
+        ),
         "Failed to update global defaults",
     )
 
@@ -126,12 +132,14 @@ def update_global_defaults(
 @router.patch("/image", response_model=ConfigResponse)
 def update_image_config(
     request: UpdateImageConfigRequest,
-    config_manager: ConfigManager = Depends(get_config_manager),
+    config_manager: ConfigManagerDep,
 ):
     """Update image configuration."""
-    updates = {k: v for k, v in request.model_dump().items() if v is not None}
+    updates = request.model_dump(exclude_unset=True, exclude_none=True)
     return execute_config_action(
-        lambda: ConfigResponse(config=config_manager.update_image_config(**updates)),
+        lambda: ConfigResponse.model_construct(
+            config=config_manager.update_image_config(**updates)
+        ),
         "Failed to update image config",
     )
 
@@ -139,21 +147,25 @@ def update_image_config(
 @router.patch("/style", response_model=ConfigResponse)
 def update_style_config(
     request: UpdateStyleConfigRequest,
-    config_manager: ConfigManager = Depends(get_config_manager),
+    config_manager: ConfigManagerDep,
 ):
     """Update style configuration."""
-    updates = {k: v for k, v in request.model_dump().items() if v is not None}
+    updates = request.model_dump(exclude_unset=True, exclude_none=True)
     return execute_config_action(
-        lambda: ConfigResponse(config=config_manager.update_style_config(**updates)),
+        lambda: ConfigResponse.model_construct(
+            config=config_manager.update_style_config(**updates)
+        ),
         "Failed to update style config",
     )
 
 
 @router.post("/reset", response_model=ConfigResponse)
-def reset_config(config_manager: ConfigManager = Depends(get_config_manager)):
+def reset_config(config_manager: ConfigManagerDep):
     """Reset entire configuration to defaults."""
     return execute_config_action(
-        lambda: ConfigResponse(config=config_manager.reset_to_defaults()),
+        lambda: ConfigResponse.model_construct(
+            config=config_manager.reset_to_defaults()
+        ),
         "Failed to reset config",
     )
 
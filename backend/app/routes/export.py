@@ -1,22 +1,23 @@
 """Export routes."""
 
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+from pydantic import Field
 
-from app.dependencies import get_export_service
+from app.dependencies import ExportServiceDep
+from app.models._base import RequestBodyModel
 from app.services.export_service import ExportService
 
 router = APIRouter()
 
 
-class ExportRequest(BaseModel):
+class ExportRequest(RequestBodyModel):
     """Request to export a project."""
 
     project_id: str
 
 
-class ExportSlideRequest(BaseModel):
+class ExportSlideRequest(RequestBodyModel):
     """Request to export a single slide."""
 
     project_id: str
@@ -25,6 +26,8 @@ class ExportSlideRequest(BaseModel):
 
 _VALID_FORMATS = {"png", "jpeg", "webp"}
 _FORMAT_MIME = {"png": "image/png", "jpeg": "image/jpeg", "webp": "image/webp"}
+_ZIP_DISPOSITION = "attachment; filename=lucid_carousel_{}.zip".format
+_SLIDE_DISPOSITION = "attachment; filename=slide_{:02d}.{}".format
 
 
 def _normalise_format(fmt: str) -> str:
@@ -34,42 +37,42 @@ def _normalise_format(fmt: str) -> str:
 
 async def _build_zip_response(
     project_id: str, export_service: ExportService, fmt: str = "png"
-) -> StreamingResponse:
-    """Build a ZIP streaming response for a project."""
+) -> Response:
+    """Build a ZIP download response for a project.
+
+    The archive is already fully built in memory, so it is sent as a single
+    body rather than iterated through ``StreamingResponse``, which would split
+    the binary buffer on newline bytes and hop to a thread for every chunk.
+    """
     zip_buffer = await export_service.export_project(project_id, fmt)
     if not zip_buffer:
         raise HTTPException(status_code=404, detail="Project not found or no slides")
 
-    return StreamingResponse(
-        zip_buffer,
+    return Response(
+        content=zip_buffer.getvalue(),
         media_type="application/zip",
-        headers={
-            "Content-Disposition": f"attachment; filename=lucid_carousel_{project_id}.zip"
-        },
+        headers={"Content-Disposition": _ZIP_DISPOSITION(project_id)},
     )
 
 
 async def _build_slide_response(
     project_id: str, slide_index: int, export_service: ExportService, fmt: str = "png"
-) -> StreamingResponse:
-    """Build an image streaming response for a single slide."""
+) -> Response:
+    """Build an image download response for a single slide."""
     image_buffer = await export_service.export_single_slide(project_id, slide_index, fmt)
     if not image_buffer:
         raise HTTPException(status_code=404, detail="Slide not found or no image")
 
     ext = "jpg" if fmt == "jpeg" else fmt
-    filename = f"slide_{slide_index + 1:02d}.{ext}"
-    return StreamingResponse(
-        image_buffer,
+    return Response(
+        content=image_buffer.getvalue(),
         media_type=_FORMAT_MIME.get(fmt, "image/png"),
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        headers={"Content-Disposition": _SLIDE_DISPOSITION(slide_index + 1, ext)},
     )
 
 
 @router.post("/zip")
-async def export_zip(
-    request: ExportRequest, export_service: ExportService = Depends(get_export_service)
-):
+async def export_zip(request: ExportRequest, export_service: ExportServiceDep):
     """Export all slides as a ZIP archive."""
     return await _build_zip_response(request.project_id, export_service)
 
@@ -77,8 +80,8 @@ async def export_zip(
 @router.get("/zip/{project_id}")
 async def export_zip_get(
     project_id: str,
+    export_service: ExportServiceDep,
     format: str = "png",
-    export_service: ExportService = Depends(get_export_service),
 ):
     """Export all slides as a ZIP archive (GET method for direct download).
 
@@ -90,7 +93,7 @@ async def export_zip_get(
 @router.post("/slide")
 async def export_slide(
     request: ExportSlideRequest,
-    export_service: ExportService = Depends(get_export_service),
+    export_service: ExportServiceDep,
 ):
     """Export a single slide as PNG."""
     return await _build_slide_response(
@@ -102,8 +105,8 @@ async def export_slide(
 async def export_slide_get(
     project_id: str,
     slide_index: int,
+    export_service: ExportServiceDep,
     format: str = "png",
-    export_service: ExportService = Depends(get_export_service),
 ):
     """Export a single slide (GET method for direct download).
 
@@ -1,33 +1,51 @@
 """Font management routes."""
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Request
 
-from app.dependencies import get_font_manager
-from app.services.font_manager import FontManager
+from app.dependencies import FontManagerDep
+from app.routes.utils import EncodedBodyCache, ORJSONResponse
 
-router = APIRouter()
+# No route here declares a response model, so FastAPI's Pydantic fast path
+# never applies; encode the plain dicts with orjson instead of json.dumps.
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+# Both keyed on FontManager's cached family list, which is rebuilt on refresh.
+_fonts_body = EncodedBodyCache()
+_mappings_body = EncodedBodyCache()
 
 
 @router.get("/")
-def list_fonts(font_manager: FontManager = Depends(get_font_manager)):
+def list_fonts(request: Request, font_manager: FontManagerDep):
     """List all available fonts."""
-    return {"fonts": font_manager.get_available_fonts()}
+    families = font_manager.get_available_fonts()
+    return _fonts_body.response(
+        families,
+        lambda: orjson.dumps({"fonts": families}),
+        request.headers.get("if-none-match"),
+    )
 
 
 @router.get("/mappings")
-def get_font_mappings(font_manager: FontManager = Depends(get_font_manager)):
+def get_font_mappings(request: Request, font_manager: FontManagerDep):
     """Get all supported font family mappings with available weights."""
-    mappings = {}
-    for family in font_manager.get_available_fonts():
-        weights = font_manager.get_font_weights(family)
-        mappings[family] = {w: f"{family}-{w}" for w in weights}
-    return {"mappings": mappings}
+    families = font_manager.get_available_fonts()
+
+    def _encode() -> bytes:
+        mappings = {}
+        for family in families:
+            weights = font_manager.get_font_weights(family)
+            mappings[family] = {w: f"{family}-{w}" for w in weights}
+        return orjson.dumps({"mappings": mappings}, option=orjson.OPT_NON_STR_KEYS)
+
+    return _mappings_body.response(
+        families, _encode, request.headers.get("if-none-match")
+    )
 
 
 @router.get("/{family}")
-def get_font_weights(
-    family: str, font_manager: FontManager = Depends(get_font_manager)
-):
+def get_font_weights(family: str, font_manager: FontManagerDep):
     """Get available weights for a font family."""
     weights = font_manager.get_font_weights(family)
     return {"family": family, "weights": weights}
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 
 from app.models.matrix import (
@@ -18,14 +17,8 @@ from app.models.matrix import (
     RevalidateRequest,
     UpdateMatrixSettingsRequest,
 )
-from app.dependencies import (
-    get_matrix_db,
-    get_matrix_service,
-    get_matrix_settings_manager,
-)
-from app.services.matrix_db import MatrixDB
-from app.services.matrix_service import MatrixService
-from app.services.matrix_settings_manager import MatrixSettingsManager
+from app.dependencies import MatrixDBDep, MatrixServiceDep, MatrixSettingsManagerDep
+from app.routes.utils import sse_event
 
 logger = logging.getLogger(__name__)
 
@@ -38,38 +31,38 @@ settings_router = APIRouter()
 
 @router.get("/", response_model=MatrixListResponse)
 async def list_matrices(
-    db: MatrixDB = Depends(get_matrix_db),
+    db: MatrixDBDep,
 ) -> MatrixListResponse:
     cards = await db.list_projects()
-    return MatrixListResponse(matrices=cards)
+    return MatrixListResponse.model_construct(matrices=cards)
 
 
 @router.post("/", response_model=MatrixProjectResponse)
 async def create_matrix(
     req: CreateMatrixRequest,
-    service: MatrixService = Depends(get_matrix_service),
+    service: MatrixServiceDep,
 ) -> MatrixProjectResponse:
     """Create a matrix project and launch background generation."""
     project = await service.create_and_start(req)
-    return MatrixProjectResponse(matrix=project)
+    return MatrixProjectResponse.model_construct(matrix=project)
 
 
 @router.get("/{project_id}", response_model=MatrixProjectResponse)
 async def get_matrix(
     project_id: str,
-    db: MatrixDB = Depends(get_matrix_db),
+    db: MatrixDBDep,
 ) -> MatrixProjectResponse:
     project = await db.get_project(project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Matrix not found")
-    return MatrixProjectResponse(matrix=project)
+    return MatrixProjectResponse.model_construct(matrix=project)
 
 
 @router.delete("/{project_id}")
 async def delete_matrix(
     project_id: str,
-    service: MatrixService = Depends(get_matrix_service),
-    db: MatrixDB = Depends(get_matrix_db),
+    service: MatrixServiceDep,
+    db: MatrixDBDep,
 ) -> dict:
     if service.is_generating(project_id):
         await service.cancel_generation(project_id)
@@ -82,7 +75,7 @@ async def delete_matrix(
 @router.post("/{project_id}/cancel")
 async def cancel_matrix(
     project_id: str,
-    service: MatrixService = Depends(get_matrix_service),
+    service: MatrixServiceDep,
 ) -> dict:
     if not service.is_generating(project_id):
         raise HTTPException(status_code=400, detail="Not currently generating")
@@ -93,8 +86,8 @@ async def cancel_matrix(
 @router.post("/{project_id}/generate-images")
 async def generate_images(
     project_id: str,
-    service: MatrixService = Depends(get_matrix_service),
-    db: MatrixDB = Depends(get_matrix_db),
+    service: MatrixServiceDep,
+    db: MatrixDBDep,
 ) -> dict:
     """Trigger image generation for all cells of an existing matrix."""
     project = await db.get_project(project_id)
@@ -114,8 +107,8 @@ async def regenerate_cell(
     row: int,
     col: int,
     req: RegenerateCellRequest,
-    service: MatrixService = Depends(get_matrix_service),
-    db: MatrixDB = Depends(get_matrix_db),
+    service: MatrixServiceDep,
+    db: MatrixDBDep,
 ) -> MatrixProjectResponse:
     project = await db.get_project(project_id)
     if project is None:
@@ -134,15 +127,15 @@ async def regenerate_cell(
     updated = await db.get_project(project_id)
     if updated is None:
         raise HTTPException(status_code=500, detail="Failed to fetch regenerated matrix")
-    return MatrixProjectResponse(matrix=updated)
+    return MatrixProjectResponse.model_construct(matrix=updated)
 
 
 @router.post("/{project_id}/revalidate")
 async def revalidate_matrix(
     project_id: str,
     req: RevalidateRequest,
-    service: MatrixService = Depends(get_matrix_service),
-    db: MatrixDB = Depends(get_matrix_db),
+    service: MatrixServiceDep,
+    db: MatrixDBDep,
 ) -> dict:
     """Trigger a validation-only pass for a complete matrix, with optional user comment."""
     project = await db.get_project(project_id)
@@ -160,13 +153,13 @@ async def revalidate_matrix(
 @router.get("/{project_id}/stream")
 async def stream_matrix(
     project_id: str,
-    service: MatrixService = Depends(get_matrix_service),
+    service: MatrixServiceDep,
 ) -> StreamingResponse:
     """Server-Sent Events stream for live generation updates."""
 
     async def event_generator():
         async for event in service.subscribe(project_id):
-            yield f"data: {json.dumps(event)}\n\n"
+            yield sse_event(event)
 
     return StreamingResponse(
         event_generator(),
@@ -184,27 +177,28 @@ async def stream_matrix(
 
 @settings_router.get("/", response_model=MatrixSettingsResponse)
 async def get_matrix_settings(
-    mgr: MatrixSettingsManager = Depends(get_matrix_settings_manager),
+    mgr: MatrixSettingsManagerDep,
 ) -> MatrixSettingsResponse:
-    return MatrixSettingsResponse(settings=mgr.get())
+    return MatrixSettingsResponse.model_construct(settings=mgr.get())
 
 
+# Plain ``def``: the settings file write runs in FastAPI's threadpool.
 @settings_router.put("/", response_model=MatrixSettingsResponse)
-async def update_matrix_settings(
+def update_matrix_settings(
     req: UpdateMatrixSettingsRequest,
-    mgr: MatrixSettingsManager = Depends(get_matrix_settings_manager),
-    service: MatrixService = Depends(get_matrix_service),
+    mgr: MatrixSettingsManagerDep,
+    service: MatrixServiceDep,
 ) -> MatrixSettingsResponse:
     updated = mgr.update(req.settings)
     service.load_settings(updated)
-    return MatrixSettingsResponse(settings=updated)
+    return MatrixSettingsResponse.model_construct(settings=updated)
 
 
 @settings_router.post("/reset", response_model=MatrixSettingsResponse)
-async def reset_matrix_settings(
-    mgr: MatrixSettingsManager = Depends(get_matrix_settings_manager),
-    service: MatrixService = Depends(get_matrix_service),
+def reset_matrix_settings(
+    mgr: MatrixSettingsManagerDep,
+    service: MatrixServiceDep,
 ) -> MatrixSettingsResponse:
     reset = mgr.reset()
     service.load_settings(reset)
-    return MatrixSettingsResponse(settings=reset)
+    return MatrixSettingsResponse.model_construct(settings=reset)
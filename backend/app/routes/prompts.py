@@ -1,12 +1,13 @@
 """API routes for editing prompt files directly."""
 
-from typing import Dict
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from typing import Dict, List
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from app.dependencies import get_prompt_loader
-from app.services.prompt_loader import PromptLoader
+from app.dependencies import PromptLoaderDep
 from app.services.prompt_validator import validate_prompt, validate_all_prompts
+from app.models._base import RequestBodyModel
 
 router = APIRouter()
 
@@ -17,14 +18,14 @@ class GetPromptsResponse(BaseModel):
     prompts: Dict[str, str]
 
 
-class UpdatePromptRequest(BaseModel):
+class UpdatePromptRequest(RequestBodyModel):
     """Request to update a single prompt file."""
 
     prompt_name: str
     content: str
 
 
-class UpdatePromptsRequest(BaseModel):
+class UpdatePromptsRequest(RequestBodyModel):
     """Request to update multiple prompt files."""
 
     prompts: Dict[str, str]
@@ -39,20 +40,20 @@ class ValidatePromptsResponse(BaseModel):
 
 
 @router.get("", response_model=GetPromptsResponse)
-async def get_prompts(prompt_loader: PromptLoader = Depends(get_prompt_loader)):
+async def get_prompts(prompt_loader: PromptLoaderDep):
     """Load all prompts from .prompt files."""
     try:
-        prompts = prompt_loader.load_all()
+        prompts = await asyncio.to_thread(prompt_loader.load_all)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to read prompts: {e}")
-    return GetPromptsResponse(prompts=prompts)
+    return GetPromptsResponse.model_construct(prompts=prompts)
 
 
 @router.put("/{prompt_name}")
 async def update_prompt(
     prompt_name: str,
     request: UpdatePromptRequest,
-    prompt_loader: PromptLoader = Depends(get_prompt_loader),
+    prompt_loader: PromptLoaderDep,
 ):
     """Update a single prompt file."""
     if not prompt_loader.is_known(prompt_name):
@@ -63,7 +64,7 @@ async def update_prompt(
         raise HTTPException(status_code=400, detail=f"Validation failed: {error_msg}")
 
     try:
-        prompt_loader.save(prompt_name, request.content)
+        await asyncio.to_thread(prompt_loader.save, prompt_name, request.content)
         return {"message": f"Updated {prompt_name}"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to write {prompt_name}: {e}")
@@ -72,12 +73,14 @@ async def update_prompt(
 @router.patch("")
 async def update_prompts(
     request: UpdatePromptsRequest,
-    prompt_loader: PromptLoader = Depends(get_prompt_loader),
+    prompt_loader: PromptLoaderDep,
 ):
-    """Update multiple prompt files at once."""
-    updated_count = 0
-    errors = []
+    """Update multiple prompt files at once.
 
+    Every prompt is validated before any file is written, so a bad entry
+    leaves all prompt files untouched.
+    """
+    errors = []
     for name, content in request.prompts.items():
         if not prompt_loader.is_known(name):
             errors.append(f"Unknown prompt: {name}")
@@ -86,18 +89,25 @@ async def update_prompts(
         is_valid, error_msg = validate_prompt(name, content)
         if not is_valid:
             errors.append(f"{name}: {error_msg}")
-            continue
 
-        try:
-            prompt_loader.save(name, content)
-            updated_count += 1
-        except Exception as e:
-            errors.append(f"{name}: Failed to write - {e}")
+    if errors:
+        raise HTTPException(status_code=400, detail="; ".join(errors))
 
+    def _write_all() -> List[str]:
+        write_errors = []
+        for name, content in request.prompts.items():
+            try:
+                prompt_loader.save(name, content)
+            except Exception as e:
+                write_errors.append(f"{name}: Failed to write - {e}")
+        return write_errors
+
+    # One thread hop for the whole batch rather than one per file.
+    errors = await asyncio.to_thread(_write_all)
     if errors:
         raise HTTPException(status_code=400, detail="; ".join(errors))
 
-    return {"message": f"Updated {updated_count} prompt files"}
+    return {"message": f"Updated {len(request.prompts)} prompt files"}
 
 
 @router.post("/validate", response_model=ValidatePromptsResponse)
@@ -115,7 +125,7 @@ async def validate_prompts_endpoint(request: UpdatePromptsRequest):
             else:
                 warnings[name] = message
 
-        return ValidatePromptsResponse(
+        return ValidatePromptsResponse.model_construct(
             valid=len(errors) == 0, errors=errors, warnings=warnings
         )
     except Exception as e:
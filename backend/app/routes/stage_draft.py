@@ -1,38 +1,37 @@
 """Stage Draft routes - Draft to Slide texts."""
 
-import json
 import logging
 from typing import Optional
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import RequestBodyModel
 from app.models.config import WordsPerSlide
 from app.models.project import ProjectResponse
-from app.dependencies import get_stage_draft_service
-from app.services.stage_draft_service import StageDraftService
-from app.routes.utils import execute_service_action
+from app.dependencies import StageDraftServiceDep
+from app.routes.utils import execute_service_action, limit_batch_generation, sse_event
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-class GenerateSlideTextsRequest(BaseModel):
+class GenerateSlideTextsRequest(RequestBodyModel):
     """Request to generate slide texts from a draft."""
 
     project_id: str
     draft_text: str = Field(min_length=1, max_length=500_000, description="The draft text to transform")
     num_slides: Optional[int] = Field(default=None, ge=1, le=20)
-    include_titles: bool = Field(default=True)
+    include_titles: bool = True
     additional_instructions: Optional[str] = None
-    language: str = Field(default="English")
+    language: str = "English"
     words_per_slide: Optional[WordsPerSlide] = Field(
         default=None,
         description="Word count hint: 'short', 'medium', 'long', 'keep_as_is', or None (AI decides)",
     )
 
 
-class RegenerateSlideTextRequest(BaseModel):
+class RegenerateSlideTextRequest(RequestBodyModel):
     """Request to regenerate a single slide text."""
 
     project_id: str
@@ -40,7 +39,7 @@ class RegenerateSlideTextRequest(BaseModel):
     instruction: Optional[str] = None
 
 
-class UpdateSlideTextRequest(BaseModel):
+class UpdateSlideTextRequest(RequestBodyModel):
     """Request to update a slide's text."""
 
     project_id: str
@@ -49,16 +48,20 @@ class UpdateSlideTextRequest(BaseModel):
     body: Optional[str] = None
 
 
-class RegenerateAllRequest(BaseModel):
+class RegenerateAllRequest(RequestBodyModel):
     """Request to regenerate all slide texts."""
 
     project_id: str
 
 
-@router.post("/generate", response_model=ProjectResponse)
+@router.post(
+    "/generate",
+    response_model=ProjectResponse,
+    dependencies=[Depends(limit_batch_generation)],
+)
 async def generate_slide_texts(
     request: GenerateSlideTextsRequest,
-    stage_draft_service: StageDraftService = Depends(get_stage_draft_service),
+    stage_draft_service: StageDraftServiceDep,
 ):
     """Generate slide texts from a draft."""
 
@@ -81,10 +84,14 @@ async def generate_slide_texts(
     return await execute_service_action(_action, "Failed to generate slide texts")
 
 
-@router.post("/regenerate-all", response_model=ProjectResponse)
+@router.post(
+    "/regenerate-all",
+    response_model=ProjectResponse,
+    dependencies=[Depends(limit_batch_generation)],
+)
 async def regenerate_all_slide_texts(
     request: RegenerateAllRequest,
-    stage_draft_service: StageDraftService = Depends(get_stage_draft_service),
+    stage_draft_service: StageDraftServiceDep,
 ):
     """Regenerate all slide texts."""
     return await execute_service_action(
@@ -98,7 +105,7 @@ async def regenerate_all_slide_texts(
 @router.post("/regenerate", response_model=ProjectResponse)
 async def regenerate_slide_text(
     request: RegenerateSlideTextRequest,
-    stage_draft_service: StageDraftService = Depends(get_stage_draft_service),
+    stage_draft_service: StageDraftServiceDep,
 ):
     """Regenerate a single slide text."""
     return await execute_service_action(
@@ -114,7 +121,7 @@ async def regenerate_slide_text(
 @router.post("/update", response_model=ProjectResponse)
 async def update_slide_text(
     request: UpdateSlideTextRequest,
-    stage_draft_service: StageDraftService = Depends(get_stage_draft_service),
+    stage_draft_service: StageDraftServiceDep,
 ):
     """Manually update a slide's text."""
     return await execute_service_action(
@@ -131,7 +138,7 @@ async def update_slide_text(
 @router.post("/regenerate-stream")
 async def regenerate_slide_text_stream(
     request: RegenerateSlideTextRequest,
-    stage_draft_service: StageDraftService = Depends(get_stage_draft_service),
+    stage_draft_service: StageDraftServiceDep,
 ):
     """Stream body-text regeneration for a single slide via Server-Sent Events.
 
@@ -144,9 +151,9 @@ async def regenerate_slide_text_stream(
         async for accumulated in stage_draft_service.regenerate_slide_text_stream(
             request.project_id, request.slide_index, request.instruction
         ):
-            yield f"data: {json.dumps({'text': accumulated})}\n\n"
+            yield sse_event({"text": accumulated})
 
-        yield f"data: {json.dumps({'done': True})}\n\n"
+        yield sse_event({"done": True})
 
     return StreamingResponse(
         event_stream(),
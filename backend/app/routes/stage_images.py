@@ -1,17 +1,18 @@
 """Stage Images routes - Image prompts to Images."""
 
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from pydantic import Field
 
+from app.models._base import RequestBodyModel
 from app.models.project import ProjectResponse
-from app.dependencies import get_stage_images_service
-from app.services.stage_images_service import StageImagesService
-from app.routes.utils import execute_service_action
+from app.dependencies import StageImagesServiceDep
+from app.routes.utils import execute_service_action, limit_batch_generation, sse_event
 
 router = APIRouter()
 
 
-class GenerateImagesRequest(BaseModel):
+class GenerateImagesRequest(RequestBodyModel):
     """Request to generate images for all slides."""
 
     project_id: str
@@ -23,14 +24,14 @@ class GenerateImagesRequest(BaseModel):
     )
 
 
-class RegenerateImageRequest(BaseModel):
+class RegenerateImageRequest(RequestBodyModel):
     """Request to regenerate a single image."""
 
     project_id: str
     slide_index: int = Field(ge=0)
 
 
-class SetImageRequest(BaseModel):
+class SetImageRequest(RequestBodyModel):
     """Request to set image data directly."""
 
     project_id: str
@@ -38,10 +39,14 @@ class SetImageRequest(BaseModel):
     image_data: str = Field(min_length=1, description="Base64 encoded image data")
 
 
-@router.post("/generate", response_model=ProjectResponse)
+@router.post(
+    "/generate",
+    response_model=ProjectResponse,
+    dependencies=[Depends(limit_batch_generation)],
+)
 async def generate_all_images(
     request: GenerateImagesRequest,
-    stage_images_service: StageImagesService = Depends(get_stage_images_service),
+    stage_images_service: StageImagesServiceDep,
 ):
     """Generate images for all slides."""
     return await execute_service_action(
@@ -53,10 +58,45 @@ async def generate_all_images(
     )
 
 
+@router.post(
+    "/generate-stream", dependencies=[Depends(limit_batch_generation)]
+)
+async def generate_all_images_stream(
+    request: GenerateImagesRequest,
+    stage_images_service: StageImagesServiceDep,
+):
+    """Generate images for all slides, streaming progress via Server-Sent Events.
+
+    Emits one ``{"index", "background_image_url"}`` (or ``{"index", "error"}``)
+    event per slide as it completes, then ``{"project": {...}}`` with the saved
+    state, followed by a final ``{"done": true}``. A missing or empty project
+    produces only the ``done`` event. Persistence is handled by the service.
+    """
+
+    async def event_stream():
+        async for event in stage_images_service.stream_all_images(
+            project_id=request.project_id,
+            concurrency_limit=request.concurrency_limit,
+        ):
+            yield sse_event(event)
+
+        yield sse_event({"done": True})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "Connection": "keep-alive",
+        },
+    )
+
+
 @router.post("/regenerate", response_model=ProjectResponse)
 async def regenerate_image(
     request: RegenerateImageRequest,
-    stage_images_service: StageImagesService = Depends(get_stage_images_service),
+    stage_images_service: StageImagesServiceDep,
 ):
     """Regenerate image for a single slide."""
     return await execute_service_action(
@@ -71,7 +111,7 @@ async def regenerate_image(
 @router.post("/upload", response_model=ProjectResponse)
 async def set_image(
     request: SetImageRequest,
-    stage_images_service: StageImagesService = Depends(get_stage_images_service),
+    stage_images_service: StageImagesServiceDep,
 ):
     """Set image data directly (for custom uploads)."""
     return await execute_service_action(
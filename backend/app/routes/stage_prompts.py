@@ -2,17 +2,17 @@
 
 from typing import Optional
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import RequestBodyModel
 from app.models.project import ProjectResponse
-from app.dependencies import get_stage_prompts_service
-from app.services.stage_prompts_service import StagePromptsService
-from app.routes.utils import execute_service_action
+from app.dependencies import StagePromptsServiceDep
+from app.routes.utils import execute_service_action, limit_batch_generation
 
 router = APIRouter()
 
 
-class GeneratePromptsRequest(BaseModel):
+class GeneratePromptsRequest(RequestBodyModel):
     """Request to generate image prompts."""
 
     project_id: str
@@ -28,7 +28,7 @@ class GeneratePromptsRequest(BaseModel):
     )
 
 
-class RegeneratePromptRequest(BaseModel):
+class RegeneratePromptRequest(RequestBodyModel):
     """Request to regenerate a single prompt."""
 
     project_id: str
@@ -39,7 +39,7 @@ class RegeneratePromptRequest(BaseModel):
     )
 
 
-class UpdatePromptRequest(BaseModel):
+class UpdatePromptRequest(RequestBodyModel):
     """Request to update a prompt."""
 
     project_id: str
@@ -47,17 +47,21 @@ class UpdatePromptRequest(BaseModel):
     prompt: str = Field(min_length=1)
 
 
-class UpdateStyleRequest(BaseModel):
+class UpdateStyleRequest(RequestBodyModel):
     """Request to update style instructions."""
 
     project_id: str
     style_instructions: str
 
 
-@router.post("/generate", response_model=ProjectResponse)
+@router.post(
+    "/generate",
+    response_model=ProjectResponse,
+    dependencies=[Depends(limit_batch_generation)],
+)
 async def generate_all_prompts(
     request: GeneratePromptsRequest,
-    stage_prompts_service: StagePromptsService = Depends(get_stage_prompts_service),
+    stage_prompts_service: StagePromptsServiceDep,
 ):
     """Generate image prompts for all slides."""
     return await execute_service_action(
@@ -73,7 +77,7 @@ async def generate_all_prompts(
 @router.post("/regenerate", response_model=ProjectResponse)
 async def regenerate_prompt(
     request: RegeneratePromptRequest,
-    stage_prompts_service: StagePromptsService = Depends(get_stage_prompts_service),
+    stage_prompts_service: StagePromptsServiceDep,
 ):
     """Regenerate image prompt for a single slide."""
     return await execute_service_action(
@@ -89,7 +93,7 @@ async def regenerate_prompt(
 @router.post("/update", response_model=ProjectResponse)
 async def update_prompt(
     request: UpdatePromptRequest,
-    stage_prompts_service: StagePromptsService = Depends(get_stage_prompts_service),
+    stage_prompts_service: StagePromptsServiceDep,
 ):
     """Manually update an image prompt."""
     return await execute_service_action(
@@ -105,7 +109,7 @@ async def update_prompt(
 @router.post("/style", response_model=ProjectResponse)
 async def update_style(
     request: UpdateStyleRequest,
-    stage_prompts_service: StagePromptsService = Depends(get_stage_prompts_service),
+    stage_prompts_service: StagePromptsServiceDep,
 ):
     """Update the shared style instructions."""
     return await execute_service_action(
@@ -2,25 +2,25 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from fastapi import APIRouter
+from pydantic import Field
 
+from app.models._base import RequestBodyModel
 from app.models.project import ProjectResponse
-from app.dependencies import get_stage_research_service
-from app.services.stage_research_service import StageResearchService
+from app.dependencies import StageResearchServiceDep
 from app.routes.utils import execute_service_action
 
 router = APIRouter()
 
 
-class ResearchChatRequest(BaseModel):
+class ResearchChatRequest(RequestBodyModel):
     """Request body for the chat endpoint."""
 
     project_id: str
     message: str = Field(min_length=1, description="User message to send to the AI")
 
 
-class ExtractDraftRequest(BaseModel):
+class ExtractDraftRequest(RequestBodyModel):
     """Request body for the extract-draft endpoint."""
 
     project_id: str
@@ -33,7 +33,7 @@ class ExtractDraftRequest(BaseModel):
 @router.post("/chat", response_model=ProjectResponse)
 async def research_chat(
     request: ResearchChatRequest,
-    stage_research_service: StageResearchService = Depends(get_stage_research_service),
+    stage_research_service: StageResearchServiceDep,
 ):
     """Send a user message and receive a search-grounded AI reply."""
     return await execute_service_action(
@@ -48,7 +48,7 @@ async def research_chat(
 @router.post("/extract-draft", response_model=ProjectResponse)
 async def extract_draft(
     request: ExtractDraftRequest,
-    stage_research_service: StageResearchService = Depends(get_stage_research_service),
+    stage_research_service: StageResearchServiceDep,
 ):
     """Summarise the research conversation into a draft and advance to Stage Draft."""
     return await execute_service_action(
@@ -2,17 +2,17 @@
 
 from typing import Optional
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import RequestBodyModel
 from app.models.project import ProjectResponse
-from app.dependencies import get_stage_style_service
-from app.services.stage_style_service import StageStyleService
-from app.routes.utils import execute_service_action
+from app.dependencies import StageStyleServiceDep
+from app.routes.utils import execute_service_action, limit_batch_generation
 
 router = APIRouter()
 
 
-class GenerateProposalsRequest(BaseModel):
+class GenerateProposalsRequest(RequestBodyModel):
     """Request to generate style proposals."""
 
     project_id: str
@@ -26,17 +26,21 @@ class GenerateProposalsRequest(BaseModel):
     )
 
 
-class SelectProposalRequest(BaseModel):
+class SelectProposalRequest(RequestBodyModel):
     """Request to select a style proposal."""
 
     project_id: str
     proposal_index: int = Field(ge=0)
 
 
-@router.post("/generate", response_model=ProjectResponse)
+@router.post(
+    "/generate",
+    response_model=ProjectResponse,
+    dependencies=[Depends(limit_batch_generation)],
+)
 async def generate_proposals(
     request: GenerateProposalsRequest,
-    stage_style_service: StageStyleService = Depends(get_stage_style_service),
+    stage_style_service: StageStyleServiceDep,
 ):
     """Generate style proposals with preview images."""
     return await execute_service_action(
@@ -53,7 +57,7 @@ async def generate_proposals(
 @router.post("/select", response_model=ProjectResponse)
 async def select_proposal(
     request: SelectProposalRequest,
-    stage_style_service: StageStyleService = Depends(get_stage_style_service),
+    stage_style_service: StageStyleServiceDep,
 ):
     """Select a style proposal."""
     return await execute_service_action(
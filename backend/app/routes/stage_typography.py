@@ -1,39 +1,39 @@
 """Stage Typography routes - Typography/Layout rendering."""
 
 from typing import Dict, Any
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from fastapi import APIRouter
+from pydantic import Field
 
+from app.models._base import RequestBodyModel
 from app.models.project import ProjectResponse
-from app.dependencies import get_stage_typography_service
-from app.services.stage_typography_service import StageTypographyService
+from app.dependencies import StageTypographyServiceDep
 from app.routes.utils import execute_service_action
 
 router = APIRouter()
 
 
-class ApplyTextRequest(BaseModel):
+class ApplyTextRequest(RequestBodyModel):
     """Request to apply text to images."""
 
     project_id: str
-    use_ai_suggestions: bool = Field(default=True)
+    use_ai_suggestions: bool = True
 
 
-class ApplyTextSingleRequest(BaseModel):
+class ApplyTextSingleRequest(RequestBodyModel):
     """Request to apply text to a single image."""
 
     project_id: str
     slide_index: int = Field(ge=0)
 
 
-class SuggestStyleRequest(BaseModel):
+class SuggestStyleRequest(RequestBodyModel):
     """Request to get AI style suggestions."""
 
     project_id: str
     slide_index: int = Field(ge=0)
 
 
-class UpdateStyleRequest(BaseModel):
+class UpdateStyleRequest(RequestBodyModel):
     """Request to update style properties."""
 
     project_id: str
@@ -41,7 +41,7 @@ class UpdateStyleRequest(BaseModel):
     style: Dict[str, Any] = Field(description="Style properties to update")
 
 
-class ApplyStyleAllRequest(BaseModel):
+class ApplyStyleAllRequest(RequestBodyModel):
     """Request to apply style to all slides."""
 
     project_id: str
@@ -51,7 +51,7 @@ class ApplyStyleAllRequest(BaseModel):
 @router.post("/apply-all", response_model=ProjectResponse)
 async def apply_text_to_all(
     request: ApplyTextRequest,
-    stage_typography_service: StageTypographyService = Depends(get_stage_typography_service),
+    stage_typography_service: StageTypographyServiceDep,
 ):
     """Apply text styling to all slide images."""
     return await execute_service_action(
@@ -66,7 +66,7 @@ async def apply_text_to_all(
 @router.post("/apply", response_model=ProjectResponse)
 async def apply_text_to_image(
     request: ApplyTextSingleRequest,
-    stage_typography_service: StageTypographyService = Depends(get_stage_typography_service),
+    stage_typography_service: StageTypographyServiceDep,
 ):
     """Apply text styling to a single slide image."""
     return await execute_service_action(
@@ -81,7 +81,7 @@ async def apply_text_to_image(
 @router.post("/suggest", response_model=ProjectResponse)
 async def suggest_style(
     request: SuggestStyleRequest,
-    stage_typography_service: StageTypographyService = Depends(get_stage_typography_service),
+    stage_typography_service: StageTypographyServiceDep,
 ):
     """Get AI suggestions for text styling."""
     return await execute_service_action(
@@ -96,7 +96,7 @@ async def suggest_style(
 @router.post("/update-style", response_model=ProjectResponse)
 async def update_style(
     request: UpdateStyleRequest,
-    stage_typography_service: StageTypographyService = Depends(get_stage_typography_service),
+    stage_typography_service: StageTypographyServiceDep,
 ):
     """Update style properties for a slide."""
     return await execute_service_action(
@@ -112,7 +112,7 @@ async def update_style(
 @router.post("/apply-style-all", response_model=ProjectResponse)
 async def apply_style_to_all(
     request: ApplyStyleAllRequest,
-    stage_typography_service: StageTypographyService = Depends(get_stage_typography_service),
+    stage_typography_service: StageTypographyServiceDep,
 ):
     """Apply style updates to all slides."""
     return await execute_service_action(
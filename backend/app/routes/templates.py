@@ -1,32 +1,31 @@
 """Template management routes — /api/templates."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 
-from app.dependencies import get_template_manager
+from app.dependencies import TemplateManagerDep
 from app.models.project import (
     CreateTemplateRequest,
     TemplateData,
     TemplateListResponse,
     UpdateTemplateRequest,
 )
-from app.services.template_manager import TemplateManager
 
 router = APIRouter()
 
 
 @router.get("/", response_model=TemplateListResponse)
 async def list_templates(
-    template_manager: TemplateManager = Depends(get_template_manager),
+    template_manager: TemplateManagerDep,
 ):
     """Return all templates."""
     templates = await template_manager.list_templates()
-    return {"templates": templates}
+    return TemplateListResponse.model_construct(templates=templates)
 
 
 @router.post("/", response_model=TemplateData)
 async def create_template(
     request: CreateTemplateRequest,
-    template_manager: TemplateManager = Depends(get_template_manager),
+    template_manager: TemplateManagerDep,
 ):
     """Create a new template."""
     template = await template_manager.create_template(
@@ -40,7 +39,7 @@ async def create_template(
 @router.get("/{template_id}", response_model=TemplateData)
 async def get_template(
     template_id: str,
-    template_manager: TemplateManager = Depends(get_template_manager),
+    template_manager: TemplateManagerDep,
 ):
     """Return a single template by ID."""
     template = await template_manager.get_template(template_id)
@@ -53,7 +52,7 @@ async def get_template(
 async def update_template(
     template_id: str,
     request: UpdateTemplateRequest,
-    template_manager: TemplateManager = Depends(get_template_manager),
+    template_manager: TemplateManagerDep,
 ):
     """Update a template's fields."""
     template = await template_manager.update_template(
@@ -70,7 +69,7 @@ async def update_template(
 @router.delete("/{template_id}")
 async def delete_template(
     template_id: str,
-    template_manager: TemplateManager = Depends(get_template_manager),
+    template_manager: TemplateManagerDep,
 ):
     """Delete a template."""
     deleted = await template_manager.delete_template(template_id)
@@ -1,10 +1,15 @@
 """Shared route handler utilities to reduce boilerplate."""
 
+import hashlib
+import ipaddress
 import logging
-from typing import Awaitable, Callable, Optional, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
-from fastapi import HTTPException
+import orjson
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse, Response
 
+from app.config import GENERATION_MAX_IN_FLIGHT_PER_IP, TRUSTED_PROXIES
 from app.models.project import ProjectResponse, ProjectState
 from app.services.gemini_service import GeminiError
 
@@ -13,6 +18,147 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module.
+
+    Defined locally because FastAPI's own ``ORJSONResponse`` is deprecated.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def sse_event(payload: Any) -> bytes:
+    """Encode *payload* as a single Server-Sent Events ``data:`` frame.
+
+    Frames are built as bytes so ``StreamingResponse`` sends them without a
+    further ``str`` to UTF-8 encode per chunk.
+    """
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+class EncodedBodyCache:
+    """Memoise an encoded JSON response body on the identity of its source.
+
+    For payloads whose source object is replaced (never mutated) on change —
+    e.g. ``ConfigManager.config`` or ``FontManager``'s font list — so an
+    identity check is a complete invalidation test. The source is held by
+    reference, which keeps its ``id`` from being reused.
+
+    Each body carries a weak ETag derived from its bytes, so a client that
+    revalidates with ``If-None-Match`` gets an empty 304 instead of the body.
+    """
+
+    def __init__(self) -> None:
+        self._source: Any = None
+        self._body: bytes = b""
+        self._etag: str = ""
+
+    def response(
+        self,
+        source: Any,
+        encode: Callable[[], bytes],
+        if_none_match: Optional[str] = None,
+    ) -> Response:
+        """Return a JSON response for *source*, calling *encode* only on change."""
+        if source is not self._source or not self._body:
+            self._body = encode()
+            self._etag = f'W/"{hashlib.blake2b(self._body, digest_size=8).hexdigest()}"'
+            self._source = source
+        headers = {"ETag": self._etag, "Cache-Control": "no-cache"}
+        if if_none_match and _etag_matches(if_none_match, self._etag):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=self._body, media_type="application/json", headers=headers
+        )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of *etag* against an ``If-None-Match`` header value."""
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque
+        for tag in (t.strip() for t in if_none_match.split(","))
+    )
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in TRUSTED_PROXIES)
+
+
+def client_address(request: Request) -> str:
+    """Return the address per-client limits should key on.
+
+    The TCP peer, unless it is one of ``TRUSTED_PROXIES``: then the
+    ``X-Forwarded-For`` hops are walked right to left and the first one that
+    is not itself a trusted proxy wins. Hops further left were supplied by
+    the client and could be forged, so they are never used.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(peer):
+        return peer
+    forwarded = request.headers.get("x-forwarded-for", "")
+    for hop in reversed([h.strip() for h in forwarded.split(",") if h.strip()]):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return peer
+
+
+class InFlightLimiter:
+    """Per-key count of running requests, refused beyond *max_in_flight*.
+
+    Counts live on the event loop thread only, so no lock is needed. A
+    *max_in_flight* of 0 admits everything.
+    """
+
+    def __init__(self, max_in_flight: int) -> None:
+        self._max = max_in_flight
+        self._in_flight: dict[str, int] = {}
+
+    def try_acquire(self, key: str) -> bool:
+        count = self._in_flight.get(key, 0)
+        if self._max and count >= self._max:
+            return False
+        self._in_flight[key] = count + 1
+        return True
+
+    def release(self, key: str) -> None:
+        count = self._in_flight.get(key, 0) - 1
+        if count > 0:
+            self._in_flight[key] = count
+        else:
+            self._in_flight.pop(key, None)
+
+
+_generation_limiter = InFlightLimiter(GENERATION_MAX_IN_FLIGHT_PER_IP)
+
+
+async def limit_batch_generation(request: Request) -> AsyncIterator[None]:
+    """Route dependency holding a per-client batch-generation slot for the request.
+
+    Clients are told apart by ``client_address``, so behind a proxy listed in
+    ``TRUSTED_PROXIES`` each browser gets its own slots rather than all of
+    them sharing the proxy's. The slot is released once the response has been
+    sent (yield-dependency teardown has run after the body since FastAPI
+    0.118), so a streamed generation keeps it until its last event.
+    """
+    client_ip = client_address(request)
+    if not _generation_limiter.try_acquire(client_ip):
+        raise HTTPException(
+            status_code=429,
+            detail="A generation is already running. Wait for it to finish.",
+            headers={"Retry-After": "5"},
+        )
+    try:
+        yield
+    finally:
+        _generation_limiter.release(client_ip)
+
+
 async def execute_service_action(
     action: Callable[[], Awaitable[Optional[ProjectState]]],
     error_message: str,
@@ -21,12 +167,12 @@ async def execute_service_action(
 
     This utility wraps the repetitive pattern of:
     1. Executing an async service method.
-    2. Catching specific GeminiErrors to propagate them.
-    3. Catching generic exceptions for 500 logging.
-    4. Validating the project exists before returning a model_dump.
+    2. Letting GeminiErrors propagate to the app-level 503 handler.
+    3. Mapping ValueError to 400 and logging anything else as a 500.
+    4. Turning a missing project into a 404.
 
     Returns:
-        A dictionary containing the serialised project state.
+        A ``ProjectResponse`` wrapping the service's project as-is.
     """
     try:
         project = await action()
@@ -39,7 +185,7 @@ async def execute_service_action(
         raise HTTPException(status_code=500, detail=error_message)
     if not project:
         raise HTTPException(status_code=404, detail=error_message)
-    return ProjectResponse(project=project)
+    return ProjectResponse.model_construct(project=project)
 
 
 def execute_config_action(action: Callable[[], T], error_message: str = "Config error") -> T:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Coroutine, List, TypeVar, Union
+from typing import Any, AsyncIterator, Coroutine, List, Tuple, TypeVar, Union
 
 T = TypeVar("T")
 
@@ -23,18 +23,67 @@ async def bounded_gather(
         limit: Maximum number to run concurrently.
         return_exceptions: If True, exceptions are returned as results rather
             than propagated. Allows partial success — callers should check each
-            result with ``isinstance(result, BaseException)``.
+            result with ``isinstance(result, BaseException)``. If False, the
+            first exception is raised and every sibling still running or
+            queued is cancelled, so a failed batch stops spending API calls.
     """
     if limit < 1:
         raise ValueError(f"limit must be >= 1, got {limit}")
     sem = asyncio.Semaphore(limit)
 
     async def _run(coro: Coroutine[Any, Any, T]) -> T:
-        async with sem:
-            return await coro
-
-    return list(
-        await asyncio.gather(
-            *(_run(c) for c in coros), return_exceptions=return_exceptions
-        )
-    )
+        try:
+            async with sem:
+                return await coro
+        finally:
+            # No-op once awaited; closes coroutines cancelled before they started.
+            coro.close()
+
+    if return_exceptions:
+        return list(await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True))
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_run(c)) for c in coros]
+    except BaseExceptionGroup as eg:
+        # Callers catch concrete types (GeminiError, ValueError); keep that contract.
+        raise eg.exceptions[0] from None
+    return [t.result() for t in tasks]
+
+
+async def bounded_as_completed(
+    coros: List[Coroutine[Any, Any, T]],
+    limit: int,
+) -> AsyncIterator[Tuple[int, Union[T, Exception]]]:
+    """Yield ``(index, result)`` pairs as coroutines finish, *limit* at a time.
+
+    The streaming counterpart of ``bounded_gather(..., return_exceptions=True)``:
+    a coroutine that raises yields its exception in place of a result, and
+    *index* is its position in *coros*. Closing the iterator early cancels
+    every coroutine still pending.
+
+    Args:
+        coros: Coroutines to run.
+        limit: Maximum number to run concurrently.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be >= 1, got {limit}")
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(index: int, coro: Coroutine[Any, Any, T]) -> Tuple[int, Any]:
+        try:
+            async with sem:
+                return index, await coro
+        except Exception as exc:
+            return index, exc
+        finally:
+            # No-op once awaited; closes coroutines cancelled before they started.
+            coro.close()
+
+    tasks = [asyncio.ensure_future(_run(i, c)) for i, c in enumerate(coros)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -30,9 +30,8 @@ class ConfigManager:
         """
         if self.config_file.exists():
             try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                config = AppConfig(**data)
+                # One raw read; Pydantic parses and validates the JSON in one pass.
+                config = AppConfig.model_validate_json(self.config_file.read_bytes())
                 logger.info(f"Loaded configuration from {self.config_file}")
                 return config
             except Exception as e:
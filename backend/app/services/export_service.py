@@ -110,7 +110,11 @@ class ExportService(BaseStageService):
                     raw_bytes = self.storage_service.read_image_bytes(image_data)
                     image_bytes, ext = self._convert_image(raw_bytes, fmt)
                     filename = self._generate_filename(slide.index, slide.text.title, ext)
-                    zip_file.writestr(f"slides/{filename}", image_bytes)
+                    # PNG/JPEG/WebP are already compressed; deflating them
+                    # again costs CPU for no size gain.
+                    zip_file.writestr(
+                        f"slides/{filename}", image_bytes, compress_type=zipfile.ZIP_STORED
+                    )
                 except Exception as e:
                     logger.error("Error adding slide %d: %s", slide.index, e, exc_info=True)
 
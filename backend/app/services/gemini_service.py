@@ -1,12 +1,22 @@
 """Gemini AI service for text generation (google.genai SDK)."""
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
 import re
-from typing import AsyncGenerator, List, Optional, Dict, Any
-
-from app.config import GOOGLE_API_KEY, GEMINI_TEXT_MODEL
+import threading
+import time
+import weakref
+from typing import AsyncGenerator, AsyncIterator, List, Optional, Dict, Any
+
+from app.config import (
+    GOOGLE_API_KEY,
+    GEMINI_MAX_CONCURRENCY,
+    GEMINI_MAX_RPM,
+    GEMINI_TEXT_MODEL,
+)
 from app.services.llm_logger import log_llm_method
 
 logger = logging.getLogger(__name__)
@@ -18,6 +28,118 @@ class GeminiError(Exception):
     pass
 
 
+# Idle keep-alive lifetime for pooled Gemini API connections.
+_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+@functools.lru_cache(maxsize=1)
+def get_genai_client() -> Any:
+    """Return the process-wide ``google.genai`` client.
+
+    Text and image generation share one client, and with it one HTTP
+    connection pool, so keep-alive connections to the API are reused across
+    services instead of each opening its own.
+    """
+    import httpx
+    from google import genai
+    from google.genai import types
+
+    # Keep one idle connection per concurrency slot, and hold it well past
+    # httpx's 5 s default: consecutive stage calls are often further apart
+    # than that, and every expired connection costs a fresh TLS handshake.
+    limits = httpx.Limits(
+        max_connections=max(100, GEMINI_MAX_CONCURRENCY),
+        max_keepalive_connections=GEMINI_MAX_CONCURRENCY,
+        keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    return genai.Client(
+        api_key=GOOGLE_API_KEY,
+        http_options=types.HttpOptions(client_args={"limits": limits}),
+    )
+
+
+# Services holding a reference to the shared client, reset when it is closed.
+_client_holders: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def acquire_genai_client(holder: Any) -> Any:
+    """Return the shared client and remember *holder* as a user of it.
+
+    *holder* must expose ``_client`` and ``_configured``; ``close_genai_client``
+    clears both so the next call configures against a fresh client instead of
+    the closed pool.
+    """
+    client = get_genai_client()
+    _client_holders.add(holder)
+    return client
+
+
+def close_genai_client() -> None:
+    """Close the shared client's connection pool if it was ever created."""
+    for holder in list(_client_holders):
+        holder._client = None
+        holder._configured = False
+    _client_holders.clear()
+    if get_genai_client.cache_info().currsize:
+        get_genai_client().close()
+        get_genai_client.cache_clear()
+
+
+class _RequestPacer:
+    """Token bucket pacing Gemini request starts to a per-minute budget.
+
+    Callers reserve a token up front and sleep for the returned delay, so a
+    large batch is spread across the quota window instead of bursting past
+    it and paying for 429s. Only touched from the event loop, so no lock.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self._rate = per_minute / 60.0
+        self._capacity = float(per_minute)
+        self._tokens = float(per_minute)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+
+_pacer = _RequestPacer(GEMINI_MAX_RPM) if GEMINI_MAX_RPM else None
+
+# One semaphore per event loop: asyncio primitives bind to the loop they
+# first block on, and the test suite runs several loops in one process.
+_gemini_slots: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+@contextlib.asynccontextmanager
+async def gemini_slot() -> AsyncIterator[None]:
+    """Hold one of the process-wide Gemini request slots.
+
+    Every request to the Gemini API — text, chat, tools, streaming and
+    images — runs inside a slot, so at most ``GEMINI_MAX_CONCURRENCY`` calls
+    are outstanding no matter how many generations run at once. When
+    ``GEMINI_MAX_RPM`` is set, request starts are also paced to that budget.
+    """
+    loop = asyncio.get_running_loop()
+    slot = _gemini_slots.get(loop)
+    if slot is None:
+        slot = _gemini_slots[loop] = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+    async with slot:
+        if _pacer is not None:
+            delay = _pacer.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        yield
+
+
 class GeminiService:
     """Service for interacting with Google Gemini API via google.genai."""
 
@@ -37,9 +159,7 @@ class GeminiService:
             )
 
         try:
-            from google import genai
-
-            self._client = genai.Client(api_key=GOOGLE_API_KEY)
+            self._client = acquire_genai_client(self)
             self._configured = True
         except ImportError:
             raise GeminiError(
@@ -74,12 +194,13 @@ class GeminiService:
             system_instruction=system_instruction,
         )
 
-        response = await asyncio.to_thread(
-            self._client.models.generate_content,
-            model=GEMINI_TEXT_MODEL,
-            contents=[prompt],
-            config=config,
-        )
+        async with gemini_slot():
+            response = await asyncio.to_thread(
+                self._client.models.generate_content,
+                model=GEMINI_TEXT_MODEL,
+                contents=[prompt],
+                config=config,
+            )
         text = response.text
         if text is None:
             raise GeminiError(
@@ -115,12 +236,13 @@ class GeminiService:
             system_instruction=system_instruction,
             temperature=temperature,
         )
-        return await asyncio.to_thread(
-            self._client.models.generate_content,
-            model=GEMINI_TEXT_MODEL,
-            contents=contents,
-            config=config,
-        )
+        async with gemini_slot():
+            return await asyncio.to_thread(
+                self._client.models.generate_content,
+                model=GEMINI_TEXT_MODEL,
+                contents=contents,
+                config=config,
+            )
 
     async def generate_chat_response(
         self,
@@ -180,12 +302,13 @@ class GeminiService:
         )
 
         try:
-            response = await asyncio.to_thread(
-                self._client.models.generate_content,
-                model=GEMINI_TEXT_MODEL,
-                contents=contents,
-                config=config,
-            )
+            async with gemini_slot():
+                response = await asyncio.to_thread(
+                    self._client.models.generate_content,
+                    model=GEMINI_TEXT_MODEL,
+                    contents=contents,
+                    config=config,
+                )
             # Detect if Google Search was actually used by checking grounding_metadata
             grounded = (
                 use_search_grounding
@@ -245,8 +368,6 @@ class GeminiService:
 
         Yields text chunks as they arrive from the model.
         """
-        import threading
-
         self._ensure_configured()
         if self._client is None:
             raise GeminiError("Gemini client is not initialized")
@@ -282,13 +403,14 @@ class GeminiService:
                 # treating a failed stream as successfully empty.
                 loop.call_soon_threadsafe(queue.put_nowait, error)
 
-        threading.Thread(target=_worker, daemon=True).start()
-
-        while True:
-            item = await queue.get()
-            if item is None:
-                # Clean end of stream
-                break
-            if isinstance(item, Exception):
-                raise GeminiError(f"Streaming generation failed: {item}") from item
-            yield item
+        async with gemini_slot():
+            threading.Thread(target=_worker, daemon=True).start()
+
+            while True:
+                item = await queue.get()
+                if item is None:
+                    # Clean end of stream
+                    break
+                if isinstance(item, Exception):
+                    raise GeminiError(f"Streaming generation failed: {item}") from item
+                yield item
@@ -12,7 +12,7 @@ from io import BytesIO
 from PIL import Image
 
 from app.config import GOOGLE_API_KEY, IMAGE_WIDTH, IMAGE_HEIGHT, GEMINI_IMAGE_MODEL
-from app.services.gemini_service import GeminiError
+from app.services.gemini_service import GeminiError, acquire_genai_client, gemini_slot
 from app.services.llm_logger import log_llm_method
 
 logger = logging.getLogger(__name__)
@@ -31,10 +31,8 @@ class ImageService:
             return
 
         try:
-            from google import genai
-
             if GOOGLE_API_KEY:
-                self._client = genai.Client(api_key=GOOGLE_API_KEY)
+                self._client = acquire_genai_client(self)
                 self._configured = True
             else:
                 logger.info("No API key, using placeholder images")
@@ -52,8 +50,8 @@ class ImageService:
         self._ensure_configured()
 
         if not self._client:
-            # No API key configured — return placeholder
-            return self._generate_placeholder(prompt)
+            # No API key configured — return placeholder (pixel loop, so off the loop)
+            return await asyncio.to_thread(self._generate_placeholder, prompt)
 
         from google.genai import types
 
@@ -63,14 +61,15 @@ class ImageService:
             "High quality, suitable for social media carousel background."
         )
 
-        response = await asyncio.to_thread(
-            self._client.models.generate_content,
-            model=GEMINI_IMAGE_MODEL,
-            contents=[full_prompt],
-            config=types.GenerateContentConfig(
-                response_modalities=["IMAGE"],
-            ),
-        )
+        async with gemini_slot():
+            response = await asyncio.to_thread(
+                self._client.models.generate_content,
+                model=GEMINI_IMAGE_MODEL,
+                contents=[full_prompt],
+                config=types.GenerateContentConfig(
+                    response_modalities=["IMAGE"],
+                ),
+            )
 
         if not response.candidates:
             raise GeminiError(
@@ -79,19 +78,22 @@ class ImageService:
 
         for part in response.candidates[0].content.parts:
             if part.inline_data is not None:
-                # Decode the image bytes
-                image_bytes = part.inline_data.data
-                image: Image.Image = Image.open(BytesIO(image_bytes))
-                # Resize to exact dimensions
-                image = image.resize(
-                    (IMAGE_WIDTH, IMAGE_HEIGHT), Image.Resampling.LANCZOS
+                # Decode/resize/re-encode is CPU-bound PIL work; keep it off the loop.
+                return await asyncio.to_thread(
+                    self._resize_to_png_b64, part.inline_data.data
                 )
-                buffer = BytesIO()
-                image.save(buffer, format="PNG")
-                return base64.b64encode(buffer.getvalue()).decode("utf-8")
 
         raise GeminiError("No image returned in Gemini response")
 
+    @staticmethod
+    def _resize_to_png_b64(image_bytes: bytes) -> str:
+        """Resize raw image bytes to the slide size and return base64 PNG."""
+        image: Image.Image = Image.open(BytesIO(image_bytes))
+        image = image.resize((IMAGE_WIDTH, IMAGE_HEIGHT), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
     def _generate_placeholder(self, prompt: str) -> str:
         """Generate a placeholder gradient image."""
         from PIL import ImageDraw
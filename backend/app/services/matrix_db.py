@@ -18,6 +18,32 @@ from app.models.matrix import MatrixCell, MatrixProject, MatrixProjectCard
 logger = logging.getLogger(__name__)
 
 
+# Incremental column additions, built once so reruns reuse the same statements
+_NEW_COLUMN_MIGRATIONS = tuple(
+    text(sql)
+    for sql in (
+        "ALTER TABLE matrix_projects ADD COLUMN input_mode TEXT DEFAULT 'theme'",
+        "ALTER TABLE matrix_projects ADD COLUMN description TEXT",
+        "ALTER TABLE matrix_projects ADD COLUMN n_rows INTEGER",
+        "ALTER TABLE matrix_projects ADD COLUMN n_cols INTEGER",
+        "ALTER TABLE matrix_projects ADD COLUMN row_labels_json TEXT",
+        "ALTER TABLE matrix_projects ADD COLUMN col_labels_json TEXT",
+        "ALTER TABLE matrix_projects ADD COLUMN row_axis_title TEXT",
+        "ALTER TABLE matrix_projects ADD COLUMN col_axis_title TEXT",
+    )
+)
+
+# Bump whenever a statement is appended to _NEW_COLUMN_MIGRATIONS.
+SCHEMA_VERSION = 2
+_CREATE_SCHEMA_VERSION = text(
+    "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY)"
+)
+_SELECT_SCHEMA_VERSION = text("SELECT MAX(version) FROM schema_version")
+_RECORD_SCHEMA_VERSION = text(
+    "INSERT OR REPLACE INTO schema_version (version) VALUES (:version)"
+)
+
+
 # ── Row → Pydantic helpers ────────────────────────────────────────────────
 
 
@@ -77,27 +103,31 @@ class MatrixDB:
 
     @staticmethod
     async def run_migrations() -> None:
-        """Add new columns to existing tables (idempotent, SQLite ALTER TABLE)."""
-        new_columns = [
-            "ALTER TABLE matrix_projects ADD COLUMN input_mode TEXT DEFAULT 'theme'",
-            "ALTER TABLE matrix_projects ADD COLUMN description TEXT",
-            "ALTER TABLE matrix_projects ADD COLUMN n_rows INTEGER",
-            "ALTER TABLE matrix_projects ADD COLUMN n_cols INTEGER",
-            "ALTER TABLE matrix_projects ADD COLUMN row_labels_json TEXT",
-            "ALTER TABLE matrix_projects ADD COLUMN col_labels_json TEXT",
-            "ALTER TABLE matrix_projects ADD COLUMN row_axis_title TEXT",
-            "ALTER TABLE matrix_projects ADD COLUMN col_axis_title TEXT",
-        ]
-        for col_sql in new_columns:
+        """Add new columns to existing tables (idempotent, SQLite ALTER TABLE).
+
+        The applied version is recorded in ``schema_version`` so a database
+        that is already up to date costs a single SELECT on startup.
+        """
+        async with engine.begin() as conn:
+            await conn.execute(_CREATE_SCHEMA_VERSION)
+            current = (await conn.execute(_SELECT_SCHEMA_VERSION)).scalar()
+        if current is not None and current >= SCHEMA_VERSION:
+            logger.debug("Migration: schema at version %s, skipping", current)
+            return
+
+        for col_sql in _NEW_COLUMN_MIGRATIONS:
             try:
                 async with engine.begin() as conn:
-                    await conn.execute(text(col_sql))
+                    await conn.execute(col_sql)
             except Exception as exc:
                 if "duplicate column" in str(exc).lower():
                     logger.debug("Migration: column already exists, skipping (%s)", exc)
                 else:
                     raise
 
+        async with engine.begin() as conn:
+            await conn.execute(_RECORD_SCHEMA_VERSION, {"version": SCHEMA_VERSION})
+
     # ── Projects ──────────────────────────────────────────────────────────
 
     async def create_project(
@@ -23,9 +23,7 @@ class MatrixSettingsManager:
     def _load(self) -> MatrixSettings:
         if self._file.exists():
             try:
-                with open(self._file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return MatrixSettings(**data)
+                return MatrixSettings.model_validate_json(self._file.read_bytes())
             except Exception as exc:
                 logger.warning(
                     "Failed to load %s (%s) — using defaults", self._file, exc
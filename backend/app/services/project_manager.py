@@ -5,13 +5,17 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.database import async_session_factory as _default_session_factory
-from app.db.models import ProjectDB
+from app.db.database import (
+    async_session_factory as _default_session_factory,
+    readonly_session_factory as _default_readonly_session_factory,
+)
+from app.db.models import JSONText, ProjectDB
 from app.models.project import (
     MAX_STAGES,
     ProjectCard,
@@ -28,10 +32,12 @@ _SHORT_ID_LENGTH = 6
 
 
 def _state_to_db_row(project: ProjectState) -> dict:
-    """Serialise a ProjectState into DB column values."""
+    """Serialise a ProjectState into DB column values.
+
+    The JSON columns are encoded straight from the models by pydantic-core.
+    """
     project.update_timestamp()
-    state_blob = project.model_dump(
-        mode="json",
+    state_blob = project.model_dump_json(
         exclude={
             "project_id",
             "name",
@@ -48,8 +54,8 @@ def _state_to_db_row(project: ProjectState) -> dict:
         "name": project.name,
         "slide_count": project.slide_count,
         "current_stage": project.current_stage,
-        "project_config": project.project_config.model_dump(mode="json"),
-        "state": state_blob,
+        "project_config": JSONText(project.project_config.model_dump_json()),
+        "state": JSONText(state_blob),
         # DB column is still named thumbnail_b64 to avoid a migration
         "thumbnail_b64": project.thumbnail_url,
         "created_at": project.created_at,
@@ -80,17 +86,30 @@ class ProjectManager:
     """Manages project state with SQLite as the sole source of truth.
 
     All mutation methods are async. SQLite is used directly for all reads
-    and writes — no in-memory cache is maintained so memory usage stays
+    and writes — no project state is cached in memory so memory usage stays
     flat regardless of how many projects or how large their image payloads.
+    Only the lightweight card list is memoised. Every write goes through this
+    class, so each one bumps a write counter once it has committed and the
+    cached cards are reused only while the counter is unchanged.
     """
 
     def __init__(
         self,
         session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        readonly_session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
     ) -> None:
         self._session_factory: async_sessionmaker[AsyncSession] = (
             session_factory or _default_session_factory
         )
+        # SELECT-only paths; falls back to the injected factory so a custom
+        # session_factory alone still routes every query to the same DB.
+        self._readonly_session_factory: async_sessionmaker[AsyncSession] = (
+            readonly_session_factory
+            or session_factory
+            or _default_readonly_session_factory
+        )
+        self._writes = 0
+        self._cards_cache: Optional[Tuple[int, List[ProjectCard]]] = None
 
     # ------------------------------------------------------------------
     # CRUD
@@ -122,7 +141,7 @@ class ProjectManager:
 
     async def get_project(self, project_id: str) -> Optional[ProjectState]:
         """Fetch a project directly from the DB."""
-        async with self._session_factory() as session:
+        async with self._readonly_session_factory() as session:
             row = await session.get(ProjectDB, project_id)
         if row is None:
             return None
@@ -150,16 +169,24 @@ class ProjectManager:
                     await storage_service.delete_image(slide.background_image_url)
                     await storage_service.delete_image(slide.final_image_url)
 
-        async with self._session_factory() as session:
-            async with session.begin():
-                result = await session.execute(
-                    delete(ProjectDB).where(ProjectDB.id == project_id)
-                )
-                return result.rowcount > 0
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    result = await session.execute(
+                        delete(ProjectDB).where(ProjectDB.id == project_id)
+                    )
+                    return result.rowcount > 0
+        finally:
+            self._writes += 1
 
     async def list_projects(self) -> List[ProjectCard]:
         """Return lightweight cards for all projects, sorted newest-first."""
-        async with self._session_factory() as session:
+        # Read before querying: a write committing mid-query bumps the counter
+        # past this value, so the next call refetches instead of trusting us.
+        writes = self._writes
+        if self._cards_cache is not None and self._cards_cache[0] == writes:
+            return list(self._cards_cache[1])
+        async with self._readonly_session_factory() as session:
             result = await session.execute(
                 select(
                     ProjectDB.id,
@@ -173,7 +200,7 @@ class ProjectManager:
             )
             rows = result.all()
 
-        return [
+        cards = [
             ProjectCard(
                 project_id=row.id,
                 name=row.name,
@@ -185,6 +212,8 @@ class ProjectManager:
             )
             for row in rows
         ]
+        self._cards_cache = (writes, cards)
+        return list(cards)
 
     async def rename_project(
         self, project_id: str, name: str, manually_set: bool = True
@@ -272,9 +301,12 @@ class ProjectManager:
 
     async def clear_all(self) -> None:
         """Wipe all projects from the DB.  Used in tests."""
-        async with self._session_factory() as session:
-            async with session.begin():
-                await session.execute(delete(ProjectDB))
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    await session.execute(delete(ProjectDB))
+        finally:
+            self._writes += 1
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -282,17 +314,20 @@ class ProjectManager:
 
     async def _save_to_db(self, project: ProjectState) -> None:
         """Upsert a project row (INSERT OR REPLACE)."""
-        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-
         row = _state_to_db_row(project)
-        async with self._session_factory() as session:
-            async with session.begin():
-                stmt = sqlite_insert(ProjectDB).values(**row)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_={k: v for k, v in row.items() if k != "id"},
-                )
-                await session.execute(stmt)
+        # Bumped after the commit (or failure) so a concurrent list_projects
+        # can never cache pre-commit rows under the post-write counter.
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    stmt = sqlite_insert(ProjectDB).values(**row)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["id"],
+                        set_={k: v for k, v in row.items() if k != "id"},
+                    )
+                    await session.execute(stmt)
+        finally:
+            self._writes += 1
 
 
 # Module-level singleton — used by the DI container
@@ -30,6 +30,12 @@ PROMPT_FILES: Dict[str, str] = {
     "matrix_description_axes": "matrix_description_axes.prompt",
 }
 
+# Absolute paths for PROMPT_FILES, built once so the load/save loops are
+# plain dict lookups instead of a Path join per prompt per request.
+_PROMPT_PATHS: Dict[str, Path] = {
+    name: PROMPTS_DIR / filename for name, filename in PROMPT_FILES.items()
+}
+
 
 # Prompts specific to the Carousel template (override shared defaults)
 CAROUSEL_PROMPT_FILES: Dict[str, str] = {
@@ -55,6 +61,30 @@ TEMPLATE_PROMPT_FILES: Dict[str, Dict[str, str]] = {
 }
 
 
+# Raw file contents keyed by path, tagged with the mtime they were read at.
+_file_cache: Dict[Path, tuple[int, str]] = {}
+
+
+def read_prompt_path(path: Path) -> str:
+    """Return the content of *path*, re-reading only when its mtime changes.
+
+    A ``stat`` is far cheaper than a full read, so repeated loads of an
+    unchanged prompt cost one syscall. Edits on disk are picked up on the
+    next call.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read.
+    """
+    mtime = path.stat().st_mtime_ns
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    # One raw read + decode; skips the TextIOWrapper/newline-translation layer.
+    content = path.read_bytes().decode("utf-8")
+    _file_cache[path] = (mtime, content)
+    return content
+
+
 def load_prompt_file(filename: str) -> str:
     """
     Load a raw prompt string from a file in the prompts directory.
@@ -65,10 +95,8 @@ def load_prompt_file(filename: str) -> str:
     Returns:
         The file content as a string, or an empty string if loading fails.
     """
-    prompt_path = PROMPTS_DIR / filename
     try:
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            return f.read()
+        return read_prompt_path(PROMPTS_DIR / filename)
     except Exception as e:
         logger.error(f"Failed to load prompt file {filename}: {e}")
         return ""
@@ -77,20 +105,15 @@ def load_prompt_file(filename: str) -> str:
 class PromptLoader:
     """Service for loading and saving prompt templates from the file system.
 
-    Prompt contents are cached in memory at initialisation so that
-    ``resolve_prompt`` — the hot path called on every generation request —
-    never blocks the async event loop with synchronous file I/O.
-    The cache is kept up-to-date whenever ``save`` writes a new version.
+    The app lifespan fills the prompt cache with :meth:`load_all` (off the
+    event loop) before serving requests, so ``resolve_prompt`` — the hot path
+    called on every generation request — never blocks the async event loop
+    with synchronous file I/O. The cache is kept up-to-date whenever ``save``
+    writes a new version.
     """
 
     def __init__(self) -> None:
         self._cache: Dict[str, str] = {}
-        self._load_into_cache()
-
-    def _load_into_cache(self) -> None:
-        """Pre-load all registered prompt files into memory."""
-        for name, filename in PROMPT_FILES.items():
-            self._cache[name] = load_prompt_file(filename)
 
     def load(self, filename: str) -> str:
         """Load a prompt from the prompts directory."""
@@ -110,10 +133,8 @@ class PromptLoader:
         """
         prompts = self.load_all()
         for name, filename in TEMPLATE_PROMPT_FILES.get(template_name, {}).items():
-            filepath = PROMPTS_DIR / filename
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    prompts[name] = f.read()
+                prompts[name] = read_prompt_path(PROMPTS_DIR / filename)
             except Exception as e:
                 logger.error("Failed to load template prompt %s: %s", filename, e)
         return prompts
@@ -121,17 +142,16 @@ class PromptLoader:
     def load_all(self) -> Dict[str, str]:
         """Load all registered prompt files.
 
+        Also refreshes the per-name cache used by :meth:`get_cached`.
+
         Returns:
             Dict mapping prompt names to their content.
 
         Raises:
             IOError: If any prompt file cannot be read.
         """
-        prompts: Dict[str, str] = {}
-        for name, filename in PROMPT_FILES.items():
-            filepath = PROMPTS_DIR / filename
-            with open(filepath, "r", encoding="utf-8") as f:
-                prompts[name] = f.read()
+        prompts = {name: read_prompt_path(path) for name, path in _PROMPT_PATHS.items()}
+        self._cache.update(prompts)
         return prompts
 
     def save(self, prompt_name: str, content: str) -> None:
@@ -145,12 +165,15 @@ class PromptLoader:
             KeyError: If prompt_name is not registered.
             IOError: If file cannot be written.
         """
-        if prompt_name not in PROMPT_FILES:
+        filepath = _PROMPT_PATHS.get(prompt_name)
+        if filepath is None:
             raise KeyError(f"Unknown prompt: {prompt_name}")
-        filepath = PROMPTS_DIR / PROMPT_FILES[prompt_name]
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Raw bytes, mirroring read_prompt_path: one write, no text layer.
+        filepath.write_bytes(content.encode("utf-8"))
         self._cache[prompt_name] = content
+        # Seed the file cache too: a second write within the filesystem's
+        # mtime granularity would otherwise leave a stale entry that looks fresh.
+        _file_cache[filepath] = (filepath.stat().st_mtime_ns, content)
 
     def resolve_prompt(self, project: ProjectState, name: str) -> str:
         """Return prompt from project config override, falling back to cache.
@@ -165,11 +188,24 @@ class PromptLoader:
         Returns:
             Prompt string — project-specific override if set, else cached content.
         """
-        return project.project_config.get_prompt(name) or self._cache.get(name, "")
+        return project.project_config.get_prompt(name) or self.get_cached(name)
 
     def get_cached(self, name: str) -> str:
-        """Return cached prompt content by name, or empty string if not found."""
-        return self._cache.get(name, "")
+        """Return preloaded prompt content by name, without touching the disk.
+
+        Returns an empty string if *name* is not a registered prompt.
+
+        Raises:
+            LookupError: If *name* is registered but :meth:`load_all` has not
+                filled the cache yet.
+        """
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        if name not in PROMPT_FILES:
+            return ""
+        raise LookupError(f"Prompt {name!r} is not loaded; call load_all() first")
 
     def is_known(self, prompt_name: str) -> bool:
         """Check if a prompt name is registered."""
@@ -41,11 +41,13 @@ REQUIRED_VARIABLES: Dict[str, Set[str]] = {
 }
 
 
+# Match {variable_name} but not {{escaped}}
+_VARIABLE_PATTERN = re.compile(r"(?<!\{)\{([a-zA-Z_][a-zA-Z0-9_]*)\}(?!\})")
+
+
 def extract_variables(prompt: str) -> Set[str]:
     """Extract all {variable} placeholders from a prompt string."""
-    # Match {variable_name} but not {{escaped}}
-    pattern = r"(?<!\{)\{([a-zA-Z_][a-zA-Z0-9_]*)\}(?!\})"
-    return set(re.findall(pattern, prompt))
+    return set(_VARIABLE_PATTERN.findall(prompt))
 
 
 def validate_prompt(prompt_name: str, prompt_text: str) -> tuple[bool, str]:
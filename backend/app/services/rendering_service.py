@@ -5,7 +5,7 @@ from typing import List, Tuple, Optional, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
-from app.models.style import TextStyle, BoxStyle
+from app.models.style import TextStyle, BoxStyle, StrokeStyle
 from app.services.base_stage_service import BaseStageService
 from app.services.font_manager import FontManager
 from app.services.storage_service import StorageService
@@ -343,9 +343,7 @@ class RenderingService(BaseStageService):
             text_color=text_color,
             alignment="center",
             line_spacing=1.3,
+            stroke=StrokeStyle(enabled=stroke_enabled, width_px=2, color=stroke_color),
         )
-        style.stroke.enabled = stroke_enabled
-        style.stroke.width_px = 2
-        style.stroke.color = stroke_color
 
         return style
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 import logging
-from typing import AsyncGenerator, Optional, TYPE_CHECKING
+from typing import AsyncGenerator, List, Optional, TYPE_CHECKING
+
+from pydantic import TypeAdapter
 
 from app.models.config import WordsPerSlide
 from app.models.slide import Slide, SlideText
@@ -20,6 +22,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole generated slide list in one pydantic-core call.
+_SLIDES_ADAPTER = TypeAdapter(List[Slide])
+
 
 class StageDraftService(BaseStageService):
     """Service for Stage Draft: Draft to Slide texts transformation."""
@@ -138,34 +143,32 @@ class StageDraftService(BaseStageService):
             )
 
             slides_data = result.get("slides", [])
-            project.slides = []
 
             max_slides = num_slides if num_slides is not None else 20
 
             default_style = self._style_from_config(project)
 
-            for i, slide_data in enumerate(slides_data[:max_slides]):
-                slide = Slide(
-                    index=i,
-                    text=SlideText(
-                        title=slide_data.get("title") if include_titles else None,
-                        body=slide_data.get("body", ""),
-                    ),
-                    style=default_style.model_copy(deep=True),
+            texts = [
+                {
+                    "title": slide_data.get("title") if include_titles else None,
+                    "body": slide_data.get("body", ""),
+                }
+                for slide_data in slides_data[:max_slides]
+            ]
+            if num_slides is not None:
+                texts.extend(
+                    {"body": f"Slide {i + 1} content"}
+                    for i in range(len(texts), num_slides)
                 )
-                project.slides.append(slide)
 
-            if num_slides is not None:
-                while len(project.slides) < num_slides:
-                    project.slides.append(
-                        Slide(
-                            index=len(project.slides),
-                            text=SlideText(
-                                body=f"Slide {len(project.slides) + 1} content"
-                            ),
-                            style=default_style.model_copy(deep=True),
-                        )
-                    )
+            # TextStyle's sub-styles are frozen, so a shallow copy per slide
+            # is enough to keep slides independent.
+            project.slides = _SLIDES_ADAPTER.validate_python(
+                [
+                    {"index": i, "text": text, "style": default_style.model_copy()}
+                    for i, text in enumerate(texts)
+                ]
+            )
 
             project.num_slides = len(project.slides)
 
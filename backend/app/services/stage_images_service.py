@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Any, AsyncGenerator, Dict, List, Optional, TYPE_CHECKING, Union
 
 from app.models.project import ProjectState
+from app.models.slide import Slide
+from app.services.async_utils import bounded_as_completed
 from app.services.base_stage_service import BaseStageService
 from app.services.storage_service import StorageService
 
@@ -39,6 +41,39 @@ class StageImagesService(BaseStageService):
         shared_prefix = project.shared_prompt_prefix or ""
         return f"{shared_prefix} {project.slides[slide_index].image_prompt}".strip()
 
+    def _image_prompts(self, project: ProjectState) -> List[str]:
+        """Fill in missing slide prompts and return the full prompt per slide."""
+        for slide in project.slides:
+            if not slide.image_prompt:
+                slide.image_prompt = _DEFAULT_IMAGE_PROMPT.format(n=slide.index + 1)
+        return [
+            self._build_full_prompt(project, i) for i in range(len(project.slides))
+        ]
+
+    async def _apply_image_result(
+        self, slide: Slide, result: Union[str, BaseException]
+    ) -> bool:
+        """Store a generated image on *slide*; return False if generation failed."""
+        if isinstance(result, BaseException):
+            logger.warning(
+                "Image generation failed for slide %d: %s",
+                slide.index,
+                result,
+            )
+            # Preserve existing image on failure
+            return False
+        old_url = slide.background_image_url
+        slide.background_image_url = await self.storage_service.save_image_to_disk(result)
+        # Only delete the old image after the new one is successfully saved
+        await self.storage_service.delete_image(old_url)
+        return True
+
+    @staticmethod
+    def _sync_thumbnail(project: ProjectState) -> None:
+        """Point the project thumbnail at the first slide's background image."""
+        if project.slides and project.slides[0].background_image_url:
+            project.thumbnail_url = project.slides[0].background_image_url
+
     async def generate_all_images(
         self,
         project_id: str,
@@ -49,40 +84,56 @@ class StageImagesService(BaseStageService):
         if not project or not project.slides:
             return None
 
-        for slide in project.slides:
-            if not slide.image_prompt:
-                slide.image_prompt = _DEFAULT_IMAGE_PROMPT.format(n=slide.index + 1)
-
-        full_prompts = [
-            self._build_full_prompt(project, i) for i in range(len(project.slides))
-        ]
-
+        full_prompts = self._image_prompts(project)
         results = await self._batch(
             [self.image_service.generate_image(p) for p in full_prompts],
             limit=concurrency_limit,
             return_exceptions=True,
         )
         for slide, result in zip(project.slides, results):
-            if isinstance(result, BaseException):
-                logger.warning(
-                    "Image generation failed for slide %d: %s",
-                    slide.index,
-                    result,
-                )
-                # Preserve existing image on failure
-                continue
-            old_url = slide.background_image_url
-            slide.background_image_url = await self.storage_service.save_image_to_disk(result)
-            # Only delete the old image after the new one is successfully saved
-            await self.storage_service.delete_image(old_url)
-
-        # Update thumbnail to the first slide's background image
-        if project.slides and project.slides[0].background_image_url:
-            project.thumbnail_url = project.slides[0].background_image_url
+            await self._apply_image_result(slide, result)
 
+        self._sync_thumbnail(project)
         await self.project_manager.update_project(project)
         return project
 
+    async def stream_all_images(
+        self,
+        project_id: str,
+        concurrency_limit: int = 10,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Generate images for all slides, yielding each one as it lands.
+
+        Yields ``{"index": i, "background_image_url": url}`` for every slide
+        whose image was generated (or ``{"index": i, "error": msg}`` if it
+        failed), in completion order, and finally ``{"project": {...}}`` with
+        the saved state. Nothing is yielded if the project is missing or has
+        no slides.
+
+        The project is saved after every finished slide rather than once at
+        the end, so if the client disconnects mid-stream the images already
+        written to disk stay referenced instead of being orphaned.
+        """
+        project = await self.project_manager.get_project(project_id)
+        if not project or not project.slides:
+            return
+
+        full_prompts = self._image_prompts(project)
+        async for index, result in bounded_as_completed(
+            [self.image_service.generate_image(p) for p in full_prompts],
+            limit=concurrency_limit,
+        ):
+            slide = project.slides[index]
+            if not await self._apply_image_result(slide, result):
+                yield {"index": index, "error": str(result)}
+                continue
+            self._sync_thumbnail(project)
+            await self.project_manager.update_project(project)
+            yield {"index": index, "background_image_url": slide.background_image_url}
+
+        await self.project_manager.update_project(project)
+        yield {"project": project.model_dump(mode="json")}
+
     async def regenerate_image(
         self,
         project_id: str,
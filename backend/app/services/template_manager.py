@@ -10,8 +10,11 @@ from typing import Dict, List, Optional
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.database import async_session_factory as _default_session_factory
-from app.db.models import TemplateDB
+from app.db.database import (
+    async_session_factory as _default_session_factory,
+    readonly_session_factory as _default_readonly_session_factory,
+)
+from app.db.models import JSONText, TemplateDB
 from app.models.project import ProjectConfig, TemplateData
 from app.models.config import GlobalDefaultsConfig, StyleConfig
 
@@ -39,8 +42,14 @@ class TemplateManager:
     def __init__(
         self,
         session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        readonly_session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
     ) -> None:
         self._session_factory = session_factory or _default_session_factory
+        self._readonly_session_factory = (
+            readonly_session_factory
+            or session_factory
+            or _default_readonly_session_factory
+        )
         self._prompts_cache: Optional[Dict[str, Dict[str, str]]] = None
 
     def _load_template_prompts(self) -> Dict[str, Dict[str, str]]:
@@ -72,7 +81,7 @@ class TemplateManager:
 
     async def seed_defaults(self) -> None:
         """Insert the Carousel and Painting templates if the table is empty."""
-        async with self._session_factory() as session:
+        async with self._readonly_session_factory() as session:
             result = await session.execute(select(TemplateDB.id))
             if result.first() is not None:
                 logger.debug("Templates already seeded — skipping")
@@ -116,7 +125,7 @@ class TemplateManager:
                         id=str(uuid.uuid4()),
                         name=name,
                         default_slide_count=slide_count,
-                        config=config.model_dump(mode="json"),
+                        config=JSONText(config.model_dump_json()),
                         created_at=datetime.now(timezone.utc),
                     )
                     session.add(row)
@@ -129,7 +138,7 @@ class TemplateManager:
 
     async def list_templates(self) -> List[TemplateData]:
         """Return all templates."""
-        async with self._session_factory() as session:
+        async with self._readonly_session_factory() as session:
             result = await session.execute(
                 select(TemplateDB).order_by(TemplateDB.name)
             )
@@ -138,7 +147,7 @@ class TemplateManager:
 
     async def get_template(self, template_id: str) -> Optional[TemplateData]:
         """Return a template by ID, or None."""
-        async with self._session_factory() as session:
+        async with self._readonly_session_factory() as session:
             row = await session.get(TemplateDB, template_id)
         return _row_to_data(row) if row else None
 
@@ -168,14 +177,21 @@ class TemplateManager:
             id=str(uuid.uuid4()),
             name=name,
             default_slide_count=default_slide_count,
-            config=config.model_dump(mode="json"),
+            config=JSONText(config.model_dump_json()),
             created_at=datetime.now(timezone.utc),
         )
         async with self._session_factory() as session:
             async with session.begin():
                 session.add(row)
 
-        return _row_to_data(row)
+        # row.config holds the serialised text; reuse the model we already have
+        return TemplateData(
+            id=row.id,
+            name=row.name,
+            default_slide_count=row.default_slide_count,
+            config=config,
+            created_at=row.created_at,
+        )
 
     async def update_template(
         self,
@@ -195,7 +211,7 @@ class TemplateManager:
                 if default_slide_count is not None:
                     row.default_slide_count = default_slide_count
                 if config is not None:
-                    row.config = config.model_dump(mode="json")
+                    row.config = JSONText(config.model_dump_json())
         return await self.get_template(template_id)
 
     async def delete_template(self, template_id: str) -> bool:
@@ -0,0 +1,79 @@
+"""Tests for app-level configuration (app/config.py)."""
+
+import pytest
+
+from app import config as app_config
+
+
+@pytest.fixture
+def env_files(tmp_path, monkeypatch):
+    """Point the .env loader at two temp files and reset its cache."""
+    root_env = tmp_path / "root.env"
+    backend_env = tmp_path / "backend.env"
+    monkeypatch.setattr(app_config, "_ENV_FILES", (root_env, backend_env))
+    app_config._load_env_files.cache_clear()
+    yield root_env, backend_env
+    app_config._load_env_files.cache_clear()
+
+
+class TestLoadEnvFiles:
+    def test_root_env_takes_precedence(self, env_files):
+        root_env, backend_env = env_files
+        root_env.write_text("SHARED=root\nROOT_ONLY=1\n")
+        backend_env.write_text("SHARED=backend\nBACKEND_ONLY=2\n")
+        values = app_config._load_env_files()
+        assert values == {"SHARED": "root", "ROOT_ONLY": "1", "BACKEND_ONLY": "2"}
+
+    def test_missing_files_yield_empty_dict(self, env_files):
+        assert app_config._load_env_files() == {}
+
+    def test_files_parsed_once(self, env_files):
+        root_env, _ = env_files
+        root_env.write_text("KEY=first\n")
+        assert app_config._load_env_files()["KEY"] == "first"
+        root_env.write_text("KEY=second\n")
+        assert app_config._load_env_files()["KEY"] == "first"
+
+
+class TestBasePaths:
+    def test_paths_derive_from_backend_dir(self):
+        assert app_config.BASE_DIR == app_config._HERE.parent.parent
+        assert app_config.FONTS_DIR == app_config.BASE_DIR / "fonts"
+        assert app_config._ENV_FILES[0] == app_config.BASE_DIR.parent / ".env"
+
+
+class TestResolveOutputDir:
+    def test_existing_dir_skips_mkdir(self, tmp_path, monkeypatch):
+        def _fail(*args, **kwargs):
+            raise AssertionError("mkdir should not be called")
+
+        monkeypatch.setattr(type(tmp_path), "mkdir", _fail)
+        assert app_config._resolve_output_dir(tmp_path, tmp_path / "fallback") == tmp_path
+
+    def test_missing_dir_is_created(self, tmp_path):
+        target = tmp_path / "output"
+        assert app_config._resolve_output_dir(target, tmp_path / "fallback") == target
+        assert target.is_dir()
+
+    def test_permission_error_uses_fallback(self, tmp_path, monkeypatch, caplog):
+        primary = tmp_path / "denied"
+        fallback = tmp_path / "fallback"
+        real_mkdir = type(tmp_path).mkdir
+
+        def _mkdir(self, *args, **kwargs):
+            if self == primary:
+                raise PermissionError("denied")
+            return real_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(tmp_path), "mkdir", _mkdir)
+        assert app_config._resolve_output_dir(primary, fallback) == fallback
+        assert fallback.is_dir()
+        assert "Falling back" in caplog.text
+
+    def test_fallback_failure_is_raised(self, tmp_path, monkeypatch):
+        def _mkdir(self, *args, **kwargs):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(type(tmp_path), "mkdir", _mkdir)
+        with pytest.raises(PermissionError):
+            app_config._resolve_output_dir(tmp_path / "a", tmp_path / "b")
@@ -1,11 +1,11 @@
-"""Tests for bounded_gather() async utility."""
+"""Tests for the bounded_gather() and bounded_as_completed() async utilities."""
 
 import asyncio
 import time
 
 import pytest
 
-from app.services.async_utils import bounded_gather
+from app.services.async_utils import bounded_as_completed, bounded_gather
 from tests.conftest import run_async
 
 
@@ -46,6 +46,26 @@ class TestBoundedGather:
         with pytest.raises(RuntimeError, match="boom"):
             run_async(bounded_gather([_fail(), _ok()], limit=2))
 
+    def test_first_exception_cancels_pending_siblings(self):
+        """Without return_exceptions=True, a failure stops the rest of the batch."""
+        finished: list[int] = []
+
+        async def _fail():
+            raise RuntimeError("boom")
+
+        async def _slow(n: int) -> int:
+            await asyncio.sleep(0.05)
+            finished.append(n)
+            return n
+
+        async def _run():
+            with pytest.raises(RuntimeError, match="boom"):
+                await bounded_gather([_fail()] + [_slow(i) for i in range(4)], limit=2)
+            await asyncio.sleep(0.1)
+
+        run_async(_run())
+        assert finished == []
+
     def test_return_exceptions_captures_errors(self):
         """With return_exceptions=True, exceptions are returned as values."""
         async def _fail():
@@ -114,3 +134,71 @@ class TestBoundedGather:
         )
         assert len(results) == 3
         assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+class TestBoundedAsCompleted:
+    """Tests for bounded_as_completed()."""
+
+    def test_invalid_limit_raises(self):
+        with pytest.raises(ValueError, match="limit must be >= 1"):
+            run_async(_collect(bounded_as_completed([], limit=0)))
+
+    def test_yields_index_and_result_in_completion_order(self):
+        async def _after(delay: float, value: str) -> str:
+            await asyncio.sleep(delay)
+            return value
+
+        pairs = run_async(
+            _collect(
+                bounded_as_completed(
+                    [_after(0.05, "slow"), _after(0.0, "fast")], limit=2
+                )
+            )
+        )
+        assert pairs == [(1, "fast"), (0, "slow")]
+
+    def test_exceptions_are_yielded_not_raised(self):
+        async def _fail():
+            raise RuntimeError("boom")
+
+        async def _ok():
+            return 1
+
+        pairs = dict(run_async(_collect(bounded_as_completed([_fail(), _ok()], limit=2))))
+        assert pairs[1] == 1
+        assert isinstance(pairs[0], RuntimeError)
+
+    def test_concurrency_limit_is_respected(self):
+        running = peak = 0
+
+        async def _track() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        run_async(_collect(bounded_as_completed([_track() for _ in range(6)], limit=2)))
+        assert peak == 2
+
+    def test_closing_early_cancels_pending_work(self):
+        finished: list[int] = []
+
+        async def _work(n: int) -> int:
+            await asyncio.sleep(0.01 * n)
+            finished.append(n)
+            return n
+
+        async def _first_only():
+            agen = bounded_as_completed([_work(i) for i in range(5)], limit=5)
+            first = await agen.__anext__()
+            await agen.aclose()
+            await asyncio.sleep(0.1)
+            return first
+
+        assert run_async(_first_only()) == (0, 0)
+        assert finished == [0]
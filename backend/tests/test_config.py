@@ -99,6 +99,20 @@ def test_patch_global_defaults_include_titles(client):
     assert response.json()["config"]["global_defaults"]["include_titles"] is False
 
 
+def test_patch_global_defaults_ignores_unset_and_null_fields(client):
+    """Omitted and explicit-null fields leave the stored values untouched."""
+    before = client.get("/api/config").json()["config"]["global_defaults"]
+    response = client.patch(
+        "/api/config/global-defaults", json={"num_slides": 6, "language": None}
+    )
+    client.post("/api/config/reset")
+    assert response.status_code == 200
+    after = response.json()["config"]["global_defaults"]
+    assert after["num_slides"] == 6
+    assert after["language"] == before["language"]
+    assert after["include_titles"] == before["include_titles"]
+
+
 def test_patch_global_defaults_num_slides_too_small(client):
     """PATCH /api/config/global-defaults with num_slides=0 returns 422."""
     response = client.patch("/api/config/global-defaults", json={"num_slides": 0})
@@ -171,3 +185,95 @@ def test_reset_config_clears_stage_instructions(client):
     response = client.post("/api/config/reset")
     assert response.status_code == 200
     assert response.json()["config"]["stage_instructions"]["stage1"] is None
+
+
+def test_get_config_reflects_updates_after_cached_read(client):
+    """The cached GET body is rebuilt once the config changes."""
+    client.get("/api/config")
+    client.patch("/api/config/global-defaults", json={"language": "French"})
+    response = client.get("/api/config")
+    client.post("/api/config/reset")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["config"]["global_defaults"]["language"] == "French"
+
+
+def test_get_config_etag_changes_after_update(client):
+    """A stale ETag gets the new body; the current one gets a 304."""
+    stale = client.get("/api/config").headers["etag"]
+    assert client.get("/api/config", headers={"If-None-Match": stale}).status_code == 304
+
+    client.patch("/api/config/global-defaults", json={"language": "French"})
+    response = client.get("/api/config", headers={"If-None-Match": stale})
+    client.post("/api/config/reset")
+    assert response.status_code == 200
+    assert response.headers["etag"] != stale
+    assert response.json()["config"]["global_defaults"]["language"] == "French"
+
+
+def test_encoded_body_cache_etag_matching():
+    """If-None-Match is compared weakly and accepts lists and the wildcard."""
+    from app.routes.utils import EncodedBodyCache
+
+    cache = EncodedBodyCache()
+    source = object()
+    etag = cache.response(source, lambda: b"{}").headers["etag"]
+    strong = etag.removeprefix("W/")
+    for header in (etag, strong, f'"other", {etag}', "*"):
+        assert cache.response(source, lambda: b"{}", header).status_code == 304
+    assert cache.response(source, lambda: b"{}", '"other"').status_code == 200
+
+
+def test_encoded_body_cache_reencodes_only_on_new_source():
+    """EncodedBodyCache calls the encoder once per distinct source object."""
+    from app.routes.utils import EncodedBodyCache
+
+    cache = EncodedBodyCache()
+    calls = []
+
+    def encode():
+        calls.append(1)
+        return b'{"n":1}'
+
+    source = object()
+    assert cache.response(source, encode).body == b'{"n":1}'
+    cache.response(source, encode)
+    assert len(calls) == 1
+    cache.response(object(), encode)
+    assert len(calls) == 2
+
+
+def test_execute_service_action_wraps_project_without_revalidating():
+    """The ProjectResponse envelope holds the service's own ProjectState."""
+    from app.models.project import ProjectState
+    from app.routes.utils import execute_service_action
+    from tests.conftest import run_async
+
+    project = ProjectState(project_id="p1")
+
+    async def action():
+        return project
+
+    response = run_async(execute_service_action(action, "failed"))
+    assert response.project is project
+
+
+def test_config_manager_loads_persisted_file(tmp_path):
+    """A saved config.json is read back into an equivalent AppConfig."""
+    from app.services.config_manager import ConfigManager
+
+    path = tmp_path / "config.json"
+    first = ConfigManager(config_file=str(path))
+    first.update_global_defaults(language="Deutsch")
+    reloaded = ConfigManager(config_file=str(path))
+    assert reloaded.get_config() == first.get_config()
+    assert reloaded.get_config().global_defaults.language == "Deutsch"
+
+
+def test_config_manager_corrupt_file_uses_defaults(tmp_path):
+    """Unparseable config.json falls back to the default configuration."""
+    from app.models.config import AppConfig
+    from app.services.config_manager import ConfigManager
+
+    path = tmp_path / "config.json"
+    path.write_text("{not json")
+    assert ConfigManager(config_file=str(path)).get_config() == AppConfig()
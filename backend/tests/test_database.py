@@ -0,0 +1,228 @@
+"""Tests for the async database engine configuration."""
+
+from sqlalchemy import text
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+from app.db.database import POOL_SIZE, create_engine, engine, warm_pool
+from tests.conftest import run_async
+
+
+class TestEnginePool:
+    def test_file_db_uses_queue_pool(self):
+        assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+
+    def test_memory_db_uses_static_pool(self):
+        eng = create_engine("sqlite+aiosqlite:///:memory:")
+        try:
+            assert isinstance(eng.pool, StaticPool)
+        finally:
+            run_async(eng.dispose())
+
+    def test_pragmas_applied_to_pooled_connections(self):
+        async def _pragmas():
+            async with engine.connect() as conn:
+                journal = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+                sync = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+                temp_store = (await conn.execute(text("PRAGMA temp_store"))).scalar()
+            return journal, sync, temp_store
+
+        journal, sync, temp_store = run_async(_pragmas())
+        assert journal == "wal"
+        assert sync == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
+
+    def test_warm_pool_opens_connections(self, tmp_path):
+        eng = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}")
+
+        async def _warm():
+            await warm_pool(eng)
+            return eng.pool.checkedin()
+
+        try:
+            assert run_async(_warm()) == POOL_SIZE
+        finally:
+            run_async(eng.dispose())
+
+
+class TestInitDb:
+    def test_models_registered_on_import(self):
+        from app.db import models  # noqa: F401
+        from app.db.database import Base
+
+        assert {"projects", "templates", "matrix_projects", "matrix_cells"} <= set(
+            Base.metadata.tables
+        )
+
+    def test_init_db_creates_tables_on_fresh_engine(self, tmp_path):
+        from app.db.database import init_db
+
+        eng = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'fresh.db'}")
+
+        async def _tables():
+            await init_db(eng)
+            async with eng.connect() as conn:
+                result = await conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type='table'")
+                )
+                return {row[0] for row in result}
+
+        try:
+            assert "projects" in run_async(_tables())
+        finally:
+            run_async(eng.dispose())
+
+    def test_matrix_migrations_are_idempotent(self):
+        from app.services.matrix_db import MatrixDB
+
+        run_async(MatrixDB.run_migrations())
+        run_async(MatrixDB.run_migrations())
+
+
+class TestFastJSON:
+    def test_bind_and_result_roundtrip(self):
+        from app.db.models import FastJSON
+
+        col = FastJSON()
+        value = {"slides": [{"index": 0, "text": {"body": "héllo"}}], "n": None}
+        stored = col.process_bind_param(value, None)
+        assert isinstance(stored, str)
+        assert col.process_result_value(stored, None) == value
+
+    def test_none_passthrough(self):
+        from app.db.models import FastJSON
+
+        col = FastJSON()
+        assert col.process_bind_param(None, None) is None
+        assert col.process_result_value(None, None) is None
+
+    def test_reads_rows_written_by_stdlib_json(self):
+        import json
+
+        from app.db.models import FastJSON
+
+        legacy = json.dumps({"name": "Carousel", "prompts": {"a": "b"}})
+        assert FastJSON().process_result_value(legacy, None) == {
+            "name": "Carousel",
+            "prompts": {"a": "b"},
+        }
+
+
+class TestSchemaVersion:
+    def _version(self):
+        async def _select():
+            async with engine.connect() as conn:
+                return (
+                    await conn.execute(text("SELECT MAX(version) FROM schema_version"))
+                ).scalar()
+
+        return run_async(_select())
+
+    def test_migrations_record_version(self):
+        from app.services.matrix_db import SCHEMA_VERSION, MatrixDB
+
+        run_async(MatrixDB.run_migrations())
+        assert self._version() == SCHEMA_VERSION
+
+    def test_up_to_date_schema_skips_alter_statements(self, monkeypatch):
+        from app.services import matrix_db
+
+        run_async(matrix_db.MatrixDB.run_migrations())
+        monkeypatch.setattr(matrix_db, "_NEW_COLUMN_MIGRATIONS", (text("SELECT nope"),))
+        run_async(matrix_db.MatrixDB.run_migrations())
+
+    def test_outdated_schema_reruns_migrations(self):
+        from app.services.matrix_db import SCHEMA_VERSION, MatrixDB
+
+        async def _reset():
+            async with engine.begin() as conn:
+                await conn.execute(text("DELETE FROM schema_version"))
+
+        run_async(_reset())
+        run_async(MatrixDB.run_migrations())
+        assert self._version() == SCHEMA_VERSION
+
+
+class TestReadonlySessions:
+    def test_readonly_engine_is_autocommit(self):
+        from app.db.database import readonly_engine
+
+        assert readonly_engine.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+        assert readonly_engine.pool is engine.pool
+
+    def test_get_db_readonly_yields_working_session(self):
+        from app.db.database import get_db_readonly
+
+        async def _query():
+            gen = get_db_readonly()
+            session = await gen.__anext__()
+            try:
+                return (await session.execute(text("SELECT 1"))).scalar()
+            finally:
+                await gen.aclose()
+
+        assert run_async(_query()) == 1
+
+    def test_managers_read_through_readonly_factory(self):
+        from app.db.database import readonly_session_factory
+        from app.dependencies import container
+
+        assert container.project_manager._readonly_session_factory is readonly_session_factory
+        assert container.template_manager._readonly_session_factory is readonly_session_factory
+
+    def test_injected_factory_used_for_reads_when_no_readonly_given(self):
+        from app.db.database import async_session_factory
+        from app.services.project_manager import ProjectManager
+
+        pm = ProjectManager(session_factory=async_session_factory)
+        assert pm._readonly_session_factory is async_session_factory
+
+
+class TestIndexes:
+    def _index_names(self, eng):
+        async def _names():
+            async with eng.connect() as conn:
+                result = await conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type='index'")
+                )
+                return {row[0] for row in result}
+
+        return run_async(_names())
+
+    def test_init_db_creates_listing_indexes(self):
+        names = self._index_names(engine)
+        assert {
+            "ix_projects_updated_at",
+            "ix_templates_name",
+            "ix_matrix_projects_updated_at",
+            "ix_matrix_cells_project_pos",
+        } <= names
+
+    def test_init_db_adds_indexes_to_existing_tables(self, tmp_path):
+        from app.db.database import init_db
+
+        eng = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+
+        async def _setup_and_drop():
+            await init_db(eng)
+            async with eng.begin() as conn:
+                await conn.execute(text("DROP INDEX ix_projects_updated_at"))
+            await init_db(eng)
+
+        try:
+            run_async(_setup_and_drop())
+            assert "ix_projects_updated_at" in self._index_names(eng)
+        finally:
+            run_async(eng.dispose())
+
+
+class TestJSONText:
+    def test_prerendered_json_stored_verbatim(self):
+        from app.db.models import FastJSON, JSONText
+
+        raw = JSONText('{"a":1}')
+        assert FastJSON().process_bind_param(raw, None) is raw
+
+    def test_plain_strings_still_encoded(self):
+        from app.db.models import FastJSON
+
+        assert FastJSON().process_bind_param("a", None) == '"a"'
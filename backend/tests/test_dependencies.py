@@ -0,0 +1,242 @@
+"""Tests for the ServiceContainer dependency wiring."""
+
+import asyncio
+import inspect
+from unittest.mock import MagicMock, patch
+
+from app.dependencies import ServiceContainer, container, get_stage_draft_service
+
+
+class TestServiceContainer:
+    def test_services_not_built_until_accessed(self):
+        fresh = ServiceContainer()
+        assert "gemini_service" not in vars(fresh)
+        assert "stage_draft" not in vars(fresh)
+
+    def test_service_built_once_and_cached(self):
+        fresh = ServiceContainer()
+        with patch("app.dependencies.GeminiService") as mock_cls:
+            first = fresh.gemini_service
+            second = fresh.gemini_service
+        assert first is second
+        mock_cls.assert_called_once_with()
+
+    def test_stage_services_share_dependencies(self):
+        fresh = ServiceContainer()
+        assert fresh.stage_draft.gemini_service is fresh.gemini_service
+        assert fresh.stage_prompts.gemini_service is fresh.gemini_service
+        assert fresh.stage_draft.prompt_loader is fresh.stage_research.prompt_loader
+
+    def test_provider_returns_container_singleton(self):
+        assert asyncio.run(get_stage_draft_service()) is container.stage_draft
+
+
+class TestProviders:
+    def test_every_provider_resolves_its_container_attribute(self):
+        import app.dependencies as deps
+
+        providers = {
+            name: fn for name, fn in vars(deps).items()
+            if name.startswith("get_") and callable(fn)
+        }
+        assert len(providers) == 20
+        for fn in providers.values():
+            attr = fn.__name__.removeprefix("get_")
+            assert asyncio.run(fn()) is getattr(container, attr)
+
+    def test_provider_metadata(self):
+        from app.dependencies import get_project_manager
+
+        assert get_project_manager.__name__ == "get_project_manager"
+        assert "ProjectManager" in get_project_manager.__doc__
+
+    def test_providers_resolve_on_the_event_loop(self):
+        """Async providers skip FastAPI's threadpool hop for sync dependencies."""
+        import app.dependencies as deps
+
+        providers = [
+            fn for name, fn in vars(deps).items()
+            if name.startswith("get_") and callable(fn)
+        ]
+        assert all(inspect.iscoroutinefunction(fn) for fn in providers)
+
+    def test_annotated_aliases_wrap_the_providers(self):
+        """Each ``<Service>Dep`` alias depends on the matching ``get_*`` provider."""
+        from typing import get_args
+
+        import app.dependencies as deps
+
+        aliases = {name: v for name, v in vars(deps).items() if name.endswith("Dep")}
+        assert len(aliases) == 20
+        for name, alias in aliases.items():
+            service_type, marker = get_args(alias)
+            assert service_type.__name__ == name.removesuffix("Dep")
+            assert asyncio.run(marker.dependency()) is getattr(
+                container, marker.dependency.__name__.removeprefix("get_")
+            )
+
+    def test_dependency_override_applies_through_alias(self, client):
+        """Overriding a provider swaps the service injected via its alias."""
+        from app.dependencies import get_font_manager
+        from app.main import app
+
+        fake = MagicMock()
+        fake.get_font_weights.return_value = [123]
+        app.dependency_overrides[get_font_manager] = lambda: fake
+        try:
+            response = client.get("/api/fonts/Anything")
+        finally:
+            app.dependency_overrides.pop(get_font_manager)
+        assert response.json() == {"family": "Anything", "weights": [123]}
+
+
+class TestSharedGenaiClient:
+    def test_text_and_image_services_share_one_client(self):
+        """Both Gemini-backed services reuse a single client (and its pool)."""
+        from app.services.gemini_service import GeminiService, get_genai_client
+        from app.services.image_service import ImageService
+
+        get_genai_client.cache_clear()
+        try:
+            with (
+                patch("app.services.gemini_service.GOOGLE_API_KEY", "key"),
+                patch("app.services.image_service.GOOGLE_API_KEY", "key"),
+                patch("google.genai.Client") as mock_client,
+            ):
+                text, image = GeminiService(), ImageService()
+                text._ensure_configured()
+                image._ensure_configured()
+            mock_client.assert_called_once()
+            assert mock_client.call_args.kwargs["api_key"] == "key"
+            assert text._client is image._client is mock_client.return_value
+        finally:
+            get_genai_client.cache_clear()
+
+    def test_client_pool_keeps_a_connection_per_slot(self):
+        from app.services import gemini_service
+
+        gemini_service.get_genai_client.cache_clear()
+        try:
+            with patch("google.genai.Client") as mock_client:
+                gemini_service.get_genai_client()
+            options = mock_client.call_args.kwargs["http_options"]
+            limits = options.client_args["limits"]
+            assert limits.max_keepalive_connections == gemini_service.GEMINI_MAX_CONCURRENCY
+            assert limits.keepalive_expiry == gemini_service._KEEPALIVE_EXPIRY_SECONDS
+        finally:
+            gemini_service.get_genai_client.cache_clear()
+
+    def test_close_only_touches_a_client_that_exists(self):
+        from app.services import gemini_service
+
+        gemini_service.get_genai_client.cache_clear()
+        with patch("google.genai.Client") as mock_client:
+            gemini_service.close_genai_client()
+            mock_client.assert_not_called()
+            gemini_service.get_genai_client()
+            gemini_service.close_genai_client()
+        mock_client.return_value.close.assert_called_once_with()
+        assert gemini_service.get_genai_client.cache_info().currsize == 0
+
+    def test_close_resets_services_so_they_rebind_to_a_fresh_client(self):
+        """Services never keep using a client whose pool has been closed."""
+        from app.services import gemini_service
+        from app.services.gemini_service import GeminiService
+        from app.services.image_service import ImageService
+
+        gemini_service.get_genai_client.cache_clear()
+        try:
+            with (
+                patch("app.services.gemini_service.GOOGLE_API_KEY", "key"),
+                patch("app.services.image_service.GOOGLE_API_KEY", "key"),
+                patch("google.genai.Client", side_effect=[MagicMock(), MagicMock()]),
+            ):
+                text, image = GeminiService(), ImageService()
+                text._ensure_configured()
+                image._ensure_configured()
+                closed = text._client
+
+                gemini_service.close_genai_client()
+                assert (text._client, text._configured) == (None, False)
+                assert (image._client, image._configured) == (None, False)
+
+                text._ensure_configured()
+                image._ensure_configured()
+            closed.close.assert_called_once_with()
+            assert text._client is image._client is not closed
+        finally:
+            gemini_service.get_genai_client.cache_clear()
+
+
+class TestGeminiConcurrencyCap:
+    def test_calls_beyond_the_cap_wait_for_a_free_slot(self):
+        """No more than GEMINI_MAX_CONCURRENCY requests reach the SDK at once."""
+        import threading
+        import time
+
+        from app.services.gemini_service import GeminiService
+        from tests.conftest import run_async
+
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def generate_content(**kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return MagicMock(text="ok")
+
+        service = GeminiService()
+        service._configured = True
+        service._client = MagicMock()
+        service._client.models.generate_content.side_effect = generate_content
+
+        async def fan_out():
+            return await asyncio.gather(
+                *(service.generate_text(f"p{i}") for i in range(6))
+            )
+
+        with patch("app.services.gemini_service.GEMINI_MAX_CONCURRENCY", 2):
+            results = run_async(fan_out())
+        assert results == ["ok"] * 6
+        assert peak == 2
+
+
+class TestRequestPacer:
+    def test_burst_up_to_budget_then_spaces_requests(self):
+        from app.services import gemini_service
+
+        now = [100.0]
+        with patch.object(gemini_service.time, "monotonic", lambda: now[0]):
+            pacer = gemini_service._RequestPacer(per_minute=2)
+            assert pacer.reserve() == 0.0
+            assert pacer.reserve() == 0.0
+            # Bucket empty: the next two wait one and two refill periods.
+            assert pacer.reserve() == 30.0
+            assert pacer.reserve() == 60.0
+            now[0] += 90.0
+            assert pacer.reserve() == 0.0
+
+    def test_slot_sleeps_for_the_reserved_delay(self):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from app.services import gemini_service
+        from tests.conftest import run_async
+
+        pacer = MagicMock(reserve=MagicMock(return_value=1.5))
+        sleep = AsyncMock()
+
+        async def use_slot():
+            async with gemini_service.gemini_slot():
+                pass
+
+        with (
+            patch.object(gemini_service, "_pacer", pacer),
+            patch.object(gemini_service.asyncio, "sleep", sleep),
+        ):
+            run_async(use_slot())
+        sleep.assert_awaited_once_with(1.5)
@@ -95,6 +95,20 @@ class TestExportService:
             slide_files = [n for n in names if n.startswith("slides/")]
             assert len(slide_files) == 3
 
+    def test_export_project_stores_images_uncompressed(self, project_with_final_images):
+        """Images are stored as-is; only the text entries are deflated."""
+        zip_buffer = run_async(
+            export_service.export_project(project_with_final_images.project_id)
+        )
+        with zipfile.ZipFile(zip_buffer, "r") as zf:
+            for info in zf.infolist():
+                expected = (
+                    zipfile.ZIP_STORED
+                    if info.filename.startswith("slides/")
+                    else zipfile.ZIP_DEFLATED
+                )
+                assert info.compress_type == expected, info.filename
+
     def test_export_project_metadata(self, project_with_final_images):
         """Test metadata in exported ZIP."""
         zip_buffer = run_async(
@@ -196,7 +210,9 @@ class TestExportRoutes:
         )
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/zip"
-        assert "attachment" in response.headers["content-disposition"]
+        assert response.headers["content-disposition"] == (
+            f"attachment; filename=lucid_carousel_{project_with_final_images.project_id}.zip"
+        )
 
         # Verify it's a valid ZIP
         zip_buffer = BytesIO(response.content)
@@ -210,6 +226,14 @@ class TestExportRoutes:
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/zip"
 
+    def test_export_zip_sent_with_content_length(self, client, project_with_final_images):
+        """The in-memory archive is sent as one sized body, not a chunked stream."""
+        project_id = project_with_final_images.project_id
+        response = client.get(f"/api/export/zip/{project_id}")
+        assert response.status_code == 200
+        assert int(response.headers["content-length"]) == len(response.content)
+        assert "transfer-encoding" not in response.headers
+
     def test_export_zip_no_project(self, client):
         """Test ZIP export with no project."""
         response = client.post(
@@ -140,3 +140,33 @@ class TestFontRoutes:
         data = response.json()
         assert "mappings" in data
         assert isinstance(data["mappings"], dict)
+
+    def test_list_fonts_reencoded_after_cache_clear(self, client):
+        """A cleared font cache yields a fresh list and a re-encoded body."""
+        from app.dependencies import container
+        from app.routes import fonts as fonts_routes
+
+        first = client.get("/api/fonts/").json()
+        source = fonts_routes._fonts_body._source
+        container.font_manager.clear_cache()
+        assert client.get("/api/fonts/").json() == first
+        assert fonts_routes._fonts_body._source is not source
+
+    def test_font_mappings_revalidation_returns_304(self, client):
+        """A matching If-None-Match yields an empty 304 with the same ETag."""
+        first = client.get("/api/fonts/mappings")
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+
+        response = client.get("/api/fonts/mappings", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_font_mappings_weight_keys_serialised_as_strings(self, client):
+        """Integer weight keys are emitted as JSON object keys by orjson."""
+        response = client.get("/api/fonts/mappings")
+        assert response.headers["content-type"] == "application/json"
+        for family, weights in response.json()["mappings"].items():
+            for weight, name in weights.items():
+                assert name == f"{family}-{weight}"
@@ -1,5 +1,6 @@
 """Tests for main application setup."""
 
+import asyncio
 from unittest.mock import patch
 
 from app.dependencies import container
@@ -86,6 +87,120 @@ def test_rate_limiter_returns_429(client):
     _limiter._hits.clear()
 
 
+def test_batch_generation_over_per_ip_cap_returns_429(client):
+    """A client already running its maximum of generations is refused."""
+    from app.routes import utils
+
+    limiter = utils._generation_limiter
+    for _ in range(limiter._max):
+        assert limiter.try_acquire("testclient")
+    try:
+        response = client.post(
+            "/api/stage-images/generate", json={"project_id": "missing"}
+        )
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "5"
+    finally:
+        limiter._in_flight.clear()
+
+
+def test_batch_generation_slot_held_until_stream_ends(client):
+    """A streamed generation keeps its slot for the whole stream, then frees it."""
+    from unittest.mock import patch
+
+    from app.routes import utils
+    from app.services.stage_images_service import StageImagesService
+
+    limiter = utils._generation_limiter
+    seen = []
+
+    async def fake_stream(self, project_id, concurrency_limit):
+        seen.append(dict(limiter._in_flight))
+        yield {"index": 0}
+
+    with patch.object(StageImagesService, "stream_all_images", fake_stream):
+        response = client.post(
+            "/api/stage-images/generate-stream", json={"project_id": "p"}
+        )
+    assert response.status_code == 200
+    assert seen == [{"testclient": 1}]
+    assert limiter._in_flight == {}
+
+
+def test_batch_generation_cap_keys_on_forwarded_client_behind_trusted_proxy(client):
+    """Behind a trusted proxy, one browser's full cap does not block another."""
+    import ipaddress
+
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.routes import utils
+
+    proxied = TestClient(app, client=("172.18.0.3", 50000))
+    limiter = utils._generation_limiter
+    for _ in range(limiter._max):
+        assert limiter.try_acquire("100.64.0.5")
+    try:
+        with patch.object(
+            utils, "TRUSTED_PROXIES", (ipaddress.ip_network("172.16.0.0/12"),)
+        ):
+            busy = proxied.post(
+                "/api/stage-images/generate",
+                json={"project_id": "missing"},
+                headers={"X-Forwarded-For": "100.64.0.5"},
+            )
+            other = proxied.post(
+                "/api/stage-images/generate",
+                json={"project_id": "missing"},
+                headers={"X-Forwarded-For": "100.64.0.9"},
+            )
+        assert busy.status_code == 429
+        assert other.status_code == 404
+    finally:
+        limiter._in_flight.clear()
+
+
+def test_client_address_ignores_forwarded_header_from_untrusted_peer():
+    """Only a trusted proxy may name the client, and only its own hop counts."""
+    import ipaddress
+
+    from starlette.requests import Request
+
+    from app.routes import utils
+
+    def address(peer, forwarded):
+        return utils.client_address(
+            Request({
+                "type": "http",
+                "client": (peer, 1234),
+                "headers": [(b"x-forwarded-for", forwarded.encode())],
+            })
+        )
+
+    with patch.object(
+        utils, "TRUSTED_PROXIES", (ipaddress.ip_network("172.16.0.0/12"),)
+    ):
+        assert address("100.64.0.5", "203.0.113.1") == "100.64.0.5"
+        assert address("172.18.0.3", "203.0.113.1, 100.64.0.5") == "100.64.0.5"
+        assert address("172.18.0.3", "100.64.0.5, 172.18.0.1") == "100.64.0.5"
+        assert address("172.18.0.3", "") == "172.18.0.3"
+    assert address("172.18.0.3", "100.64.0.5") == "172.18.0.3"
+
+
+def test_in_flight_limiter_zero_disables_cap():
+    from app.routes.utils import InFlightLimiter
+
+    limiter = InFlightLimiter(max_in_flight=0)
+    assert all(limiter.try_acquire("ip") for _ in range(50))
+
+    capped = InFlightLimiter(max_in_flight=1)
+    assert capped.try_acquire("a")
+    assert not capped.try_acquire("a")
+    assert capped.try_acquire("b")
+    capped.release("a")
+    assert capped.try_acquire("a")
+
+
 def test_info_endpoint_returns_200(client):
     """GET /api/info returns HTTP 200."""
     response = client.get("/api/info")
@@ -106,3 +221,155 @@ def test_info_endpoint_commit_fields_present(client):
     for field in ("commit_hash", "commit_short", "commit_date"):
         assert field in data
         assert data[field] is None or isinstance(data[field], str)
+
+
+def test_lifespan_initialises_database(caplog):
+    """Startup runs init, seeding, matrix migrations and pool warm-up without error."""
+    from app.main import app, lifespan
+
+    async def _run():
+        async with lifespan(app):
+            return await container.template_manager.list_templates()
+
+    templates = run_async(_run())
+    assert {t.name for t in templates} >= {"Carousel", "Painting"}
+    assert "Database initialisation failed" not in caplog.text
+
+
+def test_lifespan_migrates_before_seeding():
+    """Seeding only starts once the schema migrations have finished."""
+    from app.main import app, lifespan
+    from app.services.matrix_db import MatrixDB
+
+    order = []
+
+    async def migrate():
+        order.append("migrate:start")
+        await asyncio.sleep(0)
+        order.append("migrate:end")
+
+    async def seed():
+        order.append("seed")
+
+    async def _run():
+        with (
+            patch.object(MatrixDB, "run_migrations", migrate),
+            patch.object(container.template_manager, "seed_defaults", seed),
+        ):
+            async with lifespan(app):
+                pass
+
+    run_async(_run())
+    assert order == ["migrate:start", "migrate:end", "seed"]
+
+
+def test_llm_routes_start_log_flow(client):
+    """Routers that call the LLM tag the request with a log flow."""
+    create_resp = client.post("/api/projects/", json={})
+    project_id = create_resp.json()["project"]["project_id"]
+
+    with patch("app.main.start_flow") as mock_start:
+        client.get(f"/api/projects/{project_id}")
+
+    mock_start.assert_called_once()
+    assert mock_start.call_args.args[0].startswith("projects")
+
+
+def test_non_llm_routes_skip_log_flow(client):
+    """Health and config routes never start a log flow."""
+    with patch("app.main.start_flow") as mock_start:
+        client.get("/health")
+        client.get("/api/config")
+        client.get("/api/fonts/")
+
+    mock_start.assert_not_called()
+
+
+def test_parse_origins_trims_and_deduplicates():
+    """CORS origins from the env var are stripped, de-blanked and de-duplicated."""
+    from app.main import _parse_origins
+
+    raw = " http://a.test ,http://b.test,,http://a.test, "
+    assert _parse_origins(raw) == ["http://a.test", "http://b.test"]
+
+
+def test_orjson_response_renders_non_str_keys():
+    """The orjson-backed response serialises like JSONResponse, int keys included."""
+    from app.routes.utils import ORJSONResponse
+
+    response = ORJSONResponse(content={"detail": "x", 700: "bold"})
+    assert response.body == b'{"detail":"x","700":"bold"}'
+    assert response.media_type == "application/json"
+
+
+def test_health_probes_hidden_from_openapi(client):
+    """Liveness endpoints stay out of the OpenAPI schema; API routers stay in."""
+    paths = client.get("/openapi.json").json()["paths"]
+    assert "/" not in paths
+    assert "/health" not in paths
+    assert "/api/projects/" in paths
+    assert "/api/matrix-settings" in paths or "/api/matrix-settings/" in paths
+
+
+def test_model_routes_keep_pydantic_json_fast_path():
+    """Routes with a response model must keep the default response class.
+
+    FastAPI only serialises straight to JSON via Pydantic's core when the
+    response class is left at its default placeholder.
+    """
+    from fastapi.datastructures import DefaultPlaceholder
+    from fastapi.routing import APIRoute
+
+    from app.main import _ROUTER_TABLE, app
+
+    assert isinstance(app.router.default_response_class, DefaultPlaceholder)
+    model_routes = 0
+    for router, _name, _uses_llm in _ROUTER_TABLE:
+        for route in router.routes:
+            if isinstance(route, APIRoute) and route.response_model is not None:
+                model_routes += 1
+                assert isinstance(route.response_class, DefaultPlaceholder), route.path
+    assert model_routes
+
+
+def test_json_responses_gzip_compressed(client):
+    """Large JSON bodies are gzip-encoded for clients that accept it."""
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "paths" in response.json()
+
+
+def test_small_and_uncompressed_requests_skip_gzip(client):
+    """Tiny bodies and clients without gzip support get identity responses."""
+    assert "content-encoding" not in client.get("/health").headers
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+
+
+def test_lifespan_preloads_prompt_files():
+    """Startup reads the prompt files so generation starts from a warm cache."""
+    from app.main import app, lifespan
+    from app.services.prompt_loader import PROMPT_FILES, PromptLoader
+
+    loader = PromptLoader()
+
+    async def _run():
+        with patch.object(container, "prompt_loader", loader):
+            async with lifespan(app):
+                pass
+
+    run_async(_run())
+    assert set(loader._cache) == set(PROMPT_FILES)
+
+
+def test_lifespan_closes_shared_genai_client():
+    """Shutdown releases the pooled Gemini connections."""
+    from app.main import app, lifespan
+
+    async def _run():
+        async with lifespan(app):
+            pass
+
+    with patch("app.main.close_genai_client") as close:
+        run_async(_run())
+    close.assert_called_once_with()
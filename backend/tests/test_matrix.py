@@ -1018,6 +1018,26 @@ class TestMatrixRoutes:
         assert s["max_concurrency"] == 4
         assert s["max_retries"] == 3
 
+    def test_settings_writes_run_off_the_event_loop(self, client):
+        """The settings-file write runs in the threadpool, not on the loop."""
+        from app.dependencies import container
+
+        seen = []
+
+        def record(settings):
+            try:
+                asyncio.get_running_loop()
+                seen.append("loop")
+            except RuntimeError:
+                seen.append("thread")
+            return settings
+
+        with patch.object(container.matrix_settings_manager, "update", side_effect=record):
+            client.post("/api/matrix-settings/reset")
+        # The route handed the service the unsaved defaults; restore its settings.
+        container.matrix_service.load_settings(container.matrix_settings_manager.get())
+        assert seen == ["thread"]
+
     def test_generate_images_not_found(self, client):
         resp = client.post("/api/matrix/nonexistent-id/generate-images")
         assert resp.status_code == 404
@@ -1363,7 +1383,9 @@ class TestMatrixPromptFormatting:
     @pytest.fixture
     def loader(self):
         from app.services.prompt_loader import PromptLoader
-        return PromptLoader()
+        loader = PromptLoader()
+        loader.load_all()
+        return loader
 
     @pytest.mark.parametrize("name,kwargs,sentinel", [
         (
@@ -174,6 +174,31 @@ class TestProjectState:
         assert project.slides[0].index == 0
         assert project.slides[2].index == 2
 
+    def test_ensure_slides_appends_default_slides(self):
+        """ensure_slides pads with default slides and never shrinks."""
+        project = ProjectState(project_id="test-789", slides=[Slide(index=0)])
+        project.ensure_slides(3)
+        assert [s.index for s in project.slides] == [0, 1, 2]
+        assert project.slides[2].model_dump() == Slide(index=2).model_dump()
+        project.ensure_slides(1)
+        assert len(project.slides) == 3
+
+    def test_get_slide_bounds(self):
+        """get_slide returns None outside 0..len-1, including negatives."""
+        project = ProjectState(project_id="p", slides=[Slide(index=0), Slide(index=1)])
+        assert project.get_slide(1).index == 1
+        assert project.get_slide(2) is None
+        assert project.get_slide(-1) is None
+
+    def test_timestamps_are_timezone_aware(self):
+        """Default and refreshed timestamps carry UTC tzinfo."""
+        project = ProjectState(project_id="p")
+        assert project.created_at.tzinfo is not None
+        before = project.updated_at
+        project.update_timestamp()
+        assert project.updated_at.tzinfo is not None
+        assert project.updated_at >= before
+
     def test_project_config_get_prompt(self):
         """Test ProjectConfig.get_prompt returns None when not set."""
         config = ProjectConfig()
@@ -194,3 +219,144 @@ class TestProjectState:
         time.sleep(0.01)
         project.update_timestamp()
         assert project.updated_at > old_time
+
+
+class TestLucidBaseModel:
+    def test_all_models_defer_schema_build(self):
+        import inspect
+
+        from app.models import config, matrix, project, slide, style, style_proposal
+        from app.models._base import LucidBaseModel
+
+        for module in (config, matrix, project, slide, style, style_proposal):
+            for name, obj in vars(module).items():
+                if inspect.isclass(obj) and obj.__module__ == module.__name__:
+                    if hasattr(obj, "model_config"):
+                        assert issubclass(obj, LucidBaseModel), name
+
+    def test_package_exports_resolve_lazily(self):
+        import app.models as models
+
+        assert sorted(models.__all__) == sorted(models._LAZY_EXPORTS)
+        for name in models.__all__:
+            assert getattr(models, name).__name__ == name
+
+    def test_deferred_model_builds_on_first_use(self):
+        from app.models._base import LucidBaseModel
+
+        class _Probe(LucidBaseModel):
+            value: int = 0
+
+        assert _Probe.model_config["defer_build"] is True
+        assert _Probe(value=3).model_dump() == {"value": 3}
+
+    def test_state_models_ignore_stale_fields_and_skip_assignment_checks(self):
+        project = ProjectState.model_validate(
+            {"project_id": "p", "removed_legacy_field": 1}
+        )
+        assert not hasattr(project, "removed_legacy_field")
+        slide = Slide(index=0)
+        slide.index = -1  # not revalidated on assignment
+        assert slide.index == -1
+
+    def test_request_bodies_built_eagerly(self):
+        from app.models.config import AppConfig
+        from app.models.project import CreateProjectRequest
+
+        assert AppConfig.__pydantic_complete__
+        assert CreateProjectRequest.__pydantic_complete__
+
+    def test_route_request_bodies_share_request_base(self):
+        import importlib
+        import inspect
+        import pkgutil
+
+        import app.routes
+        from app.models._base import RequestBodyModel
+
+        for info in pkgutil.iter_modules(app.routes.__path__):
+            module = importlib.import_module(f"app.routes.{info.name}")
+            for name, obj in vars(module).items():
+                if (
+                    inspect.isclass(obj)
+                    and obj.__module__ == module.__name__
+                    and name.endswith("Request")
+                ):
+                    assert issubclass(obj, RequestBodyModel), name
+
+
+class TestProjectConfigFromAppConfig:
+    def test_sections_shared_not_copied(self):
+        from app.models.config import AppConfig
+        from app.models.project import ProjectConfig
+
+        app_config = AppConfig()
+        prompts = {"slide_generation": "x"}
+        pc = ProjectConfig.from_app_config(app_config, prompts)
+        assert pc.style is app_config.style
+        assert pc.image is app_config.image
+        assert pc.prompts == prompts and pc.prompts is not prompts
+
+    def test_sections_are_frozen(self):
+        from app.models.config import StyleConfig
+
+        style = StyleConfig()
+        with pytest.raises(ValidationError):
+            style.default_font_size_px = 10
+        assert style.model_copy(update={"default_font_size_px": 10}).default_font_size_px == 10
+
+
+class TestHexColorTypes:
+    def test_stroke_rejects_alpha_channel(self):
+        with pytest.raises(ValidationError):
+            StrokeStyle(color="#00000080")
+
+    def test_shadow_and_text_accept_alpha_channel(self):
+        assert ShadowStyle(color="#11223344").color == "#11223344"
+        assert TextStyle(text_color="#11223344").text_color == "#11223344"
+
+    def test_invalid_colour_rejected(self):
+        with pytest.raises(ValidationError):
+            TextStyle(text_color="red")
+
+
+class TestSharedStyleDefaults:
+    def test_default_sub_styles_are_shared(self):
+        a, b = TextStyle(), TextStyle()
+        assert a.title_box is b.title_box
+        assert a.stroke is b.stroke and a.shadow is b.shadow
+        assert a.body_box.y_pct == 0.35
+
+    def test_sub_styles_are_frozen(self):
+        style = TextStyle()
+        with pytest.raises(ValidationError):
+            style.stroke.enabled = True
+        assert TextStyle().stroke.enabled is False
+
+
+class TestLazyPackageExports:
+    def test_exports_resolve_to_submodule_classes(self):
+        import app.models as models
+        from app.models.slide import Slide as SlideCls
+
+        assert models.Slide is SlideCls
+        assert set(models.__all__) <= set(dir(models))
+
+    def test_unknown_name_raises_attribute_error(self):
+        import app.models as models
+
+        with pytest.raises(AttributeError):
+            models.NoSuchModel
+
+    def test_submodule_import_does_not_load_siblings(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, app.models.style_proposal; "
+            "print('app.models.config' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
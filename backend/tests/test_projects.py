@@ -2,6 +2,8 @@
 
 import pytest
 
+from tests.conftest import run_async
+
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
@@ -158,3 +160,62 @@ class TestReorderSlides:
             "/api/projects/does-not-exist/reorder", json={"new_order": [0, 1, 2]}
         )
         assert resp.status_code == 404
+
+
+class TestListProjectsCache:
+    def test_rename_invalidates_cached_cards(self, client):
+        pid = _pid(_create_project(client))
+        client.get("/api/projects/")
+        client.patch(f"/api/projects/{pid}/name", json={"name": "Renamed"})
+        cards = client.get("/api/projects/").json()["projects"]
+        assert cards[0]["name"] == "Renamed"
+
+    def test_unchanged_table_reuses_cards(self):
+        from app.dependencies import container
+
+        pm = container.project_manager
+        run_async(pm.create_project())
+        first = run_async(pm.list_projects())
+        second = run_async(pm.list_projects())
+        assert first == second
+        assert first is not second
+        assert first[0] is second[0]
+
+    def test_write_behind_newest_timestamp_invalidates_cached_cards(self):
+        """A commit stamped earlier than the newest row is still picked up."""
+        from unittest.mock import patch
+
+        from app.dependencies import container
+        from app.models.project import ProjectState
+
+        pm = container.project_manager
+        older = run_async(pm.create_project(name="Older"))
+        run_async(pm.create_project(name="Newer"))
+        run_async(pm.list_projects())
+
+        # Keep the stale updated_at, as a save stamped before another commit would.
+        older.name = "Renamed"
+        with patch.object(ProjectState, "update_timestamp"):
+            run_async(pm.update_project(older))
+        names = {card.name for card in run_async(pm.list_projects())}
+        assert names == {"Renamed", "Newer"}
+
+    def test_delete_invalidates_cached_cards(self, client):
+        pid = _pid(_create_project(client))
+        assert len(client.get("/api/projects/").json()["projects"]) == 1
+        client.delete(f"/api/projects/{pid}")
+        assert client.get("/api/projects/").json()["projects"] == []
+
+
+class TestResponseEnvelopes:
+    def test_get_project_wraps_the_loaded_state_without_copying(self):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from app.models.project import ProjectResponse, ProjectState
+        from app.routes.projects import get_project
+
+        state = ProjectState(project_id="p")
+        pm = MagicMock(get_project=AsyncMock(return_value=state))
+        response = run_async(get_project("p", pm))
+        assert isinstance(response, ProjectResponse)
+        assert response.project is state
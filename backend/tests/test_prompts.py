@@ -1,5 +1,7 @@
 """Tests for /api/prompts endpoints."""
 
+import pytest
+
 from app.services.prompt_loader import PROMPT_FILES
 
 
@@ -65,6 +67,40 @@ def test_update_prompt_known_name_saves(client):
         )
 
 
+def test_prompt_file_io_runs_off_the_event_loop(client):
+    """Prompt reads and writes are dispatched to a worker thread."""
+    import asyncio
+    from unittest.mock import patch
+
+    from app.dependencies import container
+
+    seen = []
+
+    def record(*args):
+        try:
+            asyncio.get_running_loop()
+            seen.append("loop")
+        except RuntimeError:
+            seen.append("thread")
+        return {}
+
+    loader = container.prompt_loader
+    with (
+        patch.object(loader, "load_all", side_effect=record),
+        patch.object(loader, "save", side_effect=record),
+    ):
+        client.get("/api/prompts")
+        client.put(
+            "/api/prompts/style_proposal",
+            json={
+                "prompt_name": "style_proposal",
+                "content": "{num_proposals} {slides_text} "
+                "{additional_instructions} {response_format}",
+            },
+        )
+    assert seen == ["thread", "thread"]
+
+
 def test_update_prompts_patch_unknown_name_returns_400(client):
     """PATCH /api/prompts with an unknown name in batch returns 400."""
     response = client.patch(
@@ -75,6 +111,22 @@ def test_update_prompts_patch_unknown_name_returns_400(client):
     assert "Unknown prompt" in response.json()["detail"]
 
 
+def test_update_prompts_patch_writes_nothing_when_any_entry_invalid(client):
+    """A single invalid entry rejects the batch before any file is written."""
+    from unittest.mock import patch
+
+    from app.dependencies import container
+
+    valid = "{num_proposals} {slides_text} {additional_instructions} {response_format}"
+    with patch.object(container.prompt_loader, "save") as mock_save:
+        response = client.patch(
+            "/api/prompts",
+            json={"prompts": {"style_proposal": valid, "nope": "content"}},
+        )
+    assert response.status_code == 400
+    mock_save.assert_not_called()
+
+
 def test_update_prompts_patch_empty_dict(client):
     """PATCH /api/prompts with an empty dict updates 0 prompts gracefully."""
     response = client.patch("/api/prompts", json={"prompts": {}})
@@ -128,3 +180,99 @@ def test_reset_prompts_returns_501(client):
     """POST /api/prompts/reset always returns 501 (not implemented)."""
     response = client.post("/api/prompts/reset")
     assert response.status_code == 501
+
+
+def test_read_prompt_path_reuses_content_while_mtime_unchanged(tmp_path, monkeypatch):
+    import os
+
+    from app.services import prompt_loader
+
+    monkeypatch.setattr(prompt_loader, "_file_cache", {})
+    path = tmp_path / "p.prompt"
+    path.write_text("first")
+    stat = path.stat()
+    assert prompt_loader.read_prompt_path(path) == "first"
+
+    # Same mtime: served from cache even though the bytes changed.
+    path.write_text("other")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert prompt_loader.read_prompt_path(path) == "first"
+
+    # New mtime: re-read.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert prompt_loader.read_prompt_path(path) == "other"
+
+
+def test_load_prompt_file_missing_returns_empty_string(tmp_path, monkeypatch):
+    from app.services import prompt_loader
+
+    monkeypatch.setattr(prompt_loader, "PROMPTS_DIR", tmp_path)
+    assert prompt_loader.load_prompt_file("missing.prompt") == ""
+
+
+def test_prompt_loader_serves_prompts_from_preload_only(monkeypatch):
+    """get_cached never reads from disk: a miss before load_all is an error."""
+    from app.services import prompt_loader
+
+    loader = prompt_loader.PromptLoader()
+    with pytest.raises(LookupError):
+        loader.get_cached("slide_generation")
+
+    loader.load_all()
+    monkeypatch.setattr(
+        prompt_loader.Path, "read_bytes", lambda self: pytest.fail("disk read")
+    )
+    assert loader.get_cached("slide_generation")
+
+
+def test_prompt_loader_unknown_name_returns_empty_string():
+    from app.services.prompt_loader import PromptLoader
+
+    assert PromptLoader().get_cached("no_such_prompt") == ""
+
+
+def test_read_prompt_path_decodes_utf8(tmp_path, monkeypatch):
+    from app.services import prompt_loader
+
+    monkeypatch.setattr(prompt_loader, "_file_cache", {})
+    path = tmp_path / "u.prompt"
+    path.write_bytes("Café — {slide}".encode("utf-8"))
+    assert prompt_loader.read_prompt_path(path) == "Café — {slide}"
+
+
+def test_save_refreshes_file_cache_within_same_mtime(tmp_path, monkeypatch):
+    import os
+
+    from app.services import prompt_loader
+
+    monkeypatch.setattr(prompt_loader, "_file_cache", {})
+    path = tmp_path / PROMPT_FILES["slide_generation"]
+    monkeypatch.setitem(prompt_loader._PROMPT_PATHS, "slide_generation", path)
+    path.write_text("old")
+    stat = path.stat()
+    assert prompt_loader.read_prompt_path(path) == "old"
+
+    prompt_loader.PromptLoader().save("slide_generation", "new")
+    # Pin the mtime back, as a write inside a coarse mtime tick would leave it.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert prompt_loader.read_prompt_path(path) == "new"
+
+
+def test_prompt_paths_cover_every_registered_prompt():
+    from app.services import prompt_loader
+
+    assert prompt_loader._PROMPT_PATHS == {
+        name: prompt_loader.PROMPTS_DIR / filename
+        for name, filename in PROMPT_FILES.items()
+    }
+
+
+def test_save_writes_utf8_bytes_verbatim(tmp_path, monkeypatch):
+    from app.services import prompt_loader
+
+    path = tmp_path / PROMPT_FILES["slide_generation"]
+    monkeypatch.setitem(prompt_loader._PROMPT_PATHS, "slide_generation", path)
+    monkeypatch.setattr(prompt_loader, "_file_cache", {})
+
+    prompt_loader.PromptLoader().save("slide_generation", "Café\n{draft}\n")
+    assert path.read_bytes() == "Café\n{draft}\n".encode("utf-8")
@@ -49,6 +49,23 @@ class TestStage1Service:
         assert project.project_id == created.project_id
         assert len(project.slides) == 3
 
+    def test_generate_slide_texts_pads_to_requested_count(self, mock_gemini):
+        """Missing slides are padded with placeholders and independent styles."""
+        created = run_async(project_manager.create_project())
+        project = run_async(
+            stage1_service.generate_slide_texts(
+                project_id=created.project_id,
+                draft_text="Short draft",
+                num_slides=7,
+                include_titles=False,
+            )
+        )
+        assert [s.index for s in project.slides] == list(range(7))
+        assert project.slides[0].text.title is None
+        assert project.slides[0].text.body == "Content 1"
+        assert project.slides[6].text.body == "Slide 7 content"
+        assert project.slides[0].style is not project.slides[1].style
+
     def test_generate_slide_texts_stores_inputs(self, mock_gemini):
         """Test that inputs are stored in project."""
         created = run_async(project_manager.create_project())
@@ -359,6 +376,29 @@ class TestStage1Routes:
         assert data["project"]["slides"][0]["text"]["title"] == "Custom Title"
         assert data["project"]["slides"][0]["text"]["body"] == "Custom body content"
 
+    def test_regenerate_stream_route_emits_sse_frames(self, client):
+        """The streaming route wraps each chunk in an SSE data frame."""
+
+        async def fake_stream(*args, **kwargs):
+            yield "Hel"
+            yield "Hello"
+
+        with patch.object(
+            stage1_service, "regenerate_slide_text_stream", side_effect=fake_stream
+        ):
+            response = client.post(
+                "/api/stage-draft/regenerate-stream",
+                json={"project_id": "any", "slide_index": 0},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.content == (
+            b'data: {"text":"Hel"}\n\n'
+            b'data: {"text":"Hello"}\n\n'
+            b'data: {"done":true}\n\n'
+        )
+
 
 class TestWordsPerSlide:
     """Tests for words_per_slide parameter."""
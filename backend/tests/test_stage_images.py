@@ -70,6 +70,60 @@ class TestImageService:
         # Different prompts should create different images
         assert img1 != img2
 
+    def test_pil_work_runs_off_the_event_loop(self):
+        """Placeholder rendering and Gemini image resizing run in a worker thread."""
+        import asyncio
+        import threading
+        from io import BytesIO
+        from unittest.mock import MagicMock
+
+        from PIL import Image
+
+        from app.services.image_service import ImageService
+
+        main = threading.get_ident()
+        seen = []
+
+        def record(real):
+            def wrapper(*args):
+                seen.append(threading.get_ident() != main)
+                return real(*args)
+            return wrapper
+
+        buf = BytesIO()
+        Image.new("RGB", (8, 10)).save(buf, format="PNG")
+        part = MagicMock()
+        part.inline_data.data = buf.getvalue()
+        response = MagicMock()
+        response.candidates[0].content.parts = [part]
+
+        svc = ImageService()
+        svc._configured = True
+        with (
+            patch.object(svc, "_generate_placeholder", record(lambda p: "ph")),
+            patch.object(svc, "_resize_to_png_b64", record(lambda b: "png")),
+        ):
+            assert asyncio.run(svc.generate_image("x")) == "ph"
+            svc._client = MagicMock()
+            svc._client.models.generate_content.return_value = response
+            with patch("google.genai.types.GenerateContentConfig"):
+                assert asyncio.run(svc.generate_image("x")) == "png"
+        assert seen == [True, True]
+
+    def test_resize_to_png_b64_outputs_slide_sized_png(self):
+        from io import BytesIO
+
+        from PIL import Image
+
+        from app.config import IMAGE_HEIGHT, IMAGE_WIDTH
+        from app.services.image_service import ImageService
+
+        buf = BytesIO()
+        Image.new("RGB", (8, 10)).save(buf, format="JPEG")
+        out = base64.b64decode(ImageService._resize_to_png_b64(buf.getvalue()))
+        assert out[:8] == b"\x89PNG\r\n\x1a\n"
+        assert Image.open(BytesIO(out)).size == (IMAGE_WIDTH, IMAGE_HEIGHT)
+
     def test_decode_encode_roundtrip(self):
         """Test decoding and re-encoding an image via StorageService."""
         original = image_service._generate_placeholder("Test")
@@ -145,6 +199,28 @@ class TestStage3Service:
         )
         assert project is None
 
+    def test_stream_all_images_reports_failed_slides(self, project_with_prompts):
+        """A failed slide yields an error event and keeps its previous image."""
+
+        async def flaky(prompt, *args, **kwargs):
+            if "Cool blue" in prompt:
+                raise RuntimeError("quota")
+            return "iVBORw0KGgoAAAANSUhEUgAAAAoAAAAKCAYAAACNMs+9AAAAFUlEQVR42mNk+M9Qz0AEYBxVSF+FABJADq3/"
+
+        async def collect():
+            return [
+                e
+                async for e in stage3_service.stream_all_images(
+                    project_with_prompts.project_id
+                )
+            ]
+
+        with patch.object(image_service, "generate_image", flaky):
+            events = run_async(collect())
+
+        assert {"index": 1, "error": "quota"} in events
+        assert events[-1]["project"]["slides"][1]["background_image_url"] is None
+
     def test_set_image_data(self, project_with_prompts):
         """Test setting image data directly."""
         custom_data = "custombase64imagedata"
@@ -194,6 +270,48 @@ class TestStage3Routes:
         assert "project" in data
         assert data["project"]["slides"][0]["background_image_url"] is not None
 
+    def test_generate_images_stream_route(self, client, mock_image_service):
+        """The SSE route emits one event per slide, the saved project, then done."""
+        import json
+
+        created = run_async(project_manager.create_project())
+        created.slides = [
+            Slide(index=0, text=SlideText(body="A"), image_prompt="one"),
+            Slide(index=1, text=SlideText(body="B"), image_prompt="two"),
+        ]
+        run_async(project_manager.update_project(created))
+
+        response = client.post(
+            "/api/stage-images/generate-stream",
+            json={"project_id": created.project_id},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(frame.removeprefix("data: "))
+            for frame in response.text.split("\n\n")
+            if frame
+        ]
+        slide_events = events[:2]
+        assert sorted(e["index"] for e in slide_events) == [0, 1]
+        assert all(e["background_image_url"].startswith("/images/") for e in slide_events)
+        assert events[2]["project"]["thumbnail_url"] == events[2]["project"]["slides"][0][
+            "background_image_url"
+        ]
+        assert events[3] == {"done": True}
+
+        saved = run_async(project_manager.get_project(created.project_id))
+        urls = {e["index"]: e["background_image_url"] for e in slide_events}
+        assert [s.background_image_url for s in saved.slides] == [urls[0], urls[1]]
+
+    def test_generate_images_stream_missing_project_only_signals_done(self, client):
+        response = client.post(
+            "/api/stage-images/generate-stream",
+            json={"project_id": "nonexistent"},
+        )
+        assert response.status_code == 200
+        assert response.text == 'data: {"done":true}\n\n'
+
     def test_generate_images_no_project(self, client):
         """Test generate images with no project."""
         response = client.post(
@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 from app.dependencies import container
 from app.models.slide import Slide, SlideText
-from app.models.style import TextStyle
+from app.models.style import ShadowStyle, StrokeStyle, TextStyle
 from tests.conftest import run_async
 
 stage4_service = container.stage_typography
@@ -133,10 +133,8 @@ class TestRenderingService:
             font_family="Inter",
             font_size_px=48,
             text_color="#FFFFFF",
+            stroke=StrokeStyle(enabled=True, width_px=3, color="#000000"),
         )
-        style.stroke.enabled = True
-        style.stroke.width_px = 3
-        style.stroke.color = "#000000"
 
         result = rendering_service.render_text_on_image(
             background_base64=sample_image_base64,
@@ -152,10 +150,8 @@ class TestRenderingService:
             font_family="Inter",
             font_size_px=48,
             text_color="#FFFFFF",
+            shadow=ShadowStyle(enabled=True, dx=3, dy=3),
         )
-        style.shadow.enabled = True
-        style.shadow.dx = 3
-        style.shadow.dy = 3
 
         result = rendering_service.render_text_on_image(
             background_base64=sample_image_base64,
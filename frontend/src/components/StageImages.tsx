@@ -1,9 +1,10 @@
 import { useState, useRef, useEffect } from 'react';
 import * as api from '../services/api';
 import { getErrorMessage } from '../utils/error';
+import { readSSEStream } from '../utils/sse';
 import { useProject } from '../contexts/ProjectContext';
 import { usePerSlideLoading } from '../hooks/usePerSlideLoading';
-import { POLL_INTERVAL_MS } from '../constants';
+import type { ImageStreamEvent, Project } from '../types';
 import Spinner from './Spinner';
 import StageLayout from './StageLayout';
 
@@ -20,46 +21,66 @@ export default function Stage4() {
   const [loading, setLoading] = useState(false);
 
   const { isLoading: isImageLoading, startLoading: startImageLoading, stopLoading: stopImageLoading, loadingSlides: regeneratingImages } = usePerSlideLoading();
-  const pollingRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const abortRef = useRef<AbortController | null>(null);
 
-  // Clean up polling interval if component unmounts mid-generation
-  useEffect(() => {
-    return () => {
-      if (pollingRef.current) clearInterval(pollingRef.current);
-    };
-  }, []);
+  // Abort an in-flight generation stream if the component unmounts
+  useEffect(() => () => { abortRef.current?.abort(); }, []);
 
   const handleGenerate = async () => {
+    if (!project) return;
+    abortRef.current?.abort();
+    const controller = new AbortController();
+    abortRef.current = controller;
+
     setLoading(true);
     setError(null);
 
-    // Poll so the UI shows per-slide progress as images arrive
-    let pollErrors = 0;
-    pollingRef.current = setInterval(async () => {
-      try {
-        const refreshed = await api.getProject(projectId);
-        updateProject(refreshed);
-        pollErrors = 0;
-      } catch (err) {
-        if (++pollErrors >= 3) {
-          clearInterval(pollingRef.current!);
-          pollingRef.current = null;
-          setError(getErrorMessage(err, 'Lost connection during image generation'));
-        }
-      }
-    }, POLL_INTERVAL_MS);
+    // Each slide event patches this copy so updates build on one another
+    // rather than on the project captured by this render.
+    let working: Project = project;
+    const failedSlides: number[] = [];
 
     try {
-      const sess = await api.generateImages(projectId);
-      updateProject(sess);
+      const response = await fetch(api.getImagesStreamUrl(), {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ project_id: projectId }),
+        signal: controller.signal,
+      });
+
+      if (!response.ok || !response.body) {
+        const detail = await response.json().then((data) => data?.detail, () => null);
+        throw new Error(typeof detail === 'string' ? detail : `HTTP ${response.status}`);
+      }
+
+      await readSSEStream<ImageStreamEvent>(response.body, (event) => {
+        if ('project' in event) {
+          working = event.project;
+          updateProject(working);
+        } else if ('error' in event) {
+          failedSlides.push(event.index);
+        } else if ('background_image_url' in event) {
+          const { index, background_image_url } = event;
+          working = {
+            ...working,
+            slides: working.slides.map((slide, i) =>
+              i === index ? { ...slide, background_image_url } : slide,
+            ),
+          };
+          updateProject(working);
+        }
+      });
+
+      if (failedSlides.length > 0) {
+        const labels = failedSlides.sort((a, b) => a - b).map((i) => i + 1).join(', ');
+        setError(`Failed to generate images for slide(s) ${labels}`);
+      }
     } catch (err) {
+      if (err instanceof Error && err.name === 'AbortError') return;
       setError(getErrorMessage(err, 'Failed to generate images'));
     } finally {
+      if (abortRef.current === controller) abortRef.current = null;
       setLoading(false);
-      if (pollingRef.current) {
-        clearInterval(pollingRef.current);
-        pollingRef.current = null;
-      }
     }
   };
 
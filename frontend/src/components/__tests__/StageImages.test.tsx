@@ -0,0 +1,151 @@
+import { render, screen, fireEvent, waitFor } from '@testing-library/react';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import StageImages from '../StageImages';
+import type { Project, Slide } from '../../types';
+
+// ── Module mocks ───────────────────────────────────────────────────────────────
+
+const mockUpdateProject = vi.fn();
+const mockSetError = vi.fn();
+let mockProject: Project;
+
+vi.mock('../../contexts/ProjectContext', () => ({
+  useProject: () => ({
+    projectId: 'proj-1',
+    currentProject: mockProject,
+    setError: mockSetError,
+    updateProject: mockUpdateProject,
+    advanceStage: vi.fn(),
+    previousStage: vi.fn(),
+  }),
+}));
+
+vi.mock('../../services/api', () => ({
+  getImagesStreamUrl: () => '/api/stage-images/generate-stream',
+  regenerateImage: vi.fn(),
+}));
+
+// ── Factory helpers ────────────────────────────────────────────────────────────
+
+function makeSlide(index: number, overrides: Partial<Slide> = {}): Slide {
+  return {
+    index,
+    text: { title: null, body: `Body ${index + 1}` },
+    image_prompt: `Prompt ${index + 1}`,
+    background_image_url: null,
+    style: {} as Slide['style'],
+    final_image_url: null,
+    ...overrides,
+  };
+}
+
+function makeProject(slides: Slide[]): Project {
+  return {
+    project_id: 'proj-1',
+    shared_prompt_prefix: null,
+    slides,
+  } as unknown as Project;
+}
+
+function sseResponse(events: unknown[]) {
+  const encoder = new TextEncoder();
+  const body = new ReadableStream<Uint8Array>({
+    start(controller) {
+      for (const event of events) {
+        controller.enqueue(encoder.encode(`data: ${JSON.stringify(event)}\n\n`));
+      }
+      controller.close();
+    },
+  });
+  return { ok: true, status: 200, body };
+}
+
+const mockFetch = vi.fn();
+
+beforeEach(() => {
+  vi.clearAllMocks();
+  mockProject = makeProject([makeSlide(0), makeSlide(1)]);
+  vi.stubGlobal('fetch', mockFetch);
+});
+
+afterEach(() => {
+  vi.unstubAllGlobals();
+});
+
+describe('StageImages', () => {
+  it('posts to the generation stream for the current project', async () => {
+    mockFetch.mockResolvedValue(sseResponse([{ done: true }]));
+    render(<StageImages />);
+    fireEvent.click(screen.getByText('Generate Images'));
+
+    await waitFor(() => expect(mockFetch).toHaveBeenCalledTimes(1));
+    const [url, init] = mockFetch.mock.calls[0];
+    expect(url).toBe('/api/stage-images/generate-stream');
+    expect(init.method).toBe('POST');
+    expect(JSON.parse(init.body)).toEqual({ project_id: 'proj-1' });
+  });
+
+  it('applies each slide image as it arrives, then the saved project', async () => {
+    const saved = makeProject([
+      makeSlide(0, { background_image_url: '/images/a.png' }),
+      makeSlide(1, { background_image_url: '/images/b.png' }),
+    ]);
+    mockFetch.mockResolvedValue(
+      sseResponse([
+        { index: 1, background_image_url: '/images/b.png' },
+        { index: 0, background_image_url: '/images/a.png' },
+        { project: saved },
+        { done: true },
+      ]),
+    );
+    render(<StageImages />);
+    fireEvent.click(screen.getByText('Generate Images'));
+
+    await waitFor(() => expect(mockUpdateProject).toHaveBeenCalledTimes(3));
+    const [first] = mockUpdateProject.mock.calls[0];
+    expect(first.slides.map((s: Slide) => s.background_image_url)).toEqual([null, '/images/b.png']);
+    const [second] = mockUpdateProject.mock.calls[1];
+    expect(second.slides.map((s: Slide) => s.background_image_url)).toEqual([
+      '/images/a.png',
+      '/images/b.png',
+    ]);
+    expect(mockUpdateProject.mock.calls[2][0]).toBe(saved);
+    expect(mockSetError).toHaveBeenCalledTimes(1);
+    expect(mockSetError).toHaveBeenCalledWith(null);
+  });
+
+  it('reports slides whose image failed', async () => {
+    mockFetch.mockResolvedValue(
+      sseResponse([
+        { index: 1, error: 'blocked' },
+        { index: 0, background_image_url: '/images/a.png' },
+        { project: mockProject },
+        { done: true },
+      ]),
+    );
+    render(<StageImages />);
+    fireEvent.click(screen.getByText('Generate Images'));
+
+    await waitFor(() =>
+      expect(mockSetError).toHaveBeenCalledWith('Failed to generate images for slide(s) 2'),
+    );
+  });
+
+  it('surfaces the backend detail when the stream is refused', async () => {
+    mockFetch.mockResolvedValue({
+      ok: false,
+      status: 429,
+      body: null,
+      json: async () => ({ detail: 'A generation is already running. Wait for it to finish.' }),
+    });
+    render(<StageImages />);
+    fireEvent.click(screen.getByText('Generate Images'));
+
+    await waitFor(() =>
+      expect(mockSetError).toHaveBeenCalledWith(
+        'Failed to generate images: A generation is already running. Wait for it to finish.',
+      ),
+    );
+    expect(mockUpdateProject).not.toHaveBeenCalled();
+  });
+});
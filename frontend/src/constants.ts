@@ -27,5 +27,4 @@ export const WORDS_PER_SLIDE_OPTIONS = [
   { value: 'long', label: 'Long (100–200 words)' },
 ];
 
-export const POLL_INTERVAL_MS = 2000;
 export const TEXT_DEBOUNCE_MS = 1000;
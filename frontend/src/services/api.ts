@@ -215,10 +215,8 @@ export const updatePrompt = async (
 };
 
 // Stage Images APIs
-export const generateImages = async (projectId: string): Promise<Project> => {
-  const response = await api.post('/stage-images/generate', { project_id: projectId });
-  return response.data.project;
-};
+// "Generate all" streams per-slide progress; consumed with fetch in StageImages.
+export const getImagesStreamUrl = (): string => '/api/stage-images/generate-stream';
 
 export const regenerateImage = async (
   projectId: string,
@@ -101,6 +101,13 @@ export interface ProjectCard {
   updated_at: string;
 }
 
+// Events from POST /api/stage-images/generate-stream, in completion order
+export type ImageStreamEvent =
+  | { index: number; background_image_url: string }
+  | { index: number; error: string }
+  | { project: Project }
+  | { done: true };
+
 export interface StageInstructionsConfig {
   stage1: string | null;
   stage_style: string | null;
@@ -1,5 +1,5 @@
 import { describe, it, expect, vi } from 'vitest';
-import { parseSSELine, SSE_DATA_PREFIX } from '../sse';
+import { parseSSELine, readSSEStream, SSE_DATA_PREFIX } from '../sse';
 
 describe('SSE_DATA_PREFIX', () => {
   it('is "data: "', () => {
@@ -38,3 +38,36 @@ describe('parseSSELine', () => {
     expect(parseSSELine('data: 42')).toBe(42);
   });
 });
+
+function streamOf(chunks: string[]): ReadableStream<Uint8Array> {
+  const encoder = new TextEncoder();
+  return new ReadableStream({
+    start(controller) {
+      for (const chunk of chunks) controller.enqueue(encoder.encode(chunk));
+      controller.close();
+    },
+  });
+}
+
+describe('readSSEStream', () => {
+  it('calls onEvent for every frame in order', async () => {
+    const events: unknown[] = [];
+    await readSSEStream(streamOf(['data: {"a":1}\n\ndata: {"b":2}\n\n']), (e) => events.push(e));
+    expect(events).toEqual([{ a: 1 }, { b: 2 }]);
+  });
+
+  it('reassembles frames split across chunks', async () => {
+    const events: unknown[] = [];
+    await readSSEStream(
+      streamOf(['data: {"index"', ':0}\n', '\ndata: {"done":true}\n\n']),
+      (e) => events.push(e),
+    );
+    expect(events).toEqual([{ index: 0 }, { done: true }]);
+  });
+
+  it('skips frames that are not data lines', async () => {
+    const events: unknown[] = [];
+    await readSSEStream(streamOf([': heartbeat\n\ndata: 1\n\n']), (e) => events.push(e));
+    expect(events).toEqual([1]);
+  });
+});
@@ -1,9 +1,9 @@
 /**
  * Shared utilities for parsing Server-Sent Events (SSE) streams.
  *
- * Both {@link useStreamingText} and {@link useMatrixStream} consume SSE
- * responses from the backend.  This module centralises the line-prefix
- * constant and the per-line parse helper so the two hooks stay in sync.
+ * {@link useStreamingText}, {@link useMatrixStream} and the image stage consume
+ * SSE responses from the backend.  This module centralises the line-prefix
+ * constant and the parse helpers so the consumers stay in sync.
  */
 
 /** Standard SSE line prefix for data events. */
@@ -28,3 +28,34 @@ export function parseSSELine<T>(line: string): T | null {
     return null;
   }
 }
+
+/**
+ * Read an SSE response body to the end, calling `onEvent` for every parsed
+ * `data:` frame.  Frames are separated by a blank line and may be split
+ * across network chunks.
+ *
+ * @param body - The `ReadableStream` of a `fetch` response.
+ * @param onEvent - Called once per successfully parsed frame, in order.
+ */
+export async function readSSEStream<T>(
+  body: ReadableStream<Uint8Array>,
+  onEvent: (event: T) => void,
+): Promise<void> {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    const frames = buffer.split('\n\n');
+    buffer = frames.pop() ?? '';
+
+    for (const frame of frames) {
+      const event = parseSSELine<T>(frame.trim());
+      if (event !== null) onEvent(event);
+    }
+  }
+}
@@ -16,6 +16,8 @@ export default defineConfig({
       '/api': {
         target: process.env.VITE_API_TARGET || 'http://localhost:8000',
         changeOrigin: true,
+        // Send X-Forwarded-For so per-client limits see the browser, not the proxy
+        xfwd: true,
         configure: (proxy) => {
           // Disable buffering for SSE streams
           proxy.on('proxyRes', (proxyRes) => {